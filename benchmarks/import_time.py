@@ -0,0 +1,53 @@
+"""
+Measures the time a fresh interpreter takes to import the DataSourceFactory and to
+create a data source, and fails if the import exceeds the startup budget.
+
+Usage:
+    python -m benchmarks.import_time [--repeat 10] [--budget-ms 150]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+STAGES = {
+    "python": "pass",
+    "import factory": "from fin_ds.data_source_factory import DataSourceFactory",
+    "create YFinance": "from fin_ds.data_source_factory import DataSourceFactory; DataSourceFactory('YFinance')",
+}
+
+
+def time_interpreter(code: str, repeat: int) -> float:
+    """Return the median wall time in milliseconds of running code in a fresh interpreter."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--budget-ms", type=float, default=150, help="Maximum import time on top of a bare interpreter."
+    )
+    args = parser.parse_args(argv)
+
+    timings = {stage: time_interpreter(code, args.repeat) for stage, code in STAGES.items()}
+    baseline = timings["python"]
+    for stage, timing in timings.items():
+        print(f"{stage:<16} {timing:8.1f} ms  (+{timing - baseline:.1f} ms)")
+
+    import_time = timings["import factory"] - baseline
+    if import_time > args.budget_ms:
+        print(f"Importing the factory took {import_time:.1f} ms, over the {args.budget_ms:.0f} ms budget.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Measures the peak memory and run time of BaseDataSource._preprocess_data on a long
+NasdaqDataLink-style history, compared with the previous multi-copy implementation.
+
+Usage:
+    python -m benchmarks.preprocess_memory [--rows 15000] [--repeat 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from fin_ds.data_sources.nasdaqdatalink import NasdaqDataLinkDataSource
+
+
+def make_source_frame(rows: int) -> pd.DataFrame:
+    """Build a raw source frame shaped like a NasdaqDataLink response."""
+    rng = np.random.default_rng(0)
+    index = pd.bdate_range(end="2024-12-31", periods=rows)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    data = {"ticker": "AAPL"}
+    for column in NasdaqDataLinkDataSource.COLUMN_ORDER[1:]:
+        data[column] = prices
+    data["volume"] = rng.integers(1_000, 1_000_000, rows)
+    data["adj_volume"] = data["volume"]
+    data["dividend"] = np.zeros(rows)
+    data["split"] = np.ones(rows)
+    df = pd.DataFrame(data, index=pd.DatetimeIndex(index, name="date"))
+    # NasdaqDataLink returns the newest rows first
+    return df.iloc[::-1]
+
+
+def legacy_preprocess(data_source, ticker: str, df: pd.DataFrame) -> pd.DataFrame:
+    """The implementation before the single-pass standardization."""
+    df = df.rename(columns=data_source.COLUMN_MAPPINGS)
+    if "ticker" not in df.columns:
+        df["ticker"] = ticker
+    df = df[data_source.COLUMN_ORDER]
+    df.index.name = "date"
+    df.index = pd.to_datetime(df.index).tz_localize(None)
+    df = df.sort_values(by="date")
+    # get_eod_data converted the index a second time
+    df.index = pd.to_datetime(df.index)
+    return df
+
+
+def measure(fn, source_df: pd.DataFrame, repeat: int) -> tuple:
+    """Return the best run time and the peak memory allocated by fn."""
+    best = float("inf")
+    peak = 0
+    for _ in range(repeat):
+        df = source_df.copy()
+        tracemalloc.start()
+        start = time.perf_counter()
+        fn(df)
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return best, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=15_000, help="Number of business days (default: 15000).")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs (default: 5).")
+    args = parser.parse_args(argv)
+
+    data_source = NasdaqDataLinkDataSource("NasdaqDataLink", None)
+    source_df = make_source_frame(args.rows)
+    input_bytes = source_df.memory_usage(deep=True).sum()
+    print(f"{args.rows:,} rows, {input_bytes / 2**20:.1f} MiB input")
+
+    for order, df in [("newest first", source_df), ("oldest first", source_df.iloc[::-1])]:
+        results = {
+            "legacy": measure(lambda df: legacy_preprocess(data_source, "AAPL", df), df, args.repeat),
+            "single-pass": measure(lambda df: data_source._preprocess_data("AAPL", df), df, args.repeat),
+        }
+        print(f"Input sorted {order}:")
+        for name, (seconds, peak) in results.items():
+            print(
+                f"{name:>12}: {seconds * 1000:8.1f} ms  peak {peak / 2**20:8.1f} MiB "
+                f"({peak / input_bytes:.1f}x input)"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Records the upstream responses of a data source into an archive, or times the whole
+get_eod_data path against the recorded responses without a network.
+
+Usage:
+    python -m benchmarks.replay ARCHIVE --record --source Tiingo --tickers AAPL MSFT
+    python -m benchmarks.replay ARCHIVE --source Tiingo --tickers AAPL MSFT [--latency 1.0]
+                                [--repeat 5] [--async]
+
+Every run starts with an empty cache in a temporary directory, so each get_eod_data
+call fetches, parses, preprocesses and caches the recorded responses.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from fin_ds.data_source_factory import DataSourceFactory
+from fin_ds.utils.replay import ResponseArchive
+
+
+def fetch_all(data_source, tickers: list, use_async: bool):
+    if use_async:
+        return asyncio.run(data_source.aget_eod_data_many(tickers, max_cache_age_in_hours=0))
+    return data_source.get_eod_data_many(tickers, max_cache_age_in_hours=0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("archive", type=Path, help="The archive file.")
+    parser.add_argument("--source", default="YFinance", help="The data source (default: YFinance).")
+    parser.add_argument("--tickers", nargs="+", required=True)
+    parser.add_argument("--record", action="store_true", help="Record the archive from the vendor.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fraction of the recorded latency to replay.")
+    parser.add_argument("--repeat", type=int, default=5, help="Replayed runs (default: 5).")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Use aget_eod_data_many.")
+    args = parser.parse_args(argv)
+    archive_path = args.archive.resolve()
+
+    if not args.record:
+        # Replays need no API key, but the factory asks for one
+        os.environ.setdefault(f"{args.source.replace(' ', '').upper()}_API_KEY", "replay")
+
+    cwd = os.getcwd()
+    timings = []
+    for run in range(1 if args.record else args.repeat):
+        with tempfile.TemporaryDirectory() as cache_root:
+            # The cache directory is relative to the working directory
+            os.chdir(cache_root)
+            try:
+                data_source = DataSourceFactory(args.source)
+                if args.record:
+                    with ResponseArchive.record(archive_path) as archive:
+                        result = fetch_all(data_source, args.tickers, args.use_async)
+                    print(f"Recorded {len(archive.keys())} requests to {archive_path}")
+                else:
+                    with ResponseArchive.replay(archive_path, latency=args.latency):
+                        start = time.perf_counter()
+                        result = fetch_all(data_source, args.tickers, args.use_async)
+                        timings.append(time.perf_counter() - start)
+            finally:
+                os.chdir(cwd)
+
+        for ticker, error in result.errors.items():
+            print(f"{ticker}: {error!r}")
+
+    if timings:
+        rows = sum(len(df) for df in result.values())
+        median = statistics.median(timings)
+        print(
+            f"{len(result)} tickers, {rows} rows: median {median * 1000:.1f} ms, "
+            f"best {min(timings) * 1000:.1f} ms over {len(timings)} runs"
+        )
+    return 1 if result.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""
+Measures the throughput and peak memory of the cache, preprocessing, merge, splice and
+aggregation hot paths on histories of the Synthetic data source, and compares them with
+a baseline.
+
+Usage:
+    python -m benchmarks.suite [--years 1 10 70] [--tickers 1 100 1000 10000]
+                               [--max-rows 2600000] [--repeat 5] [--max-seconds 2]
+                               [--cases preprocess aggregate ...] [--formats csv parquet]
+                               [--save [PATH]] [--compare [PATH]] [--tolerance 0.25]
+
+Every history length is run with every universe size, except universes with more than
+--max-rows rows in total. Large universes show the per-ticker overhead, e.g. of opening
+a cache file, that a few long histories hide.
+
+Runs offline in a temporary cache directory. --save writes the results as a baseline,
+--compare exits with an error if a case got slower or uses more memory than the
+baseline allows. Both default to benchmarks/baselines/default.json.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fin_ds.data_sources.base_data_source import BaseDataSource
+from fin_ds.data_sources.synthetic import SyntheticDataSource
+from fin_ds.utils.aggregation_util import AggregationUtil
+from fin_ds.utils.cache_util import CacheUtil
+from fin_ds.utils.df_util import DFUtil
+from fin_ds.utils.memory_cache import MemoryCache
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "default.json"
+
+# Differences below these are noise, whatever the ratio
+NOISE_FLOOR_SECONDS = 0.002
+NOISE_FLOOR_MIB = 1.0
+
+# Every history ends on the same day, so results don't change from day to day
+END_DATE = "2024-12-31"
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+class BenchDataSource(BaseDataSource):
+    """Data source in the synthetic schema that never goes upstream."""
+
+    api_key_required = False
+
+    COLUMN_MAPPINGS = {}
+
+    COLUMN_ORDER = SyntheticDataSource.COLUMN_ORDER
+
+    def __init__(self, name="Bench", api_key=None):
+        super().__init__(name)
+
+    def _fetch_data_from_source(self, ticker, start_date=None):
+        raise RuntimeError("Benchmarks run offline.")
+
+
+def make_universe(tickers: int, years) -> dict:
+    """
+    Generate the histories of a universe with the Synthetic data source, each with the
+    last years of trading days through END_DATE.
+
+    Returns:
+        dict: The histories keyed by ticker.
+    """
+    data_source = SyntheticDataSource("Synthetic", None)
+    data_source.end_date = END_DATE
+    # Tickers list up to MAX_LISTING_OFFSET days after FIRST_DATE. Start early enough
+    # for even the last listed ticker to trade for the whole period.
+    offset_years = math.ceil(years + data_source.MAX_LISTING_OFFSET / TRADING_DAYS_PER_YEAR) + 1
+    data_source.FIRST_DATE = (pd.Timestamp(END_DATE) - pd.DateOffset(years=offset_years)).strftime("%Y-%m-%d")
+
+    rows = max(int(years * TRADING_DAYS_PER_YEAR), 1)
+    return {ticker: data_source._generate(ticker).iloc[-rows:] for ticker in SyntheticDataSource.universe(tickers)}
+
+
+def cache_save_case(histories: dict, cache_format: str):
+    paths = {ticker: CacheUtil.cache_path("Bench", ticker, cache_format=cache_format) for ticker in histories}
+
+    def run(_):
+        for ticker, df in histories.items():
+            CacheUtil.save_to_cache(paths[ticker], df, cache_format)
+
+    return None, run
+
+
+def cache_load_case(histories: dict, cache_format: str, warm: bool):
+    data_source = BenchDataSource()
+    data_source.cache_format = cache_format
+    paths = {ticker: CacheUtil.cache_path("Bench", ticker, cache_format=cache_format) for ticker in histories}
+    for ticker, df in histories.items():
+        CacheUtil.save_to_cache(paths[ticker], df, cache_format)
+
+    if warm:
+        data_source.memory_cache = MemoryCache(max_bytes=2**40)
+
+    def run(_):
+        for ticker in histories:
+            fresh_df, _ = data_source._check_cache(ticker, paths[ticker], 10**6, load_stale=False)
+            assert fresh_df is not None
+
+    if warm:
+        # Fill the memory cache before measuring
+        run(None)
+    return None, run
+
+
+def preprocess_case(histories: dict):
+    data_source = BenchDataSource()
+    # Sources such as NasdaqDataLink return the newest rows first
+    raw = {ticker: df.iloc[::-1] for ticker, df in histories.items()}
+
+    def run(_):
+        for ticker, df in raw.items():
+            data_source._preprocess_data(ticker, df)
+
+    return None, run
+
+
+def merge_case(histories: dict):
+    # An incremental update: the last cached bar and five new ones
+    def setup():
+        return [(df.iloc[:-5].copy(), df.iloc[-6:]) for df in histories.values()]
+
+    def run(pairs):
+        for cached_df, new_df in pairs:
+            DFUtil.merge(cached_df, new_df)
+
+    return setup, run
+
+
+def splice_case(histories: dict):
+    # The second half of each history is spliced onto a backfill at half the price
+    pairs = []
+    for df in histories.values():
+        backfill_df = df.copy()
+        backfill_df[DFUtil.PRICE_COLUMNS] *= 0.5
+        pairs.append((df.iloc[len(df) // 2 :], backfill_df))
+
+    def run(_):
+        for original_df, backfill_df in pairs:
+            DFUtil.splice_chain(original_df, [backfill_df])
+
+    return None, run
+
+
+def aggregate_case(histories: dict, interval: str):
+    def run(_):
+        for df in histories.values():
+            AggregationUtil.aggregate(df, interval)
+
+    return None, run
+
+
+def build_cases(histories: dict, cases: list, formats: list) -> dict:
+    """Return the setup and run functions of the selected cases, keyed by case name."""
+    builders = {}
+    if "cache" in cases:
+        for cache_format in formats:
+            builders[f"cache_save[{cache_format}]"] = lambda f=cache_format: cache_save_case(histories, f)
+            builders[f"cache_load_cold[{cache_format}]"] = lambda f=cache_format: cache_load_case(histories, f, False)
+            builders[f"cache_load_warm[{cache_format}]"] = lambda f=cache_format: cache_load_case(histories, f, True)
+    if "preprocess" in cases:
+        builders["preprocess"] = lambda: preprocess_case(histories)
+    if "merge" in cases:
+        builders["merge"] = lambda: merge_case(histories)
+    if "splice" in cases:
+        builders["splice"] = lambda: splice_case(histories)
+    if "aggregate" in cases:
+        for interval in ("weekly", "monthly"):
+            builders[f"aggregate[{interval}]"] = lambda i=interval: aggregate_case(histories, i)
+    return builders
+
+
+def measure(setup, run, repeat: int, max_seconds: float) -> tuple:
+    """
+    Return the best run time in seconds and the peak memory of one traced run in bytes.
+    Timed runs stop early once they took max_seconds in total, after at least one.
+    """
+    # The untimed, traced run also fills the lazily built caches, e.g. of pandas offsets
+    state = setup() if setup else None
+    tracemalloc.start()
+    try:
+        run(state)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    best = float("inf")
+    total = 0.0
+    for _ in range(repeat):
+        state = setup() if setup else None
+        # Like timeit, keep garbage collection out of the timed runs
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(state)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed)
+        total += elapsed
+        if total >= max_seconds:
+            break
+    return best, peak
+
+
+def run_suite(
+    years_list: list,
+    tickers_list: list,
+    repeat: int,
+    cases: list,
+    formats: list,
+    max_rows: int = None,
+    max_seconds: float = float("inf"),
+) -> dict:
+    results = {}
+    for years in years_list:
+        for tickers in tickers_list:
+            if max_rows is not None and tickers * years * TRADING_DAYS_PER_YEAR > max_rows:
+                print(f"Skipping {years}y/{tickers}t, which is over {max_rows} rows")
+                continue
+            results.update(run_universe(years, tickers, repeat, cases, formats, max_seconds))
+    return results
+
+
+def run_universe(years, tickers: int, repeat: int, cases: list, formats: list, max_seconds: float) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as cache_root:
+        # The cache directory is relative to the working directory, and every universe
+        # starts with an empty one
+        cwd = os.getcwd()
+        os.chdir(cache_root)
+        try:
+            histories = make_universe(tickers, years)
+            rows = sum(len(df) for df in histories.values())
+            for name, build in build_cases(histories, cases, formats).items():
+                setup, run = build()
+                seconds, peak = measure(setup, run, repeat, max_seconds)
+                key = f"{name}/{years}y/{tickers}t"
+                results[key] = {
+                    "seconds": seconds,
+                    "rows_per_second": rows / seconds if seconds else float("inf"),
+                    "peak_mib": peak / 2**20,
+                }
+                print(
+                    f"{key:<40} {seconds * 1000:10.1f} ms {rows / seconds / 1e6:9.2f} M rows/s "
+                    f"{peak / 2**20:9.1f} MiB peak",
+                    flush=True,
+                )
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Print the change of each case against the baseline.
+
+    Returns:
+        list: The keys of the cases that are slower or use more memory than the tolerance allows.
+    """
+    regressions = []
+    print(f"\n{'case':<40} {'time':>8} {'memory':>8}")
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<40} {'new':>8}")
+            continue
+
+        time_ratio = result["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        memory_ratio = result["peak_mib"] / base["peak_mib"] if base["peak_mib"] else 1.0
+        slower = time_ratio > 1 + tolerance and result["seconds"] - base["seconds"] > NOISE_FLOOR_SECONDS
+        larger = memory_ratio > 1 + tolerance and result["peak_mib"] - base["peak_mib"] > NOISE_FLOOR_MIB
+        flag = "  REGRESSION" if slower or larger else ""
+        print(f"{key:<40} {time_ratio:7.2f}x {memory_ratio:7.2f}x{flag}")
+        if flag:
+            regressions.append(key)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=float, nargs="+", default=[1, 10, 70], help="History lengths in years.")
+    parser.add_argument(
+        "--tickers", type=int, nargs="+", default=[1, 100, 1000, 10000], help="Universe sizes in tickers."
+    )
+    parser.add_argument(
+        "--max-rows",
+        type=int,
+        default=2_600_000,
+        help="Skip universes with more rows in total (default: 2600000, i.e. 10000 tickers of 1 year).",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (default: 5).")
+    parser.add_argument(
+        "--max-seconds", type=float, default=2.0, help="Stop timing a case after this long (default: 2)."
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        default=["cache", "preprocess", "merge", "splice", "aggregate"],
+        choices=["cache", "preprocess", "merge", "splice", "aggregate"],
+    )
+    parser.add_argument("--formats", nargs="+", default=["csv", "parquet", "feather"], help="Cache formats.")
+    parser.add_argument("--save", nargs="?", const=DEFAULT_BASELINE, type=Path, help="Write the results as a baseline.")
+    parser.add_argument("--compare", nargs="?", const=DEFAULT_BASELINE, type=Path, help="Compare with a baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown (default: 0.25).")
+    args = parser.parse_args(argv)
+    years_list = [int(years) if float(years).is_integer() else years for years in args.years]
+
+    results = run_suite(
+        years_list, args.tickers, args.repeat, args.cases, args.formats, args.max_rows, args.max_seconds
+    )
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        metadata = {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        }
+        args.save.write_text(json.dumps({"metadata": metadata, "results": results}, indent=2) + "\n")
+        print(f"Baseline written to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regressions over the {args.tolerance:.0%} tolerance.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
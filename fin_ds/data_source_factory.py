@@ -1,25 +1,22 @@
 import importlib
-import importlib.util
 import logging
-import pkgutil
-from pathlib import Path
 
-from decouple import config
-
-from fin_ds.data_sources.base_data_source import BaseDataSource
-
-# module-level (or global-level) variables/constants
-logging.basicConfig(level=logging.ERROR, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
-# List of data sources to register
-DATA_SOURCES_TO_REGISTER = [
-    "alphavantage",
-    "eodhd",
-    "nasdaqdatalink",
-    "tiingo",
-    "yfinance",
-]
+# Built-in data sources and the modules that register them. A module is only
+# imported when its data source is first requested.
+DATA_SOURCES = {
+    "AlphaVantage": "fin_ds.data_sources.alphavantage",
+    "EODHD": "fin_ds.data_sources.eodhd",
+    "NasdaqDataLink": "fin_ds.data_sources.nasdaqdatalink",
+    "Synthetic": "fin_ds.data_sources.synthetic",
+    "Tiingo": "fin_ds.data_sources.tiingo",
+    "YFinance": "fin_ds.data_sources.yfinance",
+}
+
+# Entry point group under which third-party packages publish data sources, e.g.
+# [project.entry-points."fin_ds.data_sources"] MySource = "my_package.module:MySourceDataSource"
+ENTRY_POINT_GROUP = "fin_ds.data_sources"
 
 
 class DataSourceFactory:
@@ -28,50 +25,135 @@ class DataSourceFactory:
     _data_sources = {}
 
     @classmethod
-    def _register_data_sources(cls):
+    def _entry_points(cls) -> dict:
         """
-        Imports data source modules to trigger self-registration.
+        Returns the data source entry points of the installed packages, keyed by name.
         """
-        for module_name in DATA_SOURCES_TO_REGISTER:
-            __import__(f"fin_ds.data_sources.{module_name}")
+        from importlib import metadata
+
+        return {entry_point.name: entry_point for entry_point in metadata.entry_points(group=ENTRY_POINT_GROUP)}
 
     @classmethod
-    def get_data_source_names(cls):
+    def _load_data_source(cls, data_source_name):
         """
-        Ensures data sources are loaded and returns their names.
+        Imports the module of a data source on first use, which registers its class.
+
+        Returns:
+            type: The data source class, or None if no data source has that name.
         """
-        if not cls._data_sources:
-            cls._register_data_sources()
-        return list(cls._data_sources.keys())
+        data_source_class = cls._data_sources.get(data_source_name)
+        if data_source_class is not None:
+            return data_source_class
 
-    def __new__(cls, data_source_name="YFinance"):
+        module_name = DATA_SOURCES.get(data_source_name)
+        if module_name is not None:
+            importlib.import_module(module_name)
+            return cls._data_sources.get(data_source_name)
+
+        entry_point = cls._entry_points().get(data_source_name)
+        if entry_point is not None:
+            data_source_class = entry_point.load()
+            # Plugins do not have to register themselves, and may use another name
+            cls._data_sources[data_source_name] = data_source_class
+            return data_source_class
+
+        return None
+
+    @classmethod
+    def get_data_source_names(cls):
+        """
+        Returns the names of the built-in, installed and registered data sources
+        without importing any of them.
+        """
+        names = [*DATA_SOURCES, *cls._entry_points(), *cls._data_sources]
+        return list(dict.fromkeys(names))
+
+    def __new__(
+        cls,
+        data_source_name="YFinance",
+        cache_format=None,
+        incremental=None,
+        memory_cache_bytes=None,
+        use_manifest=None,
+        materialize_aggregates=None,
+        compact=None,
+        tracer=None,
+    ):
         """
         Create a new instance of a data source class based on the given data source name.
 
         Args:
             data_source_name (str): The name of the data source.
-            force_refresh (bool, optional): Whether to force a data refresh. Defaults to False.
+            cache_format (str, optional): The cache storage format for this instance
+                                          ('csv', 'parquet' or 'feather'). Defaults to the
+                                          data source's cache_format ('csv').
+            incremental (bool, optional): Whether stale cache entries are updated with only
+                                          the bars after the last cached date. Only used by
+                                          data sources that support a start date.
+            memory_cache_bytes (int, optional): Enables the process-wide in-memory cache of
+                                                parsed DataFrames with this byte budget.
+                                                Defaults to None (disabled).
+            use_manifest (bool, optional): Whether cache lookups use the cache directory's
+                                           SQLite manifest instead of checking each file.
+            materialize_aggregates (bool, optional): Whether aggregated intervals are cached
+                                                     and reused until the daily data changes.
+            compact (bool, optional): Whether data is kept in compact dtypes (float32 prices,
+                                      integer volumes, categorical tickers) to save memory.
+            tracer (Tracer, optional): Receives spans for each request and stage, e.g. a
+                                       CollectingTracer, OpenTelemetryTracer or ProfilingTracer
+                                       from fin_ds.utils.tracing. Defaults to no tracing.
 
         Returns:
             object: An instance of the data source class.
 
         Raises:
-            ValueError: If an invalid data source name is provided.
+            ValueError: If an invalid data source name or cache format is provided.
         """
-        if not cls._data_sources:  # Ensure data sources are loaded
-            cls._register_data_sources()
+        data_source_class = cls._load_data_source(data_source_name)
+        if data_source_class is not None:
+            # Lazy load the modules to keep importing the factory cheap
+            from fin_ds.utils.cache_util import CacheUtil
+            from fin_ds.utils.memory_cache import MemoryCache
+            from fin_ds.utils.rate_limiter import RateLimiter
 
-        # Check if the data source class is already registered
-        if data_source_name in cls._data_sources:
-            data_source_class = cls._data_sources[data_source_name]
             api_key = None
             if data_source_class.api_key_required:
+                from decouple import config
+
                 api_key_name = f"{data_source_name.replace(' ', '').upper()}_API_KEY"
                 api_key = config(api_key_name)
-            return data_source_class(data_source_name, api_key)
+            data_source = data_source_class(data_source_name, api_key)
+
+            if data_source_class.RATE_LIMITS:
+                data_source.rate_limiter = RateLimiter.shared(
+                    data_source_name, api_key, data_source_class.RATE_LIMITS
+                )
+
+            if cache_format is not None:
+                # Validate early so a typo fails here rather than on the first cache write
+                CacheUtil.get_backend(cache_format)
+                data_source.cache_format = cache_format
+
+            if incremental is not None:
+                data_source.incremental = incremental
+
+            if memory_cache_bytes is not None:
+                data_source.memory_cache = MemoryCache.shared(memory_cache_bytes)
+
+            if use_manifest is not None:
+                data_source.use_manifest = use_manifest
+
+            if materialize_aggregates is not None:
+                data_source.materialize_aggregates = materialize_aggregates
+
+            if compact is not None:
+                data_source.compact = compact
+
+            if tracer is not None:
+                data_source.tracer = tracer
+
+            return data_source
 
-        # Fallback to the original dynamic import logic if not found in registered sources
-        # This part might need adjustment or removal depending on whether you still want to support dynamic loading
         raise ValueError(f"Data source '{data_source_name}' not registered.")
 
     @classmethod
@@ -83,13 +165,11 @@ class DataSourceFactory:
             name (str): The name of the data source to register.
             data_source_class (type): The class of the data source to register.
         """
+        from fin_ds.data_sources.base_data_source import BaseDataSource
+
         if not issubclass(data_source_class, BaseDataSource):
             raise ValueError(f"Data source class must subclass BaseDataSource")
 
-        # Ensure built-in data sources are loaded
-        if not cls._data_sources:
-            cls._register_data_sources()
-
         # Automatically parse the class name, removing 'DataSource' suffix if present
         class_name = data_source_class.__name__.removesuffix("DataSource")
 
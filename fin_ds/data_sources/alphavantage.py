@@ -2,9 +2,20 @@ import pandas as pd
 
 from fin_ds.data_source_factory import DataSourceFactory
 from fin_ds.data_sources.base_data_source import BaseDataSource
+from fin_ds.utils.http_util import HttpUtil
 
 
 class AlphaVantageDataSource(BaseDataSource):
+    # The free tier only allows a handful of requests per minute
+    max_concurrency = 1
+
+    # Free tier quotas
+    RATE_LIMITS = {"minute": 5, "day": 25}
+
+    # aget_eod_data calls the REST API directly over aiohttp
+    async_http = True
+
+    QUERY_URL = "https://www.alphavantage.co/query"
 
     COLUMN_MAPPINGS = {
         "1. open": "open",
@@ -31,17 +42,44 @@ class AlphaVantageDataSource(BaseDataSource):
         # Call the base class __init__
         super().__init__(name)
 
-        # Lazy load the library to avoid importing it if not needed
-        from alpha_vantage.timeseries import TimeSeries
-
-        self.api_client = TimeSeries(key=api_key, output_format="pandas")
+        self.api_key = api_key
 
     def _fetch_data_from_source(self, ticker) -> pd.DataFrame:
-        # The get_daily_adjusted method is a PRO feature and requires paying for the API.
-        # For now, we'll use the get_monthly_adjusted method, which is free.
-        df = self.api_client.get_monthly_adjusted(ticker)[0]
+        # The daily adjusted series is a PRO feature and requires paying for the API.
+        # For now, we'll use the monthly adjusted series, which is free.
+        data = HttpUtil.get_json(self.QUERY_URL, params=self._query_params(ticker))
 
-        return df
+        return self._to_frame(data)
+
+    async def _afetch_data_from_source(self, ticker, session, start_date=None) -> pd.DataFrame:
+        """
+        Fetch the monthly adjusted time series from the Alpha Vantage REST API over aiohttp.
 
+        Returns the same DataFrame as _fetch_data_from_source: one float column per
+        field, indexed by date.
+        """
+        data = await HttpUtil.aget_json(session, self.QUERY_URL, params=self._query_params(ticker))
+
+        return self._to_frame(data)
+
+    def _query_params(self, ticker) -> dict:
+        return {
+            "function": "TIME_SERIES_MONTHLY_ADJUSTED",
+            "symbol": ticker,
+            "apikey": self.api_key,
+        }
+
+    @staticmethod
+    def _to_frame(data) -> pd.DataFrame:
+        # Alpha Vantage reports errors and rate limiting in the body of a 200 response
+        time_series = data.get("Monthly Adjusted Time Series")
+        if time_series is None:
+            raise ValueError(data.get("Error Message") or data.get("Note") or data.get("Information") or data)
+
+        df = pd.DataFrame.from_dict(time_series, orient="index", dtype="float64")
+        df.index = pd.to_datetime(df.index)
+        df.index.name = "date"
+
+        return df
 
 DataSourceFactory.register_data_source(AlphaVantageDataSource)
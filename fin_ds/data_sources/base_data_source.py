@@ -1,14 +1,52 @@
+import asyncio
+import contextlib
+import hashlib
 import logging
+import threading
+import time
+import weakref
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
 
+from fin_ds.utils.aggregation_util import AggregationUtil
+from fin_ds.utils.cache_manifest import CacheManifest
 from fin_ds.utils.cache_util import CacheUtil
 from fin_ds.utils.df_util import DFUtil
+from fin_ds.utils.file_lock import FileLock
+from fin_ds.utils.http_util import HttpUtil
+from fin_ds.utils.metrics import MetricsRegistry
+from fin_ds.utils.single_flight import SingleFlight
+from fin_ds.utils.tracing import Tracer
 
 logger = logging.getLogger(__name__)
 
 
+class BatchResult(dict):
+    """
+    The DataFrames returned by a batch request, keyed by ticker in request order.
+    Tickers that failed are left out and their exceptions are kept in `errors`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.errors = {}
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Concatenate the results into a single DataFrame indexed by (ticker, date).
+        The per-ticker errors are carried in the frame's attrs under 'errors'.
+        """
+        if self:
+            df = pd.concat(self, names=["ticker", "date"])
+        else:
+            df = pd.DataFrame()
+        df.attrs["errors"] = dict(self.errors)
+        return df
+
+
 class BaseDataSource(ABC):
     # If a data source requires an API key, this should be set to True.
     # But if the data source does not require an API key, this should
@@ -18,6 +56,127 @@ class BaseDataSource(ABC):
     start_date = "1950-01-01"
     end_date = pd.Timestamp.today().strftime("%Y-%m-%d")
 
+    # The storage format used for cached data ('csv', 'parquet' or 'feather').
+    # DataSourceFactory can override this per instance.
+    cache_format = CacheUtil.DEFAULT_CACHE_FORMAT
+
+    # Set this to True in subclasses whose _fetch_data_from_source accepts a
+    # start_date keyword so that incremental updates can be pushed down to the API.
+    supports_start_date = False
+
+    # When True, stale cache entries are topped up with only the bars after the
+    # last cached date instead of refetching the full history.
+    # DataSourceFactory can override this per instance.
+    incremental = False
+
+    # The target schema of standardized data. Columns of COLUMN_ORDER listed here are
+    # converted to the given dtype while the frame is built; other columns keep theirs.
+    COLUMN_DTYPES = {
+        "open": "float64",
+        "high": "float64",
+        "low": "float64",
+        "close": "float64",
+        "volume": "float64",
+        "adj_open": "float64",
+        "adj_high": "float64",
+        "adj_low": "float64",
+        "adj_close": "float64",
+        "adj_volume": "float64",
+        "dividend": "float64",
+        "split": "float64",
+    }
+
+    # The target schema in compact mode, which stores a bar in 57 instead of 104 bytes.
+    # float32 keeps about 7 significant digits, so prices are exact to within 6e-8 of
+    # their value (e.g. $0.006 at $100,000). Volumes are rounded to whole shares and
+    # stay 64-bit, as split-adjusted volumes exceed the int32 range. Volumes with missing
+    # values become the nullable Int64 instead. Dividends and splits keep their amounts
+    # as float32 rather than becoming flags.
+    COMPACT_COLUMN_DTYPES = {
+        "ticker": "category",
+        "open": "float32",
+        "high": "float32",
+        "low": "float32",
+        "close": "float32",
+        "volume": "int64",
+        "adj_open": "float32",
+        "adj_high": "float32",
+        "adj_low": "float32",
+        "adj_close": "float32",
+        "adj_volume": "int64",
+        "dividend": "float32",
+        "split": "float32",
+    }
+
+    # When True, data is kept in the COMPACT_COLUMN_DTYPES schema from fetch through the
+    # cache, merges, splices and aggregation. DataSourceFactory can override this per instance.
+    compact = False
+
+    # Relative tolerance used when comparing the overlapping adjusted close of
+    # cached and newly fetched data during an incremental update.
+    ADJ_CLOSE_TOLERANCE = 1e-6
+
+    # The default number of worker threads used by get_eod_data_many.
+    max_workers = 8
+
+    # The maximum number of concurrent requests to the upstream API. This is shared
+    # by every instance of the data source class, so cache hits are never held up
+    # by it, but parallel fetches never exceed what the vendor allows.
+    max_concurrency = 4
+
+    # Class variable for the per data source class upstream request semaphores
+    _concurrency_semaphores = {}
+    _concurrency_semaphores_lock = threading.Lock()
+
+    # Class variable for the asyncio semaphores, which are bound to an event loop
+    _async_concurrency_semaphores = weakref.WeakKeyDictionary()
+
+    # The vendor's request quotas, as a dict of period ('second', 'minute', 'hour' or
+    # 'day') to number of requests. DataSourceFactory attaches a RateLimiter that is
+    # shared by every instance created for the same data source and API key.
+    RATE_LIMITS = {}
+
+    rate_limiter = None
+
+    # Optional in-process LRU cache of parsed DataFrames above the disk cache.
+    # DataSourceFactory attaches the shared MemoryCache when memory_cache_bytes is given.
+    memory_cache = None
+
+    # When True, cache lookups and staleness checks use the cache directory's SQLite
+    # manifest instead of checking each cache file on disk.
+    # DataSourceFactory can override this per instance.
+    use_manifest = False
+
+    # When True, aggregated intervals are cached as derived files next to the daily cache
+    # file and only recomputed when the daily data they were derived from changes.
+    # DataSourceFactory can override this per instance.
+    materialize_aggregates = False
+
+    # Bump when the aggregation changes so previously materialized files are recomputed
+    MATERIALIZED_VERSION = 1
+
+    # Class variable coalescing concurrent fetches of the same ticker within the process
+    _single_flight = SingleFlight()
+
+    # Set this to True in subclasses that implement _fetch_many_from_source, so that
+    # get_eod_data_many fetches the tickers missing from the cache in batches.
+    supports_batch_fetch = False
+
+    # Set this to True in subclasses that implement _fetch_last_day_from_source, which
+    # returns the last trading day of a whole exchange, so that bulk_daily_update can
+    # append it to every cached ticker with a single request.
+    supports_bulk_daily = False
+
+    # Set this to True in subclasses that override _afetch_data_from_source with an
+    # aiohttp request, so that aget_eod_data provides them with a session.
+    async_http = False
+
+    # Process-wide stage timings and cache counters, labelled by data source name
+    metrics = MetricsRegistry.shared()
+
+    # Receives a span per request and per stage. The default tracer records nothing.
+    tracer = Tracer()
+
     def __init__(self, name):
         """
         Initialize the data source with a specific name.
@@ -31,7 +190,7 @@ class BaseDataSource(ABC):
         self,
         ticker: str,
         interval: str = "daily",
-        backfill_ticker: str = None,
+        backfill_ticker=None,
         max_cache_age_in_hours: int = 12,
     ) -> pd.DataFrame:
         """
@@ -41,35 +200,481 @@ class BaseDataSource(ABC):
             ticker (str): The stock ticker symbol for which to fetch the data.
             interval (str, optional): The interval for data aggregation. Defaults to 'daily'.
                                     Supported values: 'daily', 'weekly', 'monthly'.
-            backfill_ticker (str, optional): The ticker symbol to use for backfilling data. Defaults to None.
+            backfill_ticker (str | list, optional): The ticker symbol to use for backfilling data, or an
+                                                    ordered chain of them. Defaults to None.
+            max_cache_age_in_hours (int, optional): The maximum age of cached data. Defaults to 12.
+
+        Returns:
+            DataFrame: A pandas DataFrame containing the aggregated data.
+        """
+        with self._span("get_eod_data", ticker=ticker, interval=interval) as span:
+            materialize = self._materializes(interval)
+            if materialize:
+                df, versions = self._load_materialized(
+                    ticker, interval, backfill_ticker, max_cache_age_in_hours
+                )
+                if df is not None:
+                    span.set_attribute("materialized", True)
+                    span.set_attribute("rows", len(df))
+                    return df
+
+            original_df = self._fetch_data(ticker, max_cache_age_in_hours)
+
+            combined_df = self._backfill_data(backfill_ticker, max_cache_age_in_hours, original_df)
+
+            aggregated_df = self._finalize_data(combined_df, interval)
+            if materialize:
+                self._save_materialized(ticker, interval, backfill_ticker, versions, aggregated_df)
+            span.set_attribute("rows", len(aggregated_df))
+            return aggregated_df
+
+    async def aget_eod_data(
+        self,
+        ticker: str,
+        interval: str = "daily",
+        backfill_ticker=None,
+        max_cache_age_in_hours: int = 12,
+        session=None,
+    ) -> pd.DataFrame:
+        """
+        Asynchronous counterpart of get_eod_data.
+
+        Cache I/O runs in worker threads so the event loop is never blocked. Data sources
+        with a REST API fetch over aiohttp; the others run their synchronous client in a
+        worker thread.
+
+        Args:
+            ticker (str): The stock ticker symbol for which to fetch the data.
+            interval (str, optional): The interval for data aggregation. Defaults to 'daily'.
+            backfill_ticker (str | list, optional): The ticker symbol to use for backfilling data, or an
+                                                    ordered chain of them. Defaults to None.
             max_cache_age_in_hours (int, optional): The maximum age of cached data. Defaults to 12.
+            session (aiohttp.ClientSession, optional): The HTTP session to use. Defaults to a
+                                                       session created for this call.
 
         Returns:
             DataFrame: A pandas DataFrame containing the aggregated data.
         """
-        original_df = self._fetch_data(ticker, max_cache_age_in_hours)
+        with self._span("aget_eod_data", ticker=ticker, interval=interval) as span:
+            materialize = self._materializes(interval)
+            if materialize:
+                df, versions = await asyncio.to_thread(
+                    self._load_materialized, ticker, interval, backfill_ticker, max_cache_age_in_hours
+                )
+                if df is not None:
+                    span.set_attribute("materialized", True)
+                    span.set_attribute("rows", len(df))
+                    return df
+
+            async with self._aclient_session(session) as session:
+                original_df = await self._afetch_data(ticker, max_cache_age_in_hours, session)
+
+                backfill_dfs = [
+                    await self._afetch_data(backfill, max_cache_age_in_hours, session)
+                    for backfill in self._backfill_chain(backfill_ticker)
+                ]
+                combined_df = original_df
+                if backfill_dfs:
+                    with self._stage("splice", ticker=ticker):
+                        combined_df = DFUtil.splice_chain(original_df, backfill_dfs)
+
+            aggregated_df = self._finalize_data(combined_df, interval)
+            if materialize:
+                await asyncio.to_thread(
+                    self._save_materialized, ticker, interval, backfill_ticker, versions, aggregated_df
+                )
+            span.set_attribute("rows", len(aggregated_df))
+            return aggregated_df
+
+    def get_eod_data_many(
+        self,
+        tickers: list,
+        interval: str = "daily",
+        backfill_ticker=None,
+        max_cache_age_in_hours: int = 12,
+        max_workers: int = None,
+        as_frame: bool = False,
+    ):
+        """
+        Fetch and return the data for several tickers using a pool of worker threads.
+
+        A failure for one ticker does not abort the batch. The exception is logged and
+        recorded in the result's `errors` instead. Data sources that support batch
+        fetches first fetch all tickers missing from the cache with a few batch requests.
+        Unless aggregates are materialized, the daily data of all tickers is aggregated
+        with a single grouped reduction once every ticker has been loaded.
+
+        Args:
+            tickers (list): The stock ticker symbols for which to fetch the data.
+            interval (str, optional): The interval for data aggregation. Defaults to 'daily'.
+            backfill_ticker (str | list, optional): The ticker symbol to use for backfilling each
+                                                    ticker, or an ordered chain of them.
+                                                    Defaults to None.
+            max_cache_age_in_hours (int, optional): The maximum age of cached data. Defaults to 12.
+            max_workers (int, optional): The number of worker threads. Defaults to the data
+                                         source's max_workers. Requests to the upstream API
+                                         are additionally limited to max_concurrency.
+            as_frame (bool, optional): Whether to return a single DataFrame indexed by
+                                       (ticker, date) instead of a dict. Defaults to False.
+
+        Returns:
+            BatchResult | DataFrame: The DataFrames keyed by ticker, or a concatenated
+                                     DataFrame if as_frame is True.
+        """
+        # Drop duplicates but keep the requested order
+        tickers = list(dict.fromkeys(tickers))
+
+        if self.supports_batch_fetch:
+            self._prefetch_many(tickers, backfill_ticker, max_cache_age_in_hours)
+
+        # Materialized aggregates are loaded and stored per ticker
+        aggregate_at_once = not self._materializes(interval)
+
+        result = BatchResult()
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = {
+                ticker: executor.submit(
+                    self.get_eod_data,
+                    ticker,
+                    interval="daily" if aggregate_at_once else interval,
+                    backfill_ticker=backfill_ticker,
+                    max_cache_age_in_hours=max_cache_age_in_hours,
+                )
+                for ticker in tickers
+            }
+
+            for ticker, future in futures.items():
+                try:
+                    result[ticker] = future.result()
+                except Exception as e:
+                    result.errors[ticker] = e
+
+        if aggregate_at_once:
+            result.update(self._finalize_many(dict(result), interval))
+
+        if result.errors:
+            logger.warning(
+                f"Failed to get data for {len(result.errors)} of {len(tickers)} tickers: "
+                f"{', '.join(result.errors)}"
+            )
+
+        return result.to_frame() if as_frame else result
+
+    def bulk_daily_update(self, tickers: list, exchange: str = "US", max_workers: int = None):
+        """
+        Append the last trading day of an exchange to the cache entries of many tickers
+        using a single exchange-wide snapshot instead of one request per ticker.
+
+        Tickers with a split or dividend in the snapshot, tickers whose cached data does
+        not end on the previous business day, and tickers that are not cached yet are
+        fetched individually instead, because the new bar alone cannot update them.
+
+        Args:
+            tickers (list): The stock ticker symbols to update.
+            exchange (str, optional): The exchange of the tickers. Defaults to 'US'.
+            max_workers (int, optional): The number of worker threads writing the cache
+                                         entries. Defaults to the data source's max_workers.
+
+        Returns:
+            BatchResult: The outcome per ticker: 'appended', 'refetched' or 'current' if the
+                         cache already held the snapshot's date. Tickers missing from the
+                         snapshot, and failed updates, are recorded in `errors`.
+
+        Raises:
+            NotImplementedError: If the data source has no exchange-wide endpoint.
+        """
+        if not self.supports_bulk_daily:
+            raise NotImplementedError(f"{self.name} does not support bulk daily updates.")
+
+        # Drop duplicates but keep the requested order
+        tickers = list(dict.fromkeys(tickers))
+        with self._stage("fetch", exchange=exchange, tickers=len(tickers)):
+            snapshot, corporate_actions = self._fetch_last_day_from_source(tickers, exchange)
+        logger.info(
+            f"Snapshot of {exchange} has {len(snapshot)} of {len(tickers)} tickers, "
+            f"{len(corporate_actions)} with corporate actions."
+        )
+
+        result = BatchResult()
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            futures = {
+                ticker: executor.submit(
+                    self._append_last_day, ticker, snapshot[ticker], ticker in corporate_actions
+                )
+                for ticker in tickers
+                if ticker in snapshot
+            }
+
+            for ticker in tickers:
+                if ticker not in futures:
+                    result.errors[ticker] = LookupError(f"{ticker} is not in the {exchange} snapshot.")
+                    continue
+                try:
+                    result[ticker] = futures[ticker].result()
+                except Exception as e:
+                    result.errors[ticker] = e
+
+        if result.errors:
+            logger.warning(
+                f"Failed to update {len(result.errors)} of {len(tickers)} tickers: "
+                f"{', '.join(result.errors)}"
+            )
+
+        return result
+
+    def get_panel(
+        self,
+        tickers: list,
+        fields: list = ("adj_close",),
+        interval: str = "daily",
+        how: str = "union",
+        ffill: bool = False,
+        as_array: bool = False,
+        backfill_ticker=None,
+        max_cache_age_in_hours: int = 12,
+        max_workers: int = None,
+    ):
+        """
+        Fetch several tickers and return them aligned on a shared calendar.
+
+        The tickers are fetched with get_eod_data_many, then copied into one dense
+        date x field x ticker array. Tickers that fail are left out and reported in
+        the DataFrame's attrs under 'errors'.
+
+        Args:
+            tickers (list): The stock ticker symbols for which to fetch the data.
+            fields (list, optional): The columns to include. Defaults to ('adj_close',).
+            interval (str, optional): The interval for data aggregation. Defaults to 'daily'.
+            how (str, optional): 'union' keeps every date of any ticker, 'intersection' only
+                                 the dates shared by all tickers. Defaults to 'union'.
+            ffill (bool, optional): Whether to forward fill missing values. Defaults to False.
+            as_array (bool, optional): Whether to return the NumPy array instead of a DataFrame.
+                                       Defaults to False.
+            backfill_ticker (str | list | dict, optional): The ticker symbol to use for backfilling
+                                                           each ticker, an ordered chain of them, or
+                                                           a dict mapping tickers to either.
+                                                           Defaults to None.
+            max_cache_age_in_hours (int, optional): The maximum age of cached data. Defaults to 12.
+            max_workers (int, optional): The number of worker threads. Defaults to max_workers.
+
+        Returns:
+            DataFrame | tuple: A DataFrame indexed by date with (field, ticker) MultiIndex
+                               columns, so that panel["adj_close"] is the wide close matrix.
+                               If as_array is True, a tuple (values, index, fields, tickers)
+                               where values is shaped (date, field, ticker).
+        """
+        fields = list(fields)
+        # Validate the interval before fetching anything
+        AggregationUtil.resolve_freq(interval)
+
+        # Tickers are aligned and spliced daily and the whole panel is aggregated at once
+        frames = self.get_eod_data_many(
+            tickers,
+            interval="daily",
+            max_cache_age_in_hours=max_cache_age_in_hours,
+            max_workers=max_workers,
+        )
+
+        if isinstance(backfill_ticker, dict):
+            chains = {ticker: self._backfill_chain(backfill_ticker.get(ticker)) for ticker in frames}
+        else:
+            chains = {ticker: self._backfill_chain(backfill_ticker) for ticker in frames}
+
+        backfill_frames = {}
+        if any(chains.values()):
+            backfill_frames = self.get_eod_data_many(
+                [backfill for chain in chains.values() for backfill in chain],
+                interval="daily",
+                max_cache_age_in_hours=max_cache_age_in_hours,
+                max_workers=max_workers,
+            )
+            # A ticker whose backfill failed fails as it would in get_eod_data
+            for ticker, chain in chains.items():
+                failed = [backfill for backfill in chain if backfill in backfill_frames.errors]
+                if failed:
+                    frames.errors[ticker] = backfill_frames.errors[failed[0]]
+                    del frames[ticker]
+
+        all_frames = list(frames.values()) + list(backfill_frames.values())
+        missing = sorted({field for df in all_frames for field in fields if field not in df.columns})
+        if missing:
+            raise ValueError(f"Fields not available from {self.name}: {missing}")
+
+        # Compact panels are float32 unless a field, such as volume, needs more precision
+        column_dtypes = self._column_dtypes()
+        panel_dtype = "float64"
+        if self.compact and all(column_dtypes.get(field) == "float32" for field in fields):
+            panel_dtype = "float32"
+
+        tickers = list(frames)
+        if not backfill_frames:
+            values, index = DFUtil.align_panel(frames, fields, how=how, ffill=ffill, dtype=panel_dtype)
+        else:
+            # Align the tickers and their backfills together, so that each level of the
+            # backfill chains is spliced into all tickers in one vectorized pass
+            values, index = DFUtil.align_panel(dict(enumerate(all_frames)), fields, dtype=panel_dtype)
+            positions = {backfill: len(tickers) + i for i, backfill in enumerate(backfill_frames)}
+            empty = np.full((len(index), len(fields)), np.nan, dtype=panel_dtype)
+
+            depth = max(len(chains[ticker]) for ticker in tickers) if tickers else 0
+            panel = values[:, :, : len(tickers)]
+            for level in range(depth):
+                backfill_values = np.stack(
+                    [
+                        values[:, :, positions[chains[ticker][level]]]
+                        if level < len(chains[ticker])
+                        else empty
+                        for ticker in tickers
+                    ],
+                    axis=2,
+                )
+                with self._stage("splice", level=level, tickers=len(tickers)):
+                    panel = DFUtil.splice_panel(panel, backfill_values, fields)
+            values = np.ascontiguousarray(panel)
+
+            if how == "intersection":
+                values, index = DFUtil.intersect_panel(values, index)
+            elif how != "union":
+                raise ValueError(f"Unsupported alignment: {how}. Supported values are 'union', 'intersection'.")
+            if ffill:
+                values = DFUtil.ffill_panel(values)
+
+        with self._stage("aggregate", interval=interval, tickers=len(tickers)):
+            values, index = AggregationUtil.aggregate_panel(values, index, fields, interval)
+
+        if as_array:
+            return values, index, fields, tickers
+
+        # Reshaping the C-ordered array is a view, so the DataFrame shares its memory
+        columns = pd.MultiIndex.from_product([fields, tickers], names=["field", "ticker"])
+        panel = pd.DataFrame(
+            values.reshape(len(index), len(fields) * len(tickers)),
+            index=index,
+            columns=columns,
+            copy=False,
+        )
+        panel.attrs["errors"] = dict(frames.errors)
+        return panel
+
+    async def aget_eod_data_many(
+        self,
+        tickers: list,
+        interval: str = "daily",
+        backfill_ticker=None,
+        max_cache_age_in_hours: int = 12,
+        as_frame: bool = False,
+    ):
+        """
+        Asynchronous counterpart of get_eod_data_many.
+
+        All tickers share one HTTP session. Requests to the upstream API are limited to
+        max_concurrency per data source class and event loop. As in get_eod_data_many,
+        the daily data of all tickers is aggregated at once.
+
+        Args:
+            tickers (list): The stock ticker symbols for which to fetch the data.
+            interval (str, optional): The interval for data aggregation. Defaults to 'daily'.
+            backfill_ticker (str | list, optional): The ticker symbol to use for backfilling each
+                                                    ticker, or an ordered chain of them.
+                                                    Defaults to None.
+            max_cache_age_in_hours (int, optional): The maximum age of cached data. Defaults to 12.
+            as_frame (bool, optional): Whether to return a single DataFrame indexed by
+                                       (ticker, date) instead of a dict. Defaults to False.
+
+        Returns:
+            BatchResult | DataFrame: The DataFrames keyed by ticker, or a concatenated
+                                     DataFrame if as_frame is True.
+        """
+        # Drop duplicates but keep the requested order
+        tickers = list(dict.fromkeys(tickers))
+
+        if self.supports_batch_fetch:
+            await asyncio.to_thread(
+                self._prefetch_many, tickers, backfill_ticker, max_cache_age_in_hours
+            )
 
-        combined_df = self._backfill_data(backfill_ticker, max_cache_age_in_hours, original_df)
+        # Materialized aggregates are loaded and stored per ticker
+        aggregate_at_once = not self._materializes(interval)
 
-        # Ensure the index is a DatetimeIndex especially after loading from cache
-        combined_df.index = pd.to_datetime(combined_df.index)
+        async with self._aclient_session() as session:
+            outcomes = await asyncio.gather(
+                *(
+                    self.aget_eod_data(
+                        ticker,
+                        interval="daily" if aggregate_at_once else interval,
+                        backfill_ticker=backfill_ticker,
+                        max_cache_age_in_hours=max_cache_age_in_hours,
+                        session=session,
+                    )
+                    for ticker in tickers
+                ),
+                return_exceptions=True,
+            )
+
+        result = BatchResult()
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, Exception):
+                result.errors[ticker] = outcome
+            else:
+                result[ticker] = outcome
+
+        if aggregate_at_once:
+            result.update(self._finalize_many(dict(result), interval))
+
+        if result.errors:
+            logger.warning(
+                f"Failed to get data for {len(result.errors)} of {len(tickers)} tickers: "
+                f"{', '.join(result.errors)}"
+            )
+
+        return result.to_frame() if as_frame else result
+
+    def _finalize_data(self, combined_df: pd.DataFrame, interval: str) -> pd.DataFrame:
+        # Ensure the index is a DatetimeIndex. The cache backends and _preprocess_data
+        # already provide one, so this only converts data from custom sources.
+        if not isinstance(combined_df.index, pd.DatetimeIndex):
+            combined_df.index = pd.to_datetime(combined_df.index)
 
         # Resample data based on the specified interval
-        aggregated_df = self._aggregate_data(combined_df, interval)
+        with self._stage("aggregate", interval=interval, rows=len(combined_df)):
+            aggregated_df = self._aggregate_data(combined_df, interval)
+
+        if self.compact:
+            # Splicing tickers or adding empty periods can widen the compact dtypes
+            aggregated_df = DFUtil.apply_schema(aggregated_df, self._column_dtypes())
 
         return aggregated_df
 
+    def _finalize_many(self, frames: dict, interval: str) -> dict:
+        """Aggregate the finalized daily data of several tickers at once."""
+        if AggregationUtil.resolve_freq(interval) is None:
+            return frames
+
+        rows = sum(len(df) for df in frames.values())
+        with self._stage("aggregate", interval=interval, tickers=len(frames), rows=rows):
+            aggregated = AggregationUtil.aggregate_many(frames, interval)
+
+        if self.compact:
+            # Adding empty periods can widen the compact dtypes
+            column_dtypes = self._column_dtypes()
+            aggregated = {
+                ticker: DFUtil.apply_schema(df, column_dtypes) for ticker, df in aggregated.items()
+            }
+
+        return aggregated
+
     def _backfill_data(self, backfill_ticker, max_cache_age_in_hours, original_df):
         """
         Backfill the original DataFrame with historical data from a specified backfill ticker.
 
-        This method enhances the original dataset by incorporating additional historical data
-        from the backfill ticker provided. If no backfill ticker is specified, it returns the
-        original data unchanged.
+        This method extends the history of the original DataFrame with the earlier data of
+        the backfill ticker, or of each ticker of an ordered chain of backfill tickers. If no
+        backfill ticker is specified, it returns the original DataFrame unchanged.
 
         Args:
-            backfill_ticker (str): The ticker symbol to use for backfilling data. If None or empty,
-                                no backfilling is performed.
+            backfill_ticker (str | list): The ticker symbol to use for backfilling data, or an
+                                          ordered chain of them. If None or empty, no backfilling
+                                          is performed.
             max_cache_age_in_hours (int): The maximum age of cached data in hours. Used to determine
                                         whether to fetch fresh data.
             original_df (pd.DataFrame): The original DataFrame containing data for the primary ticker.
@@ -78,16 +683,28 @@ class BaseDataSource(ABC):
             pd.DataFrame: A DataFrame that combines the original data with backfilled data if a
                         backfill ticker is provided; otherwise, returns the original data.
         """
-        if backfill_ticker:
-            # Fetch data for the backfill ticker, respecting the maximum cache age
-            backfill_df = self._fetch_data(backfill_ticker, max_cache_age_in_hours)
-            # Combine the original DataFrame with the backfill DataFrame
-            # DFUtil.splice is assumed to merge dataframes by aligning on the index and filling gaps
-            return DFUtil.splice(original_df, backfill_df)
-        else:
+        backfill_tickers = self._backfill_chain(backfill_ticker)
+        if not backfill_tickers:
             # No backfill ticker provided; return the original DataFrame unmodified
             return original_df
 
+        # Fetch data for the backfill tickers, respecting the maximum cache age
+        backfill_dfs = [
+            self._fetch_data(backfill, max_cache_age_in_hours) for backfill in backfill_tickers
+        ]
+        # Splice without modifying the fetched frames, which may be shared with the memory cache
+        with self._stage("splice", backfill_tickers=",".join(backfill_tickers)):
+            return DFUtil.splice_chain(original_df, backfill_dfs)
+
+    @staticmethod
+    def _backfill_chain(backfill_ticker) -> list:
+        """Normalize a backfill ticker or chain of backfill tickers to a list."""
+        if not backfill_ticker:
+            return []
+        if isinstance(backfill_ticker, str):
+            return [backfill_ticker]
+        return list(backfill_ticker)
+
     def _fetch_data(self, ticker: str, max_cache_age_in_hours: int) -> pd.DataFrame:
         """
         Retrieve data for the given ticker symbol. This method first checks if
@@ -104,44 +721,706 @@ class BaseDataSource(ABC):
                           The data is either retrieved from the cache or directly from
                           the data source.
         """
-        cache_path = CacheUtil.cache_path(self.name, ticker)
+        cache_path = CacheUtil.cache_path(self.name, ticker, cache_format=self.cache_format)
+
+        fresh_df, _ = self._check_cache(
+            ticker, cache_path, max_cache_age_in_hours, load_stale=False
+        )
+        self._count("fin_ds_cache_requests_total", result="miss" if fresh_df is None else "hit")
+        if fresh_df is not None:
+            return fresh_df
+
+        # Only one fetch per ticker is in flight. Other threads wait for its result.
+        return self._single_flight.do(
+            self._flight_key(cache_path),
+            lambda: self._refresh_data(ticker, cache_path, max_cache_age_in_hours),
+            share=pd.DataFrame.copy,
+        )
+
+    def _flight_key(self, cache_path) -> tuple:
+        """
+        Return the key under which concurrent fetches are coalesced. Instances share a
+        fetch only if they cache to the same file and keep the data in the same dtypes.
+        """
+        return self.name, str(cache_path), self.compact
+
+    def _refresh_data(self, ticker: str, cache_path, max_cache_age_in_hours: int) -> pd.DataFrame:
+        """
+        Fetch and cache data for a ticker while holding the cache entry's fetch lock,
+        so that processes sharing the cache directory do not fetch it at the same time.
+        """
+        with FileLock(CacheUtil.lock_path(cache_path)):
+            # Another process may have refreshed the cache while we waited for the lock
+            fresh_df, cached_df = self._check_cache(ticker, cache_path, max_cache_age_in_hours)
+            if fresh_df is not None:
+                return fresh_df
+
+            # Fetch and cache data
+            try:
+                latest_df = self._fetch_latest_data(ticker, cached_df)
+            except Exception as e:
+                logger.error(f"Failed to fetch data for {ticker}: {e}")
+                raise
+
+            self._save_data(ticker, cache_path, latest_df)
+
+        return latest_df
 
-        # Check if data is cached and not stale
-        if CacheUtil.is_cached(cache_path):
-            if not CacheUtil.is_stale(cache_path, max_cache_age_in_hours):
-                logger.info(f"Loading data for {ticker} from cache.")
-                cached_df = CacheUtil.load_from_cache(cache_path)
-                return cached_df
+    def _check_cache(
+        self, ticker: str, cache_path, max_cache_age_in_hours: int, load_stale: bool = True
+    ) -> tuple:
+        """
+        Look up the cache entry for a ticker.
+
+        Args:
+            ticker (str): The stock ticker symbol.
+            cache_path (Path): The cache file for the ticker.
+            max_cache_age_in_hours (int): The maximum age of cached data.
+            load_stale (bool, optional): Whether to load stale data for an incremental update.
+
+        Returns:
+            tuple: (fresh_df, stale_df). fresh_df is the cached data if it is not stale.
+                   stale_df is the stale cached data when it is needed for an incremental
+                   update. Both are None when the data has to be fetched in full.
+        """
+        with self._stage("cache_lookup", ticker=ticker) as span:
+            if self.use_manifest:
+                result = self._check_manifest(ticker, cache_path, max_cache_age_in_hours, load_stale)
             else:
-                logger.info(f"Cache for {ticker} is stale.")
-        else:
+                result = self._check_files(ticker, cache_path, max_cache_age_in_hours, load_stale)
+            fresh_df, stale_df = result
+            span.set_attribute(
+                "cache", "hit" if fresh_df is not None else "stale" if stale_df is not None else "miss"
+            )
+        return result
+
+    def _check_files(
+        self, ticker: str, cache_path, max_cache_age_in_hours: int, load_stale: bool
+    ) -> tuple:
+        """
+        File-based counterpart of _check_manifest, which checks the cache file's
+        existence, modification time and size with a single stat.
+        """
+        try:
+            stat = cache_path.stat()
+        except FileNotFoundError:
+            logger.info(f"No cache found for {ticker}.")
+            return None, None
+
+        # Check if data is not stale
+        if time.time() - stat.st_mtime <= max_cache_age_in_hours * 3600:
+            version = (str(cache_path), stat.st_mtime_ns)
+            return self._load_from_cache(ticker, cache_path, version, stat.st_size), None
+
+        logger.info(f"Cache for {ticker} is stale.")
+        if load_stale and self.incremental and self.supports_start_date:
+            cached_df = self._read_cache(cache_path, stat.st_size)
+            if not cached_df.empty:
+                return None, cached_df
+
+        return None, None
+
+    def _check_manifest(
+        self, ticker: str, cache_path, max_cache_age_in_hours: int, load_stale: bool
+    ) -> tuple:
+        """
+        Manifest-based counterpart of _check_cache, which needs no file system calls
+        other than the load itself. The entry's size is counted as the read bytes, and
+        only entries recorded without a size, before a rebuild, stat the file for it.
+        """
+        manifest = CacheManifest.for_cache_dir(cache_path.parent)
+        entry = manifest.get(self.name, ticker, self.cache_format)
+        if entry is None:
             logger.info(f"No cache found for {ticker}.")
+            return None, None
 
-        # Fetch and cache data
         try:
-            logger.info(f"Fetching data for {ticker}...")
-            latest_df = self._fetch_and_process_data(ticker)
-        except Exception as e:
-            logger.error(f"Failed to fetch data for {ticker}: {e}")
-            raise
+            if not CacheManifest.is_stale(entry, max_cache_age_in_hours):
+                version = (str(cache_path), entry["fetched_at"])
+                return self._load_from_cache(ticker, cache_path, version, entry["size"]), None
+
+            logger.info(f"Cache for {ticker} is stale.")
+            if load_stale and self.incremental and self.supports_start_date:
+                cached_df = self._read_cache(cache_path, entry["size"])
+                if not cached_df.empty:
+                    return None, cached_df
+        except FileNotFoundError:
+            logger.warning(f"Cache file for {ticker} is missing. Removing it from the manifest.")
+            manifest.remove(self.name, ticker, self.cache_format)
+
+        return None, None
+
+    def _column_dtypes(self) -> dict:
+        return self.COMPACT_COLUMN_DTYPES if self.compact else self.COLUMN_DTYPES
+
+    def _read_cache(self, cache_path, size: int = None) -> pd.DataFrame:
+        """
+        Load a cache file in the data source's schema. Formats that store dtypes load
+        compact data as it is, while CSV data is converted back after loading.
+
+        The size of the file, counted as read bytes, is passed in by callers that already
+        know it, so that loads need no extra stat.
+        """
+        with self._stage("cache_load", path=str(cache_path)) as span:
+            df = CacheUtil.load_from_cache(cache_path, self.cache_format)
+            if self.compact:
+                df = DFUtil.apply_schema(df, self._column_dtypes())
+            span.set_attribute("rows", len(df))
+        self._count(
+            "fin_ds_cache_read_bytes_total", size if size is not None else self._file_size(cache_path)
+        )
+        return df
+
+    def _load_from_cache(self, ticker: str, cache_path, version=None, size: int = None) -> pd.DataFrame:
+        if self.memory_cache is None:
+            logger.info(f"Loading data for {ticker} from cache.")
+            return self._read_cache(cache_path, size)
+
+        # The memory cache entry is only used if the file has not been rewritten since
+        key = (self.name, ticker)
+        if version is None:
+            version = (str(cache_path), CacheUtil.cache_version(cache_path))
+        df = self.memory_cache.get(key, version)
+        if df is not None:
+            logger.info(f"Loading data for {ticker} from memory cache.")
+            self._count("fin_ds_memory_cache_requests_total", result="hit")
+            return df
+
+        self._count("fin_ds_memory_cache_requests_total", result="miss")
 
-        CacheUtil.save_to_cache(cache_path, latest_df)
+        logger.info(f"Loading data for {ticker} from cache.")
+        df = self._read_cache(cache_path, size)
+        self.memory_cache.put(key, version, df)
+        return df
+
+    def _save_data(self, ticker: str, cache_path, df: pd.DataFrame) -> None:
+        with self._stage("cache_save", ticker=ticker, rows=len(df)):
+            size = CacheUtil.save_to_cache(cache_path, df, self.cache_format)
+        self._count("fin_ds_cache_written_bytes_total", size)
         logger.info(f"Data for {ticker} fetched and cached.")
 
+        if self.use_manifest:
+            manifest = CacheManifest.for_cache_dir(cache_path.parent)
+            fetched_at = manifest.record(
+                self.name, ticker, self.cache_format, cache_path, df, size=size
+            )
+            version = (str(cache_path), fetched_at)
+        elif self.memory_cache is not None:
+            version = (str(cache_path), CacheUtil.cache_version(cache_path))
+
+        if self.memory_cache is not None:
+            self.memory_cache.put((self.name, ticker), version, df)
+
+    def _materializes(self, interval: str) -> bool:
+        return self.materialize_aggregates and AggregationUtil.resolve_freq(interval) is not None
+
+    def _entry_version(self, ticker: str, max_cache_age_in_hours: int = None):
+        """
+        Look up the version of a ticker's daily cache entry without loading it.
+
+        Args:
+            ticker (str): The stock ticker symbol.
+            max_cache_age_in_hours (int, optional): If given, stale entries count as missing.
+
+        Returns:
+            The manifest fetch timestamp or the file's modification time, or None if the
+            entry is missing or stale.
+        """
+        cache_path = CacheUtil.cache_path(self.name, ticker, cache_format=self.cache_format)
+        if self.use_manifest:
+            manifest = CacheManifest.for_cache_dir(cache_path.parent)
+            entry = manifest.get(self.name, ticker, self.cache_format)
+            if entry is None or (
+                max_cache_age_in_hours is not None
+                and CacheManifest.is_stale(entry, max_cache_age_in_hours)
+            ):
+                return None
+            return entry["fetched_at"]
+
+        try:
+            if max_cache_age_in_hours is not None and CacheUtil.is_stale(
+                cache_path, max_cache_age_in_hours
+            ):
+                return None
+            return CacheUtil.cache_version(cache_path)
+        except FileNotFoundError:
+            return None
+
+    def _materialized_path(self, ticker: str, interval: str, backfill_ticker, versions: list):
+        """
+        Build the path of the materialized aggregate derived from the given versions of
+        the daily entries, so that a changed daily entry leads to a different file.
+
+        Returns:
+            tuple: (cache_path, name, derived_path) of the daily cache file, the derived
+                   name and the materialized file.
+        """
+        backfill_tickers = self._backfill_chain(backfill_ticker)
+        name = f"{interval}.{'+'.join(backfill_tickers)}" if backfill_tickers else interval
+        fingerprint = hashlib.blake2b(
+            repr((self.MATERIALIZED_VERSION, name, versions)).encode(), digest_size=8
+        ).hexdigest()
+        cache_path = CacheUtil.cache_path(self.name, ticker, cache_format=self.cache_format)
+        return cache_path, name, CacheUtil.derived_cache_path(cache_path, name, fingerprint)
+
+    def _materialized_versions(self, ticker: str, backfill_ticker, max_cache_age_in_hours=None):
+        tickers = [ticker, *self._backfill_chain(backfill_ticker)]
+        versions = [self._entry_version(t, max_cache_age_in_hours) for t in tickers]
+        return None if None in versions else versions
+
+    def _load_materialized(
+        self, ticker: str, interval: str, backfill_ticker, max_cache_age_in_hours: int
+    ) -> tuple:
+        """
+        Load the materialized aggregate for a ticker if its daily entries are fresh and
+        have not changed since it was computed.
+
+        Returns:
+            tuple: (df, versions) of the aggregated data, or None if it has to be computed,
+                   and the versions of the fresh daily entries, or None if any of them is
+                   missing or stale. The versions are looked up before the daily data is
+                   loaded, so they are those of the data an aggregate is computed from.
+        """
+        versions = self._materialized_versions(ticker, backfill_ticker, max_cache_age_in_hours)
+        if versions is None:
+            return None, None
+
+        _, _, derived_path = self._materialized_path(ticker, interval, backfill_ticker, versions)
+        try:
+            df = self._read_cache(derived_path, derived_path.stat().st_size)
+        except FileNotFoundError:
+            return None, versions
+
+        logger.info(f"Loading {interval} data for {ticker} from materialized cache.")
+        df.index = pd.DatetimeIndex(df.index, freq=AggregationUtil.resolve_freq(interval))
+        return df, versions
+
+    def _save_materialized(
+        self, ticker: str, interval: str, backfill_ticker, versions, df: pd.DataFrame
+    ) -> None:
+        """
+        Store an aggregate under the versions of the daily entries it was computed from
+        and remove the aggregates of older versions.
+
+        Aggregates of daily entries that were refreshed while loading them are not stored,
+        as the versions they were computed from are not known. The next call finds the
+        refreshed entries fresh and stores its aggregate instead.
+        """
+        if versions is None:
+            return
+
+        cache_path, name, derived_path = self._materialized_path(
+            ticker, interval, backfill_ticker, versions
+        )
+        try:
+            CacheUtil.save_to_cache(derived_path, df, self.cache_format)
+        except Exception as e:
+            # The aggregate is only an optimization, so a failed write is not fatal
+            logger.warning(f"Failed to materialize {interval} data for {ticker}: {e}")
+            return
+        CacheUtil.remove_derived(cache_path, name, keep=derived_path)
+
+    def _fetch_many_from_source(self, tickers: list):
+        """
+        Fetch the raw data of many tickers with as few requests as the source allows.
+        Subclasses that implement this set supports_batch_fetch to True.
+
+        Args:
+            tickers (list): The stock ticker symbols to fetch.
+
+        Yields:
+            tuple: (ticker, DataFrame) pairs in the format returned by _fetch_data_from_source.
+                   Tickers without data are skipped.
+        """
+        raise NotImplementedError(f"{self.name} does not support batch fetches.")
+
+    def _prefetch_many(self, tickers: list, backfill_ticker, max_cache_age_in_hours: int) -> list:
+        """
+        Fetch the tickers, and their backfill tickers, that are missing from the cache or
+        stale with _fetch_many_from_source and cache them. Tickers the batch does not
+        return are left to the regular per-ticker fetch, which reports their errors.
+
+        Returns:
+            list: The tickers that were fetched and cached.
+        """
+        tickers = list(dict.fromkeys([*tickers, *self._backfill_chain(backfill_ticker)]))
+        if self.use_manifest:
+            cache_dir = CacheUtil.cache_path(self.name, "", cache_format=self.cache_format).parent
+            stale = CacheManifest.for_cache_dir(cache_dir).stale_tickers(
+                self.name, tickers, max_cache_age_in_hours, self.cache_format
+            )
+        else:
+            stale = [t for t in tickers if self._entry_version(t, max_cache_age_in_hours) is None]
+        if not stale:
+            return []
+
+        logger.info(f"Fetching {len(stale)} tickers in batches...")
+        cached = []
+        try:
+            for ticker, source_df in self._fetch_many_from_source(stale):
+                try:
+                    self._store_fetched_data(ticker, source_df)
+                    cached.append(ticker)
+                except Exception as e:
+                    logger.warning(f"Failed to cache batch data for {ticker}: {e}")
+        except Exception as e:
+            logger.warning(f"Batch fetch failed, fetching the remaining tickers one at a time: {e}")
+
+        return cached
+
+    def _fetch_last_day_from_source(self, tickers: list, exchange: str) -> tuple:
+        """
+        Fetch the last trading day of a whole exchange with as few requests as possible.
+        Subclasses that implement this set supports_bulk_daily to True.
+
+        Args:
+            tickers (list): The stock ticker symbols the caller is interested in.
+            exchange (str): The exchange to fetch.
+
+        Returns:
+            tuple: (snapshot, corporate_actions) where snapshot maps each of the tickers
+                   found to a one-row DataFrame in the format returned by
+                   _fetch_data_from_source, and corporate_actions is the set of those
+                   tickers with a split or dividend on that day.
+        """
+        raise NotImplementedError(f"{self.name} does not support bulk daily updates.")
+
+    def _append_last_day(self, ticker: str, source_df: pd.DataFrame, corporate_action: bool) -> str:
+        """
+        Append a ticker's bar from an exchange-wide snapshot to its cache entry, or fetch
+        the ticker individually if the bar alone cannot update it.
+
+        Returns:
+            str: 'appended', 'refetched' or 'current'.
+        """
+        cache_path = CacheUtil.cache_path(self.name, ticker, cache_format=self.cache_format)
+        bar_date = pd.to_datetime(source_df.index).max().tz_localize(None)
+
+        refetch = corporate_action or not cache_path.exists()
+        if not refetch:
+            with FileLock(CacheUtil.lock_path(cache_path)):
+                cached_df = self._read_cache(cache_path)
+                last_date = cached_df.index.max() if not cached_df.empty else None
+                if last_date is not None and last_date >= bar_date:
+                    return "current"
+
+                # A missed day would leave a gap, so the bar has to follow the cached data.
+                # Holidays can make this refetch needlessly, which is safe.
+                if last_date is not None and last_date >= bar_date - pd.offsets.BDay(1):
+                    with self._stage("preprocess", ticker=ticker):
+                        new_df = self._preprocess_data(ticker, source_df)
+                    self._save_data(ticker, cache_path, DFUtil.merge(cached_df, new_df))
+                    return "appended"
+
+        logger.info(f"Fetching {ticker} individually after a bulk daily update.")
+        with FileLock(CacheUtil.lock_path(cache_path)):
+            cached_df = None
+            if not corporate_action and cache_path.exists():
+                # An incremental update covers the missed days when it is enabled
+                _, cached_df = self._check_cache(ticker, cache_path, 0)
+            latest_df = self._fetch_latest_data(ticker, cached_df)
+            self._save_data(ticker, cache_path, latest_df)
+        return "refetched"
+
+    def _store_fetched_data(self, ticker: str, source_df: pd.DataFrame, incremental: bool = False):
+        """
+        Standardize and cache data for one ticker that was fetched in bulk together with
+        other tickers, holding the ticker's fetch lock like a regular fetch.
+
+        Args:
+            ticker (str): The stock ticker symbol.
+            source_df (pd.DataFrame): The raw data of the ticker as returned by the source.
+            incremental (bool, optional): Whether source_df only holds the bars from the last
+                                          cached date onwards and is merged into the cache.
+
+        Returns:
+            pd.DataFrame: The cached data, or None if an incremental update could not be
+                          applied because the ticker is not cached or its history changed.
+        """
+        with self._stage("preprocess", ticker=ticker):
+            new_df = self._preprocess_data(ticker, source_df)
+        cache_path = CacheUtil.cache_path(self.name, ticker, cache_format=self.cache_format)
+
+        with FileLock(CacheUtil.lock_path(cache_path)):
+            if incremental:
+                if not cache_path.exists():
+                    return None
+                cached_df = self._read_cache(cache_path)
+                if cached_df.empty or self._requires_full_refetch(cached_df, new_df):
+                    return None
+                new_df = DFUtil.merge(cached_df, new_df)
+
+            self._save_data(ticker, cache_path, new_df)
+
+        return new_df
+
+    def _fetch_latest_data(self, ticker: str, cached_df: pd.DataFrame = None) -> pd.DataFrame:
+        if cached_df is not None:
+            logger.info(f"Fetching new data for {ticker} after {cached_df.index.max():%Y-%m-%d}...")
+            return self._fetch_incremental_data(ticker, cached_df)
+
+        logger.info(f"Fetching data for {ticker}...")
+        return self._fetch_and_process_data(ticker)
+
+    def _fetch_incremental_data(self, ticker: str, cached_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Update cached data with the bars published since the last cached date.
+
+        The last cached bar is requested again so that the overlap can be compared.
+        If the new bars contain a dividend or split, or the overlapping adjusted close
+        has been revised, the whole history has been re-adjusted upstream and the
+        full history is fetched instead.
+
+        Args:
+            ticker (str): The stock ticker symbol.
+            cached_df (pd.DataFrame): The stale data loaded from the cache.
+
+        Returns:
+            pd.DataFrame: The cached data merged with the newly fetched bars.
+        """
+        last_date = cached_df.index.max()
+        new_df = self._fetch_and_process_data(ticker, start_date=last_date.strftime("%Y-%m-%d"))
+
+        if self._requires_full_refetch(cached_df, new_df):
+            logger.info(f"Corporate action or revised data found for {ticker}. Fetching full history.")
+            return self._fetch_and_process_data(ticker)
+
+        return DFUtil.merge(cached_df, new_df)
+
+    def _requires_full_refetch(self, cached_df: pd.DataFrame, new_df: pd.DataFrame) -> bool:
+        """
+        Check whether incrementally fetched data invalidates the cached history.
+
+        Args:
+            cached_df (pd.DataFrame): The data loaded from the cache.
+            new_df (pd.DataFrame): The data fetched from the last cached date onwards.
+
+        Returns:
+            bool: True if the full history needs to be fetched again.
+        """
+        # A revised adjusted close on the overlapping bar means the history was re-adjusted
+        overlap = new_df.index.intersection(cached_df.index)
+        if "adj_close" in new_df.columns and not overlap.empty:
+            cached_adj_close = cached_df.loc[overlap, "adj_close"].to_numpy(dtype="float64")
+            new_adj_close = new_df.loc[overlap, "adj_close"].to_numpy(dtype="float64")
+            if not np.allclose(
+                cached_adj_close, new_adj_close, rtol=self.ADJ_CLOSE_TOLERANCE, equal_nan=True
+            ):
+                return True
+
+        # A dividend or split on a new bar changes the adjusted history
+        new_rows = new_df.loc[~new_df.index.isin(cached_df.index)]
+        if "dividend" in new_rows.columns and (new_rows["dividend"].fillna(0) != 0).any():
+            return True
+        if "split" in new_rows.columns and (new_rows["split"].fillna(1) != 1).any():
+            return True
+
+        return False
+
+    def _fetch_and_process_data(self, ticker: str, start_date: str = None) -> pd.DataFrame:
+        # Fetch data from source via subclass-specific method. Only sources that
+        # support a start date are asked for a partial range.
+        with self._concurrency_semaphore():
+            if self.rate_limiter is not None:
+                with self._stage("rate_limit"):
+                    self.rate_limiter.acquire()
+
+            with self._stage("fetch", ticker=ticker, start_date=start_date):
+                if start_date is not None:
+                    source_df = self._fetch_data_from_source(ticker, start_date=start_date)
+                else:
+                    source_df = self._fetch_data_from_source(ticker)
+
+        # Standardize the DataFrame
+        with self._stage("preprocess", ticker=ticker) as span:
+            processed_df = self._preprocess_data(ticker, source_df)
+            span.set_attribute("rows", len(processed_df))
+        self._count("fin_ds_rows_fetched_total", len(processed_df))
+
+        return processed_df
+
+    async def _afetch_data(self, ticker: str, max_cache_age_in_hours: int, session) -> pd.DataFrame:
+        """
+        Asynchronous counterpart of _fetch_data. Cache lookups, loads and saves run in a
+        worker thread; the upstream fetch goes through _afetch_data_from_source.
+        """
+        cache_path = CacheUtil.cache_path(self.name, ticker, cache_format=self.cache_format)
+
+        fresh_df, _ = await asyncio.to_thread(
+            self._check_cache, ticker, cache_path, max_cache_age_in_hours, load_stale=False
+        )
+        self._count("fin_ds_cache_requests_total", result="miss" if fresh_df is None else "hit")
+        if fresh_df is not None:
+            return fresh_df
+
+        # Only one fetch per ticker is in flight. Other tasks wait for its result.
+        return await self._single_flight.ado(
+            self._flight_key(cache_path),
+            lambda: self._arefresh_data(ticker, cache_path, max_cache_age_in_hours, session),
+            share=pd.DataFrame.copy,
+        )
+
+    async def _arefresh_data(
+        self, ticker: str, cache_path, max_cache_age_in_hours: int, session
+    ) -> pd.DataFrame:
+        """
+        Asynchronous counterpart of _refresh_data. The fetch lock is acquired in a
+        worker thread so that waiting for another process does not block the event loop.
+        """
+        lock = FileLock(CacheUtil.lock_path(cache_path))
+        await asyncio.to_thread(lock.acquire)
+        try:
+            # Another process may have refreshed the cache while we waited for the lock
+            fresh_df, cached_df = await asyncio.to_thread(
+                self._check_cache, ticker, cache_path, max_cache_age_in_hours
+            )
+            if fresh_df is not None:
+                return fresh_df
+
+            # Fetch and cache data
+            try:
+                latest_df = await self._afetch_latest_data(ticker, session, cached_df)
+            except Exception as e:
+                logger.error(f"Failed to fetch data for {ticker}: {e}")
+                raise
+
+            await asyncio.to_thread(self._save_data, ticker, cache_path, latest_df)
+        finally:
+            lock.release()
+
         return latest_df
 
-    def _fetch_and_process_data(self, ticker: str) -> pd.DataFrame:
-        # Fetch data from source via subclass-specific method
-        source_df = self._fetch_data_from_source(ticker)
+    async def _afetch_latest_data(
+        self, ticker: str, session, cached_df: pd.DataFrame = None
+    ) -> pd.DataFrame:
+        if cached_df is None:
+            logger.info(f"Fetching data for {ticker}...")
+            return await self._afetch_and_process_data(ticker, session)
+
+        logger.info(f"Fetching new data for {ticker} after {cached_df.index.max():%Y-%m-%d}...")
+        last_date = cached_df.index.max()
+        new_df = await self._afetch_and_process_data(
+            ticker, session, start_date=last_date.strftime("%Y-%m-%d")
+        )
+
+        if self._requires_full_refetch(cached_df, new_df):
+            logger.info(f"Corporate action or revised data found for {ticker}. Fetching full history.")
+            return await self._afetch_and_process_data(ticker, session)
+
+        return DFUtil.merge(cached_df, new_df)
+
+    async def _afetch_and_process_data(
+        self, ticker: str, session, start_date: str = None
+    ) -> pd.DataFrame:
+        async with self._async_concurrency_semaphore():
+            if self.rate_limiter is not None:
+                with self._stage("rate_limit"):
+                    await self.rate_limiter.aacquire()
+
+            with self._stage("fetch", ticker=ticker, start_date=start_date):
+                source_df = await self._afetch_data_from_source(ticker, session, start_date=start_date)
 
         # Standardize the DataFrame
-        processed_df = self._preprocess_data(ticker, source_df)
+        with self._stage("preprocess", ticker=ticker) as span:
+            processed_df = self._preprocess_data(ticker, source_df)
+            span.set_attribute("rows", len(processed_df))
+        self._count("fin_ds_rows_fetched_total", len(processed_df))
 
         return processed_df
 
+    def _span(self, name: str, **attributes):
+        """Start a tracing span labelled with the data source name."""
+        return self.tracer.start_span(name, {"source": self.name, **attributes})
+
+    @contextlib.contextmanager
+    def _stage(self, stage: str, **attributes):
+        """
+        Trace a stage of the pipeline in a span and time it in the fin_ds_stage_seconds
+        histogram. Stages nest, e.g. cache_lookup includes the cache_load of a fresh entry.
+        """
+        with self._span(stage, **attributes) as span:
+            with self.metrics.timer("fin_ds_stage_seconds", source=self.name, stage=stage):
+                yield span
+
+    def _count(self, name: str, value: float = 1, **labels) -> None:
+        self.metrics.inc(name, value, source=self.name, **labels)
+
+    @staticmethod
+    def _file_size(path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    async def _afetch_data_from_source(
+        self, ticker: str, session, start_date: str = None
+    ) -> pd.DataFrame:
+        """
+        Fetch data from the source without blocking the event loop.
+
+        Data sources with a REST API override this to use the aiohttp session. The default
+        runs the synchronous _fetch_data_from_source in a worker thread, which is what the
+        sync-only client libraries need.
+
+        Args:
+            ticker (str): The stock ticker symbol (e.g., "AAPL").
+            session (aiohttp.ClientSession): The HTTP session, or None if the data source
+                                             does not use async HTTP.
+            start_date (str, optional): The first date to fetch in YYYY-MM-DD format.
+
+        Returns:
+            pd.DataFrame: The data as returned by the source, before preprocessing.
+        """
+        if start_date is not None:
+            return await asyncio.to_thread(self._fetch_data_from_source, ticker, start_date=start_date)
+        return await asyncio.to_thread(self._fetch_data_from_source, ticker)
+
+    @contextlib.asynccontextmanager
+    async def _aclient_session(self, session=None):
+        """
+        Yield the aiohttp session to use for a request. An existing session is passed
+        through, otherwise one is created and closed for data sources that use async HTTP.
+        """
+        if session is not None or not self.async_http:
+            yield session
+            return
+
+        async with HttpUtil.client_session() as new_session:
+            yield new_session
+
+    @classmethod
+    def _async_concurrency_semaphore(cls) -> asyncio.Semaphore:
+        """
+        Return the semaphore that limits concurrent upstream requests for this data source
+        class within the running event loop.
+        """
+        loop_semaphores = cls._async_concurrency_semaphores.setdefault(
+            asyncio.get_running_loop(), {}
+        )
+        if cls not in loop_semaphores:
+            loop_semaphores[cls] = asyncio.Semaphore(cls.max_concurrency)
+        return loop_semaphores[cls]
+
+    @classmethod
+    def _concurrency_semaphore(cls) -> threading.BoundedSemaphore:
+        """
+        Return the semaphore that limits concurrent upstream requests for this data source class.
+        """
+        with cls._concurrency_semaphores_lock:
+            semaphore = cls._concurrency_semaphores.get(cls)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(cls.max_concurrency)
+                cls._concurrency_semaphores[cls] = semaphore
+            return semaphore
+
     def _preprocess_data(self, ticker: str, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Standardize the DataFrame by renaming columns and reordering them.
+        Standardize the DataFrame to the target schema: the columns of COLUMN_ORDER with
+        the dtypes of COLUMN_DTYPES (or COMPACT_COLUMN_DTYPES in compact mode), indexed by
+        a sorted, timezone-naive 'date' index.
+
+        The standardized frame is built in a single pass from the source columns, so the
+        data is copied once instead of once per renaming, selection and sorting step.
 
         Args:
             df (pd.DataFrame): The DataFrame to standardize.
@@ -149,24 +1428,46 @@ class BaseDataSource(ABC):
         Returns:
             pd.DataFrame: The standardized DataFrame.
         """
-        # Rename columns
-        df = df.rename(columns=self.COLUMN_MAPPINGS)
+        # Remove any time-related data from the index so that we end up with yyyy-mm-dd
+        index = df.index
+        if not isinstance(index, pd.DatetimeIndex):
+            index = pd.to_datetime(index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
 
-        # Add the ticker as a column. Used when backfilled data is added.
-        if "ticker" not in df.columns:
-            df["ticker"] = ticker
+        # Sort by date in ascending order, unless the source already did. The rows are
+        # reordered while the columns are gathered instead of sorting a finished copy.
+        order = None
+        if not index.is_monotonic_increasing:
+            order = index.argsort(kind="stable")
+            index = index[order]
+        index = index.rename("date")
 
-        # Reorder columns
-        df = df[self.COLUMN_ORDER]
+        # Find the source column of each target column
+        sources = {target: source for source, target in self.COLUMN_MAPPINGS.items() if source in df.columns}
 
-        # Change the index name
-        df.index.name = "date"
+        column_dtypes = self._column_dtypes()
+        data = {}
+        for column in self.COLUMN_ORDER:
+            source = sources.get(column, column)
+            if column == "ticker" and source not in df.columns:
+                # Add the ticker as a column. Used when backfilled data is added.
+                values = np.full(len(index), ticker, dtype=object)
+                if "ticker" in column_dtypes:
+                    values = DFUtil.convert(pd.Series(values, copy=False), column_dtypes["ticker"]).array
+                data[column] = values
+                continue
 
-        # Remove any time-related data from the index so that we end up with yyyy-mm-dd
-        df.index = pd.to_datetime(df.index).tz_localize(None)
+            values = df[source].to_numpy()
+            if order is not None:
+                values = values[order]
+            dtype = column_dtypes.get(column)
+            if dtype is not None:
+                values = DFUtil.convert(pd.Series(values, copy=False), dtype).array
+            data[column] = values
 
-        # Sort by date in ascending order
-        df = df.sort_values(by="date")
+        # The gathered arrays are used as they are, without consolidating them into a copy
+        df = pd.DataFrame(data, index=index, columns=self.COLUMN_ORDER, copy=False)
 
         # Round only the floating-point columns in latest_df.
         # Without this, Yahoo Finance was flagging tons of records with differences.
@@ -180,19 +1481,4 @@ class BaseDataSource(ABC):
 
     def _aggregate_data(self, df: pd.DataFrame, interval: str) -> pd.DataFrame:
         """Aggregate data based on the specified interval."""
-        resample_rules = {
-            "daily": None,
-            "weekly": "W",
-            "monthly": "ME",
-        }
-
-        freq = resample_rules.get(interval)
-        if freq is None and interval != "daily":
-            raise ValueError(
-                f"Unsupported interval: {interval}. Supported intervals are 'daily', 'weekly', 'monthly'."
-            )
-
-        if freq:
-            return df.resample(freq).last()
-        else:
-            return df
+        return AggregationUtil.aggregate(df, interval)
@@ -2,9 +2,26 @@ import pandas as pd
 
 from fin_ds.data_source_factory import DataSourceFactory
 from fin_ds.data_sources.base_data_source import BaseDataSource
+from fin_ds.utils.http_util import HttpUtil
 
 
 class EODHDDataSource(BaseDataSource):
+    # EODHD accepts a from date so incremental updates only request new bars
+    supports_start_date = True
+
+    # Paid plan quotas
+    RATE_LIMITS = {"minute": 1000, "day": 100000}
+
+    # aget_eod_data calls the REST API directly over aiohttp
+    async_http = True
+
+    # The last trading day of a whole exchange is available in a single request
+    supports_bulk_daily = True
+
+    EOD_URL = "https://eodhd.com/api/eod/{ticker}"
+
+    BULK_LAST_DAY_URL = "https://eodhd.com/api/eod-bulk-last-day/{exchange}"
+
     COLUMN_MAPPINGS = {
         "adjusted_close": "adj_close",
         "symbol": "ticker",
@@ -24,29 +41,112 @@ class EODHDDataSource(BaseDataSource):
         # Call the base class __init__
         super().__init__(name)
 
-        # Lazy load the library to avoid importing it if not needed
-        from eodhd import APIClient
-
-        self.api_client = APIClient(api_key)
+        self.api_key = api_key
 
-    def _fetch_data_from_source(self, ticker) -> pd.DataFrame:
+    def _fetch_data_from_source(self, ticker, start_date=None) -> pd.DataFrame:
         """
         Fetch historical stock data for a given ticker symbol within a date range.
 
+        The request goes to the REST API over the shared HTTP session, so connections
+        are reused and transient failures are retried.
+
         Args:
             ticker (str): The stock ticker symbol (e.g., "AAPL").
+            start_date (str, optional): The first date to fetch in YYYY-MM-DD format.
+                                        Defaults to the data source's start_date.
 
         Returns:
-            list: A list of historical stock data points (e.g., OHLC prices) as dictionaries.
+            pd.DataFrame: The JSON records indexed by date.
+        """
+        data = HttpUtil.get_json(self.EOD_URL.format(ticker=ticker), params=self._eod_params(start_date))
+
+        return self._to_frame(ticker, data)
+
+    async def _afetch_data_from_source(self, ticker, session, start_date=None) -> pd.DataFrame:
         """
-        df = self.api_client.get_historical_data(
-            ticker,
-            "d",
-            self.start_date,
-            self.end_date,
+        Fetch historical stock data from the EODHD REST API over aiohttp.
+
+        Returns the same DataFrame as _fetch_data_from_source.
+        """
+        data = await HttpUtil.aget_json(
+            session, self.EOD_URL.format(ticker=ticker), params=self._eod_params(start_date)
         )
 
+        return self._to_frame(ticker, data)
+
+    def _eod_params(self, start_date=None) -> dict:
+        return {
+            "api_token": self.api_key,
+            "fmt": "json",
+            "period": "d",
+            "from": start_date or self.start_date,
+            "to": self.end_date,
+        }
+
+    @staticmethod
+    def _to_frame(ticker, data) -> pd.DataFrame:
+        """Index the JSON records by date, with the columns the eodhd client returned."""
+        df = pd.DataFrame(data)
+        if df.empty:
+            return pd.DataFrame(
+                columns=["symbol", "interval", "open", "high", "low", "close", "adjusted_close", "volume"]
+            )
+
+        df = df.set_index("date")
+        df.index = pd.to_datetime(df.index)
+        df["symbol"] = ticker
+        df["interval"] = "d"
+
         return df
 
+    def _fetch_last_day_from_source(self, tickers: list, exchange: str) -> tuple:
+        """
+        Fetch the last trading day of an exchange with the bulk endpoint, plus the
+        exchange's splits and dividends of that day.
+
+        Tickers may be given as 'AAPL' or 'AAPL.US'. Both are matched against the
+        exchange's codes.
+
+        Returns:
+            tuple: (snapshot, corporate_actions), see BaseDataSource._fetch_last_day_from_source.
+        """
+        wanted = {}
+        for ticker in tickers:
+            code, _, ticker_exchange = ticker.partition(".")
+            if ticker_exchange in ("", exchange):
+                wanted[code] = ticker
+
+        prices = self._get_bulk_last_day(exchange)
+        snapshot = {}
+        for record in prices:
+            ticker = wanted.get(record["code"])
+            if ticker is None:
+                continue
+            df = pd.DataFrame([record]).drop(columns=["code", "exchange_short_name"], errors="ignore")
+            df = df.set_index("date")
+            df.index = pd.to_datetime(df.index)
+            df["symbol"] = ticker
+            snapshot[ticker] = df
+
+        corporate_actions = set()
+        for action in ("splits", "dividends"):
+            for record in self._get_bulk_last_day(exchange, action):
+                ticker = wanted.get(record["code"])
+                if ticker in snapshot:
+                    corporate_actions.add(ticker)
+
+        return snapshot, corporate_actions
+
+    def _get_bulk_last_day(self, exchange: str, action: str = None) -> list:
+        """Request the bulk last day endpoint, counting against the rate limit."""
+        params = {"api_token": self.api_key, "fmt": "json"}
+        if action is not None:
+            params["type"] = action
+
+        with self._concurrency_semaphore():
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            return HttpUtil.get_json(self.BULK_LAST_DAY_URL.format(exchange=exchange), params=params)
+
 
 DataSourceFactory.register_data_source(EODHDDataSource)
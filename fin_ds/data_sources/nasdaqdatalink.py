@@ -1,7 +1,14 @@
+import copy
+import json
+import logging
+
 import pandas as pd
 
 from fin_ds.data_source_factory import DataSourceFactory
 from fin_ds.data_sources.base_data_source import BaseDataSource
+from fin_ds.utils.http_util import HttpUtil
+
+logger = logging.getLogger(__name__)
 
 
 class NasdaqDataLinkDataSource(BaseDataSource):
@@ -22,6 +29,15 @@ class NasdaqDataLinkDataSource(BaseDataSource):
     # using the NASDAQ_DATA_LINK_API_KEY environment variable.
     api_key_required = False
 
+    TABLE = "QUOTEMEDIA/PRICES"
+
+    # get_eod_data_many fetches the tickers missing from the cache with bulk queries
+    supports_batch_fetch = True
+
+    # The number of tickers requested per paginated bulk query. The rows of a chunk are
+    # held until its last page has arrived, so this bounds the memory of a bulk fetch.
+    BULK_CHUNK_SIZE = 50
+
     # All of the columns are already in the correct format, so we don't need to map any of them.
     COLUMN_MAPPINGS = {}
 
@@ -78,10 +94,14 @@ class NasdaqDataLinkDataSource(BaseDataSource):
         import nasdaqdatalink
 
         ticker = ticker.replace("-", "_")
-        df = nasdaqdatalink.get_table(
-            "QUOTEMEDIA/PRICES",
-            ticker=[f"{ticker}"],
-            paginate=True,
+        df = HttpUtil.call_client(
+            "nasdaqdatalink",
+            f"get_table {self.TABLE} ticker={ticker}",
+            lambda: nasdaqdatalink.get_table(
+                self.TABLE,
+                ticker=[f"{ticker}"],
+                paginate=True,
+            ),
         )
 
         # All the other data sources return a DataFrame with a "date" column
@@ -90,5 +110,102 @@ class NasdaqDataLinkDataSource(BaseDataSource):
 
         return df
 
+    def fetch_bulk(self, tickers: list, start_date: str = None, chunk_size: int = None) -> list:
+        """
+        Fetch many tickers with paginated multi-ticker table queries and write each
+        ticker straight into its cache entry.
+
+        Pages are split by ticker as they arrive. Only the rows of the current chunk of
+        tickers are held in memory, never the concatenated result of the whole fetch.
+
+        Args:
+            tickers (list): The stock ticker symbols to fetch.
+            start_date (str, optional): Only fetch the bars from this date onwards and merge
+                                        them into the cached data. Tickers that are not
+                                        cached, or whose history changed, are fetched in full.
+            chunk_size (int, optional): The number of tickers per query. Defaults to
+                                        BULK_CHUNK_SIZE.
+
+        Returns:
+            list: The tickers that were fetched and cached.
+        """
+        cached = []
+        refetch = []
+        for ticker, source_df in self._fetch_bulk(tickers, start_date, chunk_size):
+            if self._store_fetched_data(ticker, source_df, incremental=start_date is not None) is None:
+                refetch.append(ticker)
+            else:
+                cached.append(ticker)
+
+        if refetch:
+            logger.info(f"Fetching full history for {len(refetch)} tickers after a bulk update.")
+            cached.extend(self.fetch_bulk(refetch, chunk_size=chunk_size))
+
+        missing = set(tickers) - set(cached)
+        if missing:
+            logger.warning(f"No data returned for {', '.join(sorted(missing))}.")
+
+        return cached
+
+    def _fetch_many_from_source(self, tickers: list):
+        return self._fetch_bulk(tickers)
+
+    def _fetch_bulk(self, tickers: list, start_date: str = None, chunk_size: int = None):
+        """
+        Yield (ticker, raw DataFrame) pairs for many tickers, one chunk of tickers per
+        paginated query. A ticker is yielded once the last page of its chunk has arrived.
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        tickers = list(dict.fromkeys(tickers))
+
+        for start in range(0, len(tickers), chunk_size):
+            chunk = tickers[start : start + chunk_size]
+            # The table uses underscores where other sources use dashes
+            source_tickers = {ticker.replace("-", "_"): ticker for ticker in chunk}
+
+            options = {"ticker": list(source_tickers)}
+            if start_date is not None:
+                options["date"] = {"gte": start_date}
+
+            pieces = {}
+            for page_df in self._fetch_table_pages(options):
+                for source_ticker, ticker_df in page_df.groupby("ticker", sort=False):
+                    pieces.setdefault(source_ticker, []).append(ticker_df)
+
+            for source_ticker, ticker_pieces in pieces.items():
+                ticker = source_tickers.get(source_ticker, source_ticker)
+                df = pd.concat(ticker_pieces) if len(ticker_pieces) > 1 else ticker_pieces[0]
+                yield ticker, df.set_index("date")
+
+    def _fetch_table_pages(self, options: dict):
+        """
+        Yield the pages of a table query as DataFrames, following the cursor until the
+        last page. Each page request respects the rate limit and concurrency limit.
+        """
+        # Lazy load the library to avoid importing it if not needed
+        import nasdaqdatalink
+
+        def fetch_page(params):
+            page = nasdaqdatalink.Datatable(self.TABLE).data(params=params)
+            return page.to_pandas(), page.meta["next_cursor_id"]
+
+        options = copy.deepcopy(options)
+        while True:
+            with self._concurrency_semaphore():
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                params = copy.deepcopy(options)
+                page_df, next_cursor_id = HttpUtil.call_client(
+                    "nasdaqdatalink",
+                    f"Datatable {self.TABLE} {json.dumps(params, sort_keys=True)}",
+                    lambda: fetch_page(params),
+                )
+
+            yield page_df
+
+            if next_cursor_id is None:
+                break
+            options["qopts.cursor_id"] = next_cursor_id
+
 
 DataSourceFactory.register_data_source(NasdaqDataLinkDataSource)
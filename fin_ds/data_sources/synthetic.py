@@ -0,0 +1,346 @@
+import asyncio
+import functools
+import logging
+import random
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import MO
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+
+from fin_ds.data_source_factory import DataSourceFactory
+from fin_ds.data_sources.base_data_source import BaseDataSource
+
+logger = logging.getLogger(__name__)
+
+
+class ExchangeHolidayCalendar(AbstractHolidayCalendar):
+    """
+    The regular full-day holidays of the NYSE. One-off closures, e.g. for national
+    days of mourning, are not included.
+    """
+
+    rules = [
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        Holiday(
+            "Martin Luther King Jr. Day",
+            start_date="1998-01-01",
+            month=1,
+            day=1,
+            offset=pd.DateOffset(weekday=MO(3)),
+        ),
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", start_date="2022-01-01", month=6, day=19, observance=nearest_workday),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas Day", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+@functools.lru_cache(maxsize=16)
+def trading_days(first_date: str, end_date: str) -> pd.DatetimeIndex:
+    """
+    Returns the weekdays from first_date through end_date that are not exchange holidays.
+    """
+    holidays = ExchangeHolidayCalendar().holidays(first_date, end_date)
+    return pd.bdate_range(first_date, end_date, freq="C", holidays=holidays, name="date")
+
+
+class SyntheticDataSource(BaseDataSource):
+    """
+    A data source that generates deterministic daily histories instead of calling an API,
+    for load testing the caching, concurrency and batch features without a network.
+
+    Any ticker symbol is accepted. Each ticker's history is derived from its symbol and
+    the seed, so the same ticker and seed always give the same bars, and a history fetched
+    later only adds bars after the earlier one ended. Tickers list on different dates,
+    follow a random walk with overnight gaps, trade on the exchange calendar and have
+    occasional missing bars. Prices are split 2-for-1 when they get high, and about half
+    of the tickers pay quarterly dividends. Adjusted prices account for both.
+
+    Upstream behaviour is simulated per request: set latency, latency_jitter and
+    error_rate on the instance, e.g. data_source.latency = 0.05.
+
+    Attributes:
+        COLUMN_MAPPINGS (dict): A dictionary mapping generated column names to custom column names.
+        COLUMN_ORDER (list): A list defining the order of columns in the resulting DataFrame.
+    """
+
+    api_key_required = False
+
+    supports_start_date = True
+
+    # Every chunk of BULK_CHUNK_SIZE tickers counts as one simulated request
+    supports_batch_fetch = True
+    BULK_CHUNK_SIZE = 100
+
+    # The last day of any tickers is available as one simulated request
+    supports_bulk_daily = True
+
+    # The first trading day. Histories never start earlier, whatever start_date is.
+    FIRST_DATE = "1990-01-02"
+
+    # Tickers list within this many trading days of FIRST_DATE
+    MAX_LISTING_OFFSET = 30 * 252
+
+    # A ticker is split 2-for-1 when its close has reached this price
+    SPLIT_PRICE = 500.0
+
+    # The probability of an overnight price jump, and of a bar missing from the history
+    GAP_RATE = 0.004
+    MISSING_RATE = 0.001
+
+    # The seed combined with each ticker symbol. Change it for a different market.
+    seed = 0
+
+    # The mean delay of a request in seconds, and the fraction by which it varies either way
+    latency = 0.0
+    latency_jitter = 0.0
+
+    # The fraction of requests that fail with a ConnectionError after their delay
+    error_rate = 0.0
+
+    # All of the columns are already in the correct format, so we don't need to map any of them.
+    COLUMN_MAPPINGS = {}
+
+    COLUMN_ORDER = [
+        "ticker",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "adj_open",
+        "adj_high",
+        "adj_low",
+        "adj_close",
+        "adj_volume",
+        "dividend",
+        "split",
+    ]
+
+    def __init__(self, name, api_key):
+        """
+        Initialize a synthetic data source object.
+
+        Args:
+            name (str): The name of the data source.
+            api_key (str): Unused, no API key is required.
+
+        Returns:
+            None
+        """
+        # Call the base class __init__
+        super().__init__(name)
+
+        # Draws the simulated latencies and errors. Separate from the histories, so
+        # injected errors never change the data.
+        self._random = random.Random(self.seed)
+        self._random_lock = threading.Lock()
+
+    @staticmethod
+    def universe(size: int, prefix: str = "SYN") -> list:
+        """
+        Returns the ticker symbols of a synthetic universe, e.g. ['SYN00000', 'SYN00001'].
+
+        Args:
+            size (int): The number of tickers.
+            prefix (str, optional): The prefix of the symbols.
+
+        Returns:
+            list: The ticker symbols.
+        """
+        return [f"{prefix}{number:05d}" for number in range(size)]
+
+    def _fetch_data_from_source(self, ticker: str, start_date: str = None) -> pd.DataFrame:
+        """
+        Generate the historical stock data of a ticker after a simulated request delay.
+
+        Args:
+            ticker (str): The stock ticker symbol (e.g., "AAPL").
+            start_date (str, optional): The first date to return in YYYY-MM-DD format.
+                                        Defaults to the data source's start_date.
+
+        Returns:
+            pd.DataFrame: The bars from the ticker's listing, or start_date, through end_date.
+
+        Raises:
+            ConnectionError: If the simulated request fails.
+        """
+        self._simulate_request(ticker)
+        return self._generate(ticker, start_date)
+
+    async def _afetch_data_from_source(
+        self, ticker: str, session, start_date: str = None
+    ) -> pd.DataFrame:
+        # Wait without holding a worker thread, so many requests can be in flight
+        delay, error = self._next_request()
+        await asyncio.sleep(delay)
+        if error:
+            raise ConnectionError(f"Simulated error fetching {ticker} from {self.name}.")
+        return await asyncio.to_thread(self._generate, ticker, start_date)
+
+    def _fetch_many_from_source(self, tickers: list):
+        for start in range(0, len(tickers), self.BULK_CHUNK_SIZE):
+            chunk = tickers[start : start + self.BULK_CHUNK_SIZE]
+            with self._concurrency_semaphore():
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                self._simulate_request(f"{len(chunk)} tickers")
+
+            for ticker in chunk:
+                df = self._generate(ticker)
+                if not df.empty:
+                    yield ticker, df
+
+    def _fetch_last_day_from_source(self, tickers: list, exchange: str) -> tuple:
+        """
+        Generate the last trading day of the given tickers as one simulated request.
+        The exchange is ignored, every ticker trades on the same calendar.
+
+        Returns:
+            tuple: (snapshot, corporate_actions), see BaseDataSource._fetch_last_day_from_source.
+        """
+        with self._concurrency_semaphore():
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            self._simulate_request(f"the {exchange} snapshot")
+
+        snapshot = {}
+        corporate_actions = set()
+        for ticker in tickers:
+            df = self._generate(ticker).iloc[-1:]
+            if df.empty:
+                continue
+            snapshot[ticker] = df
+            if df["dividend"].iloc[0] != 0 or df["split"].iloc[0] != 1:
+                corporate_actions.add(ticker)
+
+        return snapshot, corporate_actions
+
+    def _next_request(self) -> tuple:
+        """Draw the delay in seconds and whether the next simulated request fails."""
+        with self._random_lock:
+            jitter = self._random.uniform(-self.latency_jitter, self.latency_jitter)
+            error = self.error_rate > 0 and self._random.random() < self.error_rate
+        return max(self.latency * (1 + jitter), 0.0), error
+
+    def _simulate_request(self, what: str) -> None:
+        delay, error = self._next_request()
+        if delay:
+            time.sleep(delay)
+        if error:
+            raise ConnectionError(f"Simulated error fetching {what} from {self.name}.")
+
+    def _generate(self, ticker: str, start_date: str = None) -> pd.DataFrame:
+        """
+        Generate the history of a ticker through end_date.
+
+        The random draws are made per trading day from FIRST_DATE, so a later end_date
+        only appends bars. Adjusted prices are the exception: like a vendor's, they are
+        revised when a later bar has a split or dividend.
+        """
+        ticker_seed = [self.seed, zlib.crc32(ticker.encode())]
+        days = trading_days(self.FIRST_DATE, self.end_date)
+
+        # The ticker's characteristics
+        rng = np.random.default_rng([*ticker_seed, 0])
+        listing = int(rng.integers(0, self.MAX_LISTING_OFFSET)) if rng.random() < 0.7 else 0
+        volatility = rng.uniform(0.01, 0.03)
+        drift = rng.uniform(-0.0002, 0.0004)
+        first_close = np.exp(rng.uniform(np.log(5), np.log(200)))
+        mean_volume = np.exp(rng.uniform(np.log(1e5), np.log(5e7)))
+        dividend_yield = rng.uniform(0.005, 0.04) if rng.random() < 0.5 else 0.0
+        dividend_offset = int(rng.integers(1, 64))
+
+        days = days[listing:]
+        rows = len(days)
+        if rows == 0:
+            return self._empty_frame()
+
+        # Each generator draws one row per day, so the draws of a day never depend on the
+        # length of the history
+        normal = np.random.default_rng([*ticker_seed, 1]).standard_normal((rows, 6))
+        uniform = np.random.default_rng([*ticker_seed, 2]).random((rows, 2))
+
+        jump = np.where(uniform[:, 0] < self.GAP_RATE, 5 * volatility * normal[:, 1], 0.0)
+        overnight = 0.3 * volatility * normal[:, 0] + jump
+        intraday = drift + volatility * normal[:, 2]
+        log_close = np.log(first_close) + np.cumsum(overnight + intraday)
+        log_open = log_close - intraday
+
+        # Splits take effect on the day after the close reaches SPLIT_PRICE
+        splits_to_date = np.floor(np.log2(np.maximum.accumulate(np.exp(log_close)) / self.SPLIT_PRICE)) + 1
+        splits_to_date = np.concatenate(([0.0], np.maximum(splits_to_date, 0)[:-1]))
+        split = 2.0 ** np.diff(splits_to_date, prepend=0.0)
+        split_divisor = 2.0**splits_to_date
+
+        close = np.maximum(np.round(np.exp(log_close) / split_divisor, 2), 0.01)
+        open_ = np.maximum(np.round(np.exp(log_open) / split_divisor, 2), 0.01)
+        high = np.round(np.maximum(open_, close) * np.exp(0.5 * volatility * np.abs(normal[:, 3])), 2)
+        low = np.maximum(
+            np.round(np.minimum(open_, close) * np.exp(-0.5 * volatility * np.abs(normal[:, 4])), 2), 0.01
+        )
+        volume = np.round(mean_volume * np.exp(0.4 * normal[:, 5] + 10 * np.abs(jump)))
+
+        # The previous close in the shares of each day, after a split on that day
+        previous_close = np.concatenate(([close[0]], close[:-1])) / split
+
+        # Quarterly dividends of a quarter of the yield on the previous close
+        dividend = np.zeros(rows)
+        if dividend_yield:
+            ex_dates = np.arange(dividend_offset, rows, 63)
+            dividend[ex_dates] = np.round(dividend_yield / 4 * previous_close[ex_dates], 2)
+
+        # Adjust for the splits and dividends after each day, like CRSP
+        dividend_factor = 1 - dividend / previous_close
+        later_dividends = np.cumprod(dividend_factor[::-1])[::-1] / dividend_factor
+        later_splits = 2.0 ** (splits_to_date[-1] - splits_to_date)
+        price_factor = later_dividends / later_splits
+
+        df = pd.DataFrame(
+            {
+                "ticker": ticker,
+                "open": open_,
+                "high": high,
+                "low": low,
+                "close": close,
+                "volume": volume,
+                "adj_open": open_ * price_factor,
+                "adj_high": high * price_factor,
+                "adj_low": low * price_factor,
+                "adj_close": close * price_factor,
+                "adj_volume": volume * later_splits,
+                "dividend": dividend,
+                "split": split,
+            },
+            index=days,
+            columns=self.COLUMN_ORDER,
+        )
+
+        # Vendors miss the odd bar, but never a corporate action
+        missing = (uniform[:, 1] < self.MISSING_RATE) & (dividend == 0) & (split == 1)
+        start = pd.Timestamp(start_date or self.start_date)
+        return df[~missing & (days >= start)]
+
+    def _empty_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(columns=self.COLUMN_ORDER, index=pd.DatetimeIndex([], name="date"))
+
+
+DataSourceFactory.register_data_source(SyntheticDataSource)
@@ -2,6 +2,7 @@ import pandas as pd
 
 from fin_ds.data_source_factory import DataSourceFactory
 from fin_ds.data_sources.base_data_source import BaseDataSource
+from fin_ds.utils.http_util import HttpUtil
 
 
 class TiingoDataSource(BaseDataSource):
@@ -17,6 +18,17 @@ class TiingoDataSource(BaseDataSource):
 
     """
 
+    # Tiingo accepts a startDate so incremental updates only request new bars
+    supports_start_date = True
+
+    # Free tier quotas
+    RATE_LIMITS = {"hour": 50, "day": 1000}
+
+    # aget_eod_data calls the REST API directly over aiohttp
+    async_http = True
+
+    PRICES_URL = "https://api.tiingo.com/tiingo/daily/{ticker}/prices"
+
     COLUMN_MAPPINGS = {
         "adjClose": "adj_close",
         "adjHigh": "adj_high",
@@ -57,21 +69,29 @@ class TiingoDataSource(BaseDataSource):
         # Call the base class __init__
         super().__init__(name)
 
+        self.api_key = api_key
+
         # Lazy load the library to avoid importing it if not needed
         from tiingo import TiingoClient
 
-        tiingo_config = {"session": True, "api_key": api_key}
+        tiingo_config = {"session": False, "api_key": api_key}
         self.api_client = TiingoClient(tiingo_config)
+        # Send the client's requests over the shared, retrying connection pool. The shared
+        # session lives as long as the process, and HttpUtil.configure and the replay
+        # transport remount its adapters, so the client picks up their changes.
+        self.api_client._session = HttpUtil.session()
 
-    def _fetch_data_from_source(self, ticker: str) -> pd.DataFrame:
+    def _fetch_data_from_source(self, ticker: str, start_date: str = None) -> pd.DataFrame:
         """
         Fetch historical stock data for a given ticker symbol from the Tiingo API.
 
-        This method currently uses a hardcoded date range from 1950-01-01 to 2024-12-31.
+        The date range defaults to the data source's start_date through end_date.
         The frequency of the data is set to daily.
 
         Args:
             ticker (str): The stock ticker symbol (e.g., "AAPL").
+            start_date (str, optional): The first date to fetch in YYYY-MM-DD format.
+                                        Defaults to the data source's start_date.
 
         Returns:
             pd.DataFrame: A DataFrame containing the historical stock data. Each row represents a day,
@@ -80,12 +100,37 @@ class TiingoDataSource(BaseDataSource):
         df = self.api_client.get_dataframe(
             ticker,
             fmt="json",
-            startDate=self.start_date,
+            startDate=start_date or self.start_date,
             endDate=self.end_date,
             frequency="daily",
         )
 
         return df
 
+    async def _afetch_data_from_source(self, ticker: str, session, start_date: str = None) -> pd.DataFrame:
+        """
+        Fetch historical stock data from the Tiingo REST API over aiohttp.
+
+        Returns the same DataFrame as _fetch_data_from_source: the JSON records indexed by date.
+        """
+        params = {
+            "startDate": start_date or self.start_date,
+            "endDate": self.end_date,
+            "format": "json",
+            "resampleFreq": "daily",
+        }
+        headers = {
+            "Authorization": f"Token {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        data = await HttpUtil.aget_json(
+            session, self.PRICES_URL.format(ticker=ticker), params=params, headers=headers
+        )
+
+        df = pd.DataFrame(data).set_index("date")
+        df.index = pd.to_datetime(df.index)
+
+        return df
+
 
 DataSourceFactory.register_data_source(TiingoDataSource)
@@ -2,12 +2,20 @@ import pandas as pd
 
 from fin_ds.data_source_factory import DataSourceFactory
 from fin_ds.data_sources.base_data_source import BaseDataSource
+from fin_ds.utils.http_util import HttpUtil
 
 
 class YFinanceDataSource(BaseDataSource):
     # Set this to False if no api key is required
     api_key_required = False
 
+    # get_eod_data_many downloads the tickers missing from the cache in batches
+    supports_batch_fetch = True
+
+    # The number of tickers per yfinance.download call. yfinance downloads the tickers
+    # of a call with its own threads.
+    BATCH_SIZE = 100
+
     COLUMN_MAPPINGS = {
         "Date": "date",
         "Open": "open",
@@ -45,9 +53,54 @@ class YFinanceDataSource(BaseDataSource):
         # Lazy load the library to avoid importing it if not needed
         import yfinance as api_client
 
-        df = api_client.download(ticker, interval="1d", progress=False)
+        df = HttpUtil.call_client(
+            "yfinance",
+            f"download {ticker}",
+            lambda: api_client.download(ticker, interval="1d", progress=False),
+        )
 
         return df
 
+    def _fetch_many_from_source(self, tickers: list):
+        """
+        Download the tickers in chunks of BATCH_SIZE per yfinance.download call and
+        split each result into one DataFrame per ticker.
+
+        Args:
+            tickers (list): The stock ticker symbols to fetch.
+
+        Yields:
+            tuple: (ticker, DataFrame) pairs. Tickers without data are skipped.
+        """
+        # Lazy load the library to avoid importing it if not needed
+        import yfinance as api_client
+
+        for start in range(0, len(tickers), self.BATCH_SIZE):
+            chunk = list(tickers[start : start + self.BATCH_SIZE])
+            with self._concurrency_semaphore():
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                df = HttpUtil.call_client(
+                    "yfinance",
+                    f"download {' '.join(chunk)} group_by=ticker",
+                    lambda: api_client.download(
+                        chunk, interval="1d", group_by="ticker", threads=True, progress=False
+                    ),
+                )
+
+            for ticker in chunk:
+                if isinstance(df.columns, pd.MultiIndex):
+                    if ticker not in df.columns.get_level_values(0):
+                        continue
+                    ticker_df = df[ticker]
+                else:
+                    # A single ticker is returned without a ticker level
+                    ticker_df = df
+
+                # Tickers share the index of the download, so drop the dates they lack
+                ticker_df = ticker_df.dropna(how="all")
+                if not ticker_df.empty:
+                    yield ticker, ticker_df
+
 
 DataSourceFactory.register_data_source(YFinanceDataSource)
@@ -0,0 +1,237 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
+
+
+class AggregationUtil:
+    """
+    Aggregates daily OHLCV data into longer intervals.
+
+    Every column is reduced with the reducer that matches its meaning, e.g. the first
+    open, the highest high and the summed volume of a period. The period bins of a
+    calendar are computed once and cached, so every ticker sharing that calendar is
+    aggregated with a single grouped reduction and no further resampling.
+    """
+
+    INTERVALS = {
+        "daily": None,
+        "weekly": "W",
+        "monthly": "ME",
+        "quarterly": "QE",
+        "yearly": "YE",
+    }
+
+    REDUCERS = {
+        "open": "first",
+        "high": "max",
+        "low": "min",
+        "close": "last",
+        "volume": "sum",
+        "adj_open": "first",
+        "adj_high": "max",
+        "adj_low": "min",
+        "adj_close": "last",
+        "adj_volume": "sum",
+        "dividend": "sum",
+        "split": "prod",
+    }
+
+    # Columns without a reducer, e.g. ticker, keep their last value
+    DEFAULT_REDUCER = "last"
+
+    MAX_CACHED_BINS = 256
+
+    # Class variable for the period bins cached per calendar and frequency
+    _bins = OrderedDict()
+    _bins_lock = threading.Lock()
+
+    @classmethod
+    def resolve_freq(cls, interval: str):
+        """
+        Resolves an interval to a pandas frequency.
+
+        Parameters:
+        interval: A named interval ('daily', 'weekly', 'monthly', 'quarterly', 'yearly')
+                  or a pandas offset alias with a custom anchor, e.g. 'W-FRI' or 'QE-JUN'.
+
+        Returns:
+        str: The frequency, or None for daily data.
+        """
+        if interval in cls.INTERVALS:
+            return cls.INTERVALS[interval]
+
+        try:
+            to_offset(interval)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Unsupported interval: {interval}. Supported intervals are "
+                f"{', '.join(repr(name) for name in cls.INTERVALS)} or a pandas offset alias."
+            ) from None
+        return interval
+
+    @classmethod
+    def period_bins(cls, index: pd.DatetimeIndex, freq: str) -> tuple:
+        """
+        Computes which period each date of a sorted calendar falls into.
+
+        Parameters:
+        index: The sorted DatetimeIndex of the daily data.
+        freq: The pandas frequency of the periods.
+
+        Returns:
+        tuple: (codes, labels) where codes holds the period number of every date and
+        labels is the DatetimeIndex of all periods, including empty ones.
+        """
+        index = pd.DatetimeIndex(index)
+        digest = hashlib.blake2b(np.ascontiguousarray(index.asi8).tobytes(), digest_size=16).digest()
+        key = (freq, len(index), digest)
+
+        with cls._bins_lock:
+            bins = cls._bins.get(key)
+            if bins is not None:
+                cls._bins.move_to_end(key)
+                return bins
+
+        # One resample of the calendar yields the period labels and the number of dates
+        # in each period, from which every date's period follows
+        counts = pd.Series(0, index=index).resample(freq).count()
+        codes = np.repeat(np.arange(len(counts)), counts.to_numpy())
+        bins = (codes, counts.index)
+
+        with cls._bins_lock:
+            cls._bins[key] = bins
+            while len(cls._bins) > cls.MAX_CACHED_BINS:
+                cls._bins.popitem(last=False)
+        return bins
+
+    @classmethod
+    def aggregate(cls, df: pd.DataFrame, interval: str) -> pd.DataFrame:
+        """
+        Aggregates a daily DataFrame to an interval.
+
+        Parameters:
+        df: The daily DataFrame with a DatetimeIndex.
+        interval: The interval, see resolve_freq.
+
+        Returns:
+        pd.DataFrame: The aggregated DataFrame, indexed by period end with its freq set.
+        """
+        freq = cls.resolve_freq(interval)
+        if freq is None:
+            return df
+
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+
+        codes, labels = cls.period_bins(df.index, freq)
+        reducers = {column: cls.REDUCERS.get(column, cls.DEFAULT_REDUCER) for column in df.columns}
+        aggregated = df.groupby(codes, sort=False).agg(reducers)
+
+        # Periods without any data become empty rows so the index keeps its freq
+        aggregated = aggregated.reindex(np.arange(len(labels)))
+        aggregated.index = labels.rename(df.index.name)
+        return aggregated
+
+    @classmethod
+    def aggregate_many(cls, frames: dict, interval: str) -> dict:
+        """
+        Aggregates several daily DataFrames to an interval with a single grouped reduction.
+
+        The frames are concatenated, every row is assigned its ticker and the period of its
+        date on the union of all calendars, and the rows are reduced with one groupby on
+        (ticker, period). Each ticker gets the periods from its first to its last date, as
+        with aggregate.
+
+        Parameters:
+        frames: The daily DataFrames with a DatetimeIndex, keyed by ticker.
+        interval: The interval, see resolve_freq.
+
+        Returns:
+        dict: The aggregated DataFrames, keyed by ticker.
+        """
+        freq = cls.resolve_freq(interval)
+        if freq is None:
+            return dict(frames)
+
+        # Tick frequencies such as '5D' bin relative to the first date of each frame, so
+        # they cannot share the bins of the union calendar
+        if isinstance(to_offset(freq), Tick):
+            return {ticker: cls.aggregate(df, interval) for ticker, df in frames.items()}
+
+        frames = {
+            ticker: df if df.index.is_monotonic_increasing else df.sort_index()
+            for ticker, df in frames.items()
+        }
+        nonempty = [ticker for ticker, df in frames.items() if len(df)]
+        if not nonempty:
+            return {ticker: cls.aggregate(df, interval) for ticker, df in frames.items()}
+
+        combined = pd.concat([frames[ticker] for ticker in nonempty], keys=range(len(nonempty)))
+        ticker_codes = combined.index.codes[0]
+        dates = pd.DatetimeIndex(combined.index.levels[1]).take(combined.index.codes[1])
+
+        calendar = dates.unique().sort_values()
+        calendar_codes, labels = cls.period_bins(calendar, freq)
+        bin_codes = calendar_codes[calendar.searchsorted(dates)]
+
+        reducers = {column: cls.REDUCERS.get(column, cls.DEFAULT_REDUCER) for column in combined.columns}
+        aggregated = combined.reset_index(drop=True).groupby([ticker_codes, bin_codes]).agg(reducers)
+
+        # The groups are sorted by ticker, so each ticker's periods are one slice
+        group_tickers = aggregated.index.get_level_values(0).to_numpy()
+        group_bins = aggregated.index.get_level_values(1).to_numpy()
+        bounds = np.searchsorted(group_tickers, np.arange(len(nonempty) + 1))
+
+        result = {}
+        for position, ticker in enumerate(nonempty):
+            df = frames[ticker]
+            start, end = bounds[position], bounds[position + 1]
+            first, last = group_bins[start], group_bins[end - 1]
+            ticker_df = aggregated.iloc[start:end][df.columns]
+            ticker_df.index = group_bins[start:end]
+            # Periods without any data become empty rows so the index keeps its freq
+            ticker_df = ticker_df.reindex(np.arange(first, last + 1))
+            ticker_df.index = labels[first : last + 1].rename(df.index.name)
+            result[ticker] = ticker_df
+
+        return {
+            ticker: result[ticker] if ticker in result else cls.aggregate(df, interval)
+            for ticker, df in frames.items()
+        }
+
+    @classmethod
+    def aggregate_panel(
+        cls, values: np.ndarray, index: pd.DatetimeIndex, fields: list, interval: str
+    ) -> tuple:
+        """
+        Aggregates a dense (date, field, ticker) panel to an interval with one grouped
+        reduction per field across all tickers.
+
+        Parameters:
+        values: The daily values shaped (date, field, ticker).
+        index: The sorted DatetimeIndex of the dates.
+        fields: The field names, used to pick each field's reducer.
+        interval: The interval, see resolve_freq.
+
+        Returns:
+        tuple: (values, index) of the aggregated panel.
+        """
+        freq = cls.resolve_freq(interval)
+        if freq is None:
+            return values, index
+
+        codes, labels = cls.period_bins(index, freq)
+        aggregated = np.full((len(labels), len(fields), values.shape[2]), np.nan, dtype=values.dtype)
+        for position, field in enumerate(fields):
+            reducer = cls.REDUCERS.get(field, cls.DEFAULT_REDUCER)
+            # Sums of periods without any data stay missing instead of becoming zero
+            kwargs = {"min_count": 1} if reducer in ("sum", "prod") else {}
+            reduced = pd.DataFrame(values[:, position, :]).groupby(codes).agg(reducer, **kwargs)
+            aggregated[reduced.index.to_numpy(), position, :] = reduced.to_numpy()
+
+        return aggregated, labels.rename(index.name)
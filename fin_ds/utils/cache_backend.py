@@ -0,0 +1,98 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pandas as pd
+
+
+class CacheBackend(ABC):
+    """
+    Storage format used by CacheUtil to read and write cached DataFrames.
+    Each backend owns a file extension so that entries written in different
+    formats can live side by side in the same cache directory.
+    """
+
+    extension = None
+
+    @abstractmethod
+    def read(self, cache_path: Path) -> pd.DataFrame:
+        """
+        Reads a cached DataFrame.
+
+        Parameters:
+        - cache_path: The Path object from which to load the data.
+
+        Returns:
+        - The cached data as a pandas DataFrame indexed by date.
+        """
+
+    @abstractmethod
+    def write(self, cache_path: Path, df: pd.DataFrame) -> None:
+        """
+        Writes a DataFrame to the cache.
+
+        Parameters:
+        - cache_path: The Path object where the data should be saved.
+        - df: The pandas DataFrame to save.
+        """
+
+
+class CSVCacheBackend(CacheBackend):
+    """
+    Legacy text format. Dtypes and the DatetimeIndex are not stored, so they
+    are re-inferred on every load.
+    """
+
+    extension = "csv"
+
+    def read(self, cache_path: Path) -> pd.DataFrame:
+        data = pd.read_csv(cache_path, index_col=0, parse_dates=True)
+
+        # Proactively cast float-like columns to float64
+        float_columns = data.select_dtypes(include=["float"]).columns
+        data[float_columns] = (
+            data[float_columns].apply(pd.to_numeric, errors="coerce").astype("float64")
+        )
+
+        return data
+
+    def write(self, cache_path: Path, df: pd.DataFrame) -> None:
+        df.to_csv(cache_path)
+
+
+class ParquetCacheBackend(CacheBackend):
+    """
+    Columnar binary format. Dtypes and the DatetimeIndex round-trip natively.
+    Requires pyarrow.
+    """
+
+    extension = "parquet"
+
+    def read(self, cache_path: Path) -> pd.DataFrame:
+        return pd.read_parquet(cache_path)
+
+    def write(self, cache_path: Path, df: pd.DataFrame) -> None:
+        df.to_parquet(cache_path)
+
+
+class FeatherCacheBackend(CacheBackend):
+    """
+    Arrow IPC (Feather) format. Fastest to load, but Feather only stores a
+    default index so the date index is written as the first column.
+    Requires pyarrow.
+    """
+
+    extension = "feather"
+
+    def read(self, cache_path: Path) -> pd.DataFrame:
+        data = pd.read_feather(cache_path)
+        return data.set_index(data.columns[0])
+
+    def write(self, cache_path: Path, df: pd.DataFrame) -> None:
+        df.reset_index().to_feather(cache_path)
+
+
+CACHE_BACKENDS = {
+    "csv": CSVCacheBackend(),
+    "parquet": ParquetCacheBackend(),
+    "feather": FeatherCacheBackend(),
+}
@@ -0,0 +1,341 @@
+import argparse
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+
+from fin_ds.utils.cache_backend import CACHE_BACKENDS
+from fin_ds.utils.cache_util import CacheUtil
+
+logger = logging.getLogger(__name__)
+
+
+class CacheManifest:
+    """
+    SQLite index of the entries in a cache directory.
+
+    Each entry records the data source, ticker, cache format, row count, first and
+    last date, column schema, fetch timestamp and size in bytes of a cache file. Lookups are a
+    single primary key query instead of an exists() and stat() per file, and the
+    staleness of a whole universe can be queried at once.
+    """
+
+    MANIFEST_FILE_NAME = "manifest.sqlite"
+
+    # SQLite limits the number of parameters in a single query
+    MAX_QUERY_PARAMETERS = 900
+
+    INSERT_SQL = (
+        "INSERT OR REPLACE INTO entries (data_source, ticker, cache_format, path, row_count, "
+        "first_date, last_date, schema, fetched_at, size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    # Class variable for the manifests shared per cache directory
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.cache_dir / self.MANIFEST_FILE_NAME
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.manifest_path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._connection.row_factory = sqlite3.Row
+        with self._lock:
+            # Caches are shared over network file systems, where WAL does not work as it
+            # needs shared memory. Setting the mode also converts manifests left in WAL mode.
+            self._connection.execute("PRAGMA journal_mode=DELETE")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    data_source TEXT NOT NULL,
+                    ticker TEXT NOT NULL,
+                    cache_format TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    row_count INTEGER NOT NULL,
+                    first_date TEXT,
+                    last_date TEXT,
+                    schema TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    size INTEGER,
+                    PRIMARY KEY (data_source, ticker, cache_format)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_fetched_at ON entries (fetched_at)"
+            )
+            # Manifests created before sizes were recorded get the column, empty until rebuilt
+            columns = {row["name"] for row in self._connection.execute("PRAGMA table_info(entries)")}
+            if "size" not in columns:
+                self._connection.execute("ALTER TABLE entries ADD COLUMN size INTEGER")
+
+    @classmethod
+    def for_cache_dir(cls, cache_dir: Union[str, Path]) -> "CacheManifest":
+        """
+        Returns the process-wide manifest for a cache directory, opening it on first use.
+
+        Parameters:
+        - cache_dir: The cache directory.
+
+        Returns:
+        - The CacheManifest for that directory.
+        """
+        key = str(Path(cache_dir).resolve())
+        with cls._instances_lock:
+            manifest = cls._instances.get(key)
+            if manifest is None:
+                manifest = cls(cache_dir)
+                cls._instances[key] = manifest
+            return manifest
+
+    def record(
+        self,
+        data_source: str,
+        ticker: str,
+        cache_format: str,
+        cache_path: Path,
+        df: pd.DataFrame,
+        fetched_at: float = None,
+        size: int = None,
+    ) -> float:
+        """
+        Adds or replaces the entry for a cache file that has just been written.
+
+        Parameters:
+        - data_source: The name of the data source.
+        - ticker: The ticker symbol.
+        - cache_format: The cache backend the file was written with.
+        - cache_path: The Path object of the cache file.
+        - df: The DataFrame that was written.
+        - fetched_at: Optional fetch timestamp in seconds since the epoch. Defaults to now.
+        - size: Optional size of the cache file in bytes.
+
+        Returns:
+        - The fetch timestamp that was recorded.
+        """
+        if fetched_at is None:
+            fetched_at = time.time()
+
+        row = self._row(data_source, ticker, cache_format, cache_path, df, fetched_at, size)
+        with self._lock:
+            self._connection.execute(self.INSERT_SQL, row)
+        return fetched_at
+
+    def get(self, data_source: str, ticker: str, cache_format: str) -> Union[dict, None]:
+        """
+        Looks up the entry for a cache file.
+
+        Returns:
+        - The entry as a dict, or None if the file is not in the manifest.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM entries WHERE data_source = ? AND ticker = ? AND cache_format = ?",
+                (data_source, ticker, cache_format),
+            ).fetchone()
+        return self._to_entry(row) if row is not None else None
+
+    def remove(self, data_source: str, ticker: str, cache_format: str) -> None:
+        """
+        Removes the entry for a cache file, e.g. after the file has disappeared.
+        """
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM entries WHERE data_source = ? AND ticker = ? AND cache_format = ?",
+                (data_source, ticker, cache_format),
+            )
+
+    def entries(self, data_source: str = None) -> list:
+        """
+        Returns every entry, optionally only for one data source.
+        """
+        query = "SELECT * FROM entries"
+        parameters = ()
+        if data_source is not None:
+            query += " WHERE data_source = ?"
+            parameters = (data_source,)
+
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY data_source, ticker", parameters)
+            return [self._to_entry(row) for row in rows.fetchall()]
+
+    def stale_entries(self, max_cache_age_in_hours: float, data_source: str = None) -> list:
+        """
+        Returns the entries older than the maximum cache age.
+
+        Parameters:
+        - max_cache_age_in_hours: The maximum allowed age of an entry in hours.
+        - data_source: Optional data source to restrict the query to.
+
+        Returns:
+        - A list of entry dicts.
+        """
+        query = "SELECT * FROM entries WHERE fetched_at < ?"
+        parameters = [time.time() - max_cache_age_in_hours * 3600]
+        if data_source is not None:
+            query += " AND data_source = ?"
+            parameters.append(data_source)
+
+        with self._lock:
+            rows = self._connection.execute(query + " ORDER BY data_source, ticker", parameters)
+            return [self._to_entry(row) for row in rows.fetchall()]
+
+    def stale_tickers(
+        self,
+        data_source: str,
+        tickers: list,
+        max_cache_age_in_hours: float,
+        cache_format: str = "csv",
+    ) -> list:
+        """
+        Returns the tickers of a universe that are missing from the cache or stale.
+
+        Parameters:
+        - data_source: The name of the data source.
+        - tickers: The ticker symbols to check.
+        - max_cache_age_in_hours: The maximum allowed age of an entry in hours.
+        - cache_format: The cache backend the entries are written with.
+
+        Returns:
+        - The tickers that need to be fetched, in the order given.
+        """
+        cutoff = time.time() - max_cache_age_in_hours * 3600
+        fresh = set()
+        with self._lock:
+            for start in range(0, len(tickers), self.MAX_QUERY_PARAMETERS):
+                chunk = list(tickers[start : start + self.MAX_QUERY_PARAMETERS])
+                placeholders = ", ".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT ticker FROM entries WHERE data_source = ? AND cache_format = ? "
+                    f"AND fetched_at >= ? AND ticker IN ({placeholders})",
+                    [data_source, cache_format, cutoff, *chunk],
+                )
+                fresh.update(row["ticker"] for row in rows.fetchall())
+        return [ticker for ticker in tickers if ticker not in fresh]
+
+    @staticmethod
+    def is_stale(entry: dict, max_cache_age_in_hours: float) -> bool:
+        """
+        Checks if a manifest entry is older than the maximum cache age.
+        """
+        return time.time() - entry["fetched_at"] > max_cache_age_in_hours * 3600
+
+    def rebuild(self) -> int:
+        """
+        Rebuilds the manifest from the cache files in the cache directory. Files must
+        follow the default '{data_source}-{ticker}.{extension}' naming. Each file is
+        loaded once to record its rows, dates and schema, and its modification time is
+        used as the fetch timestamp.
+
+        The files are loaded before the manifest is touched, and the entries are then
+        replaced in one transaction, so readers never see a partly rebuilt manifest.
+
+        Returns:
+        - The number of entries recorded.
+        """
+        formats_by_extension = {backend.extension: name for name, backend in CACHE_BACKENDS.items()}
+
+        rows = []
+        for cache_path in sorted(self.cache_dir.iterdir()):
+            cache_format = formats_by_extension.get(cache_path.suffix.lstrip("."))
+            if cache_format is None or cache_path.name.startswith(".") or "-" not in cache_path.stem:
+                continue
+
+            # Data source names never contain a dash, but tickers such as BRK-A can
+            data_source, ticker = cache_path.stem.split("-", 1)
+            try:
+                df = CacheUtil.load_from_cache(cache_path, cache_format)
+            except Exception as e:
+                logger.warning(f"Skipping unreadable cache file {cache_path}: {e}")
+                continue
+
+            stat = cache_path.stat()
+            rows.append(
+                self._row(data_source, ticker, cache_format, cache_path, df, stat.st_mtime, stat.st_size)
+            )
+
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute("DELETE FROM entries")
+                self._connection.executemany(self.INSERT_SQL, rows)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+        logger.info(f"Rebuilt manifest for {self.cache_dir} with {len(rows)} entries.")
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _row(
+        data_source: str,
+        ticker: str,
+        cache_format: str,
+        cache_path: Path,
+        df: pd.DataFrame,
+        fetched_at: float,
+        size: int = None,
+    ) -> tuple:
+        first_date, last_date = None, None
+        if len(df.index):
+            first_date = pd.Timestamp(df.index.min()).strftime("%Y-%m-%d")
+            last_date = pd.Timestamp(df.index.max()).strftime("%Y-%m-%d")
+        schema = json.dumps({str(column): str(dtype) for column, dtype in df.dtypes.items()})
+        return (
+            data_source,
+            ticker,
+            cache_format,
+            str(cache_path),
+            len(df),
+            first_date,
+            last_date,
+            schema,
+            fetched_at,
+            size,
+        )
+
+    @staticmethod
+    def _to_entry(row: sqlite3.Row) -> dict:
+        entry = dict(row)
+        entry["schema"] = json.loads(entry["schema"])
+        return entry
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the fin-ds cache manifest.")
+    parser.add_argument(
+        "--cache-dir", default="fin-ds-cache", help="The cache directory (default: fin-ds-cache)."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("rebuild", help="Rebuild the manifest from the cache files.")
+    stale_parser = subparsers.add_parser("stale", help="List the stale cache entries.")
+    stale_parser.add_argument("--max-age", type=float, default=12, help="Maximum age in hours.")
+    stale_parser.add_argument("--data-source", help="Only list entries for this data source.")
+    args = parser.parse_args(argv)
+
+    manifest = CacheManifest(args.cache_dir)
+    if args.command == "rebuild":
+        count = manifest.rebuild()
+        print(f"Recorded {count} cache entries in {manifest.manifest_path}")
+    else:
+        for entry in manifest.stale_entries(args.max_age, args.data_source):
+            print(f"{entry['data_source']}\t{entry['ticker']}\t{entry['last_date']}")
+    manifest.close()
+
+
+if __name__ == "__main__":
+    main()
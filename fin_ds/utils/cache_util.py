@@ -1,4 +1,7 @@
+import glob
 import logging
+import os
+import tempfile
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -6,6 +9,8 @@ from typing import Union
 
 import pandas as pd
 
+from fin_ds.utils.cache_backend import CACHE_BACKENDS, CacheBackend
+from fin_ds.utils.file_lock import FileLock
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +22,17 @@ class CacheUtil:
     loading data from cache, and saving data to cache.
     """
 
-    DEFAULT_CACHE_PATH_FORMAT = "fin-ds-cache/{data_source}-{ticker}.csv"
+    DEFAULT_CACHE_PATH_FORMAT = "fin-ds-cache/{data_source}-{ticker}.{extension}"
+
+    DEFAULT_CACHE_FORMAT = "csv"
 
     @classmethod
     def cache_path(
-        cls, data_source: str, ticker: str, cache_path_format: Union[str, None] = None
+        cls,
+        data_source: str,
+        ticker: str,
+        cache_path_format: Union[str, None] = None,
+        cache_format: str = DEFAULT_CACHE_FORMAT,
     ) -> Path:
         """
         Generates a cache path for the given data source and ticker.
@@ -30,6 +41,7 @@ class CacheUtil:
         - data_source: The source of the financial data.
         - ticker: The ticker symbol for the financial instrument.
         - cache_path_format: Optional format for the cache path.
+        - cache_format: The cache backend, which determines the file extension.
 
         Returns:
         - A Path object representing the cache path.
@@ -37,10 +49,35 @@ class CacheUtil:
         if cache_path_format is None:
             cache_path_format = cls.DEFAULT_CACHE_PATH_FORMAT
 
-        formatted_path_str = cache_path_format.format(data_source=data_source, ticker=ticker)
+        extension = cls.get_backend(cache_format).extension
+        formatted_path_str = cache_path_format.format(
+            data_source=data_source, ticker=ticker, extension=extension
+        )
 
         return Path(formatted_path_str)
 
+    @staticmethod
+    def get_backend(cache_format: str) -> CacheBackend:
+        """
+        Looks up the storage backend for a cache format.
+
+        Parameters:
+        - cache_format: The name of the cache format (e.g. 'csv', 'parquet', 'feather').
+
+        Returns:
+        - The CacheBackend that reads and writes that format.
+
+        Raises:
+        - ValueError: If the cache format is not supported.
+        """
+        try:
+            return CACHE_BACKENDS[cache_format]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported cache format: {cache_format}. "
+                f"Supported formats are {', '.join(CACHE_BACKENDS)}."
+            ) from None
+
     @staticmethod
     def is_cached(cache_path: Path) -> bool:
         """
@@ -78,12 +115,92 @@ class CacheUtil:
         return file_age > timedelta(hours=max_cache_age_in_hours)
 
     @staticmethod
-    def load_from_cache(cache_path: Path) -> pd.DataFrame:
+    def lock_path(cache_path: Path, purpose: str = "fetch") -> Path:
+        """
+        Generates the path of the lock file guarding a cache file.
+
+        Parameters:
+        - cache_path: The Path object representing the cache file.
+        - purpose: What the lock guards, so that independent locks do not block each other.
+
+        Returns:
+        - A Path object next to the cache file.
+        """
+        return cache_path.with_name(f"{cache_path.name}.{purpose}.lock")
+
+    @staticmethod
+    def derived_cache_path(cache_path: Path, name: str, fingerprint: str) -> Path:
+        """
+        Generates the path of a cache file derived from another cache file, such as
+        its monthly aggregate. Derived files live in a 'derived' directory next to the
+        source file and carry the fingerprint of the data they were derived from.
+
+        Parameters:
+        - cache_path: The Path object representing the source cache file.
+        - name: What was derived, e.g. 'monthly'.
+        - fingerprint: The fingerprint of the source data.
+
+        Returns:
+        - A Path object in the derived directory.
+        """
+        return cache_path.parent / "derived" / f"{cache_path.stem}.{name}.{fingerprint}{cache_path.suffix}"
+
+    @staticmethod
+    def remove_derived(cache_path: Path, name: str, keep: Path = None) -> int:
+        """
+        Removes the files derived from a cache file under a name, except one to keep.
+
+        Parameters:
+        - cache_path: The Path object representing the source cache file.
+        - name: What was derived, e.g. 'monthly'.
+        - keep: Optional derived file that is not removed.
+
+        Returns:
+        - The number of files removed.
+        """
+        derived_dir = cache_path.parent / "derived"
+        pattern = f"{glob.escape(cache_path.stem)}.{glob.escape(name)}.*{cache_path.suffix}"
+        removed = 0
+        for derived_path in derived_dir.glob(pattern):
+            # The fingerprint never contains a dot, which excludes longer names
+            fingerprint = derived_path.name[len(f"{cache_path.stem}.{name}.") : -len(cache_path.suffix)]
+            if derived_path == keep or "." in fingerprint:
+                continue
+            # The lock file of an outdated fingerprint is never used again
+            for path in (derived_path, CacheUtil.lock_path(derived_path, "io")):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            removed += 1
+        return removed
+
+    @staticmethod
+    def cache_version(cache_path: Path) -> int:
+        """
+        Returns a version for the cache data that changes whenever the file is rewritten.
+
+        Parameters:
+        - cache_path: The Path object representing the cache file.
+
+        Returns:
+        - The modification time of the cache file in nanoseconds.
+        """
+        return cache_path.stat().st_mtime_ns
+
+    @classmethod
+    def load_from_cache(
+        cls, cache_path: Path, cache_format: str = DEFAULT_CACHE_FORMAT
+    ) -> pd.DataFrame:
         """
         Loads data from cache.
 
+        The read holds a shared lock so that it never overlaps with a writer swapping in
+        a new file, which would otherwise fail on Windows.
+
         Parameters:
         - cache_path: The Path object from which to load the data.
+        - cache_format: The cache backend the data was saved with.
 
         Returns:
         - The data loaded from the cache as a pandas DataFrame.
@@ -91,14 +208,8 @@ class CacheUtil:
         logger.debug(f"Loading data from cache: {cache_path}")
         start_time = time.time()
         try:
-            data = pd.read_csv(cache_path, index_col=0, parse_dates=True)
-
-            # Proactively cast float-like columns to float64
-            float_columns = data.select_dtypes(include=["float"]).columns
-            data[float_columns] = (
-                data[float_columns].apply(pd.to_numeric, errors="coerce").astype("float64")
-            )
-
+            with FileLock(cls.lock_path(cache_path, "io"), shared=True):
+                data = cls.get_backend(cache_format).read(cache_path)
             logger.info(f"Data successfully loaded from {cache_path}")
         except Exception as e:
             logger.error(
@@ -110,24 +221,53 @@ class CacheUtil:
         logger.debug(f"load_from_cache() executed in {elapsed_time:.2f} seconds.")
         return data
 
-    @staticmethod
-    def save_to_cache(cache_path: Path, df: pd.DataFrame) -> None:
+    @classmethod
+    def save_to_cache(
+        cls, cache_path: Path, df: pd.DataFrame, cache_format: str = DEFAULT_CACHE_FORMAT
+    ) -> int:
         """
         Saves data to cache.
 
+        The data is written to a temporary file in the cache directory, which is then
+        renamed over the cache file. Readers therefore see either the old or the new
+        file, never a partially written one. Only the rename holds the exclusive lock.
+
         Parameters:
         - cache_path: The Path object where the data should be saved.
         - data: The pandas DataFrame to save to cache.
+        - cache_format: The cache backend to save the data with.
+
+        Returns:
+        - The size of the written file in bytes.
         """
         start_time = time.time()
         logger.info(f"Attempting to save data to cache: {cache_path}")
+        temp_path = None
         try:
             cache_directory = cache_path.parent
             cache_directory.mkdir(parents=True, exist_ok=True)
-            df.to_csv(cache_path)
+
+            # The temporary file must be in the same directory for the rename to be atomic
+            fd, temp_name = tempfile.mkstemp(
+                dir=cache_directory, prefix=f".{cache_path.name}.", suffix=".tmp"
+            )
+            os.close(fd)
+            temp_path = Path(temp_name)
+
+            cls.get_backend(cache_format).write(temp_path, df)
+            size = temp_path.stat().st_size
+
+            with FileLock(cls.lock_path(cache_path, "io")):
+                os.replace(temp_path, cache_path)
+            temp_path = None
+
             logger.info(f"Data successfully saved to {cache_path}")
         except Exception as e:
             logger.error(f"Failed to save data to cache: {e}", exc_info=True)
             raise
+        finally:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
         elapsed_time = time.time() - start_time
         logger.debug(f"save_to_cache() executed in {elapsed_time:.2f} seconds.")
+        return size
@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from pandas.api.types import pandas_dtype
 
 
 class DFUtil:
@@ -26,6 +28,8 @@ class DFUtil:
         #     if col in df2.columns:
         #         df2[col] = pd.to_numeric(df2[col], errors="coerce").astype("float64")
 
+        dtypes = df1.dtypes.to_dict()
+
         # Update df1 in-place with changed values from df2
         df1.update(df2)
 
@@ -41,41 +45,277 @@ class DFUtil:
         if not new_rows.empty:
             df1 = pd.concat([df1, new_rows]).sort_index()
 
-        return df1
+        # Keep the dtypes of df1, e.g. float32 and categorical columns of compact data
+        return DFUtil.apply_schema(df1, dtypes)
+
+    # Columns quoted in currency, which a splice rescales together
+    PRICE_COLUMNS = [
+        "open",
+        "high",
+        "low",
+        "close",
+        "adj_open",
+        "adj_high",
+        "adj_low",
+        "adj_close",
+        "dividend",
+    ]
+
+    @staticmethod
+    def convert(series: pd.Series, dtype) -> pd.Series:
+        """
+        Converts a Series to a dtype. Floats converted to integers are rounded first, and
+        Series with missing values are converted to the nullable integer dtype, e.g. Int64
+        instead of int64.
+
+        Parameters:
+        series: The Series to convert.
+        dtype: The target dtype, e.g. 'float32', 'int64' or 'category'.
+
+        Returns:
+        pd.Series: The converted Series, or the Series itself if it already has the dtype.
+        """
+        dtype = pandas_dtype(dtype)
+        if series.dtype == dtype:
+            return series
+        if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+            if series.dtype.kind == "f":
+                series = series.round()
+            if series.hasnans:
+                dtype = pandas_dtype(f"{'U' if dtype.kind == 'u' else ''}Int{dtype.itemsize * 8}")
+                if series.dtype == dtype:
+                    return series
+        return series.astype(dtype)
+
+    @staticmethod
+    def apply_schema(df: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+        """
+        Converts the columns of a DataFrame to a schema. Columns that already have their
+        dtype, or are not in the schema, are left as they are.
+
+        Parameters:
+        df: The DataFrame to convert.
+        dtypes: The target dtypes, keyed by column.
+
+        Returns:
+        pd.DataFrame: The DataFrame itself if nothing had to change, otherwise a shallow
+        copy with the converted columns.
+        """
+        converted = {}
+        for column, dtype in dtypes.items():
+            if column not in df.columns:
+                continue
+            series = df[column]
+            if series.dtype != pandas_dtype(dtype):
+                try:
+                    converted_series = DFUtil.convert(series, dtype)
+                except (TypeError, ValueError):
+                    # e.g. text in a numeric column
+                    continue
+                # Integer columns with missing values may already have the nullable dtype
+                if converted_series is not series:
+                    converted[column] = converted_series
+
+        if not converted:
+            return df
+
+        df = df.copy(deep=False)
+        for column, series in converted.items():
+            df[column] = series
+        return df
 
     @staticmethod
     def splice(original_df, backfill_df, column_name="adj_close"):
-        # Calculate daily percent change for both dataframes
-        original_df["pct_change"] = original_df[column_name].pct_change()
-        backfill_df["pct_change"] = backfill_df[column_name].pct_change()
+        """
+        Extends a DataFrame back in time with the history of another one, without
+        modifying either of them.
 
-        # Find the overlapping date(s), if any
-        overlapping_indices = backfill_df.index.intersection(original_df.index)
+        Parameters:
+        original_df: The DataFrame to extend.
+        backfill_df: The DataFrame providing the earlier history.
+        column_name: The column used to compute the adjustment ratio.
 
-        if overlapping_indices.empty:
-            # If no overlap, no adjustment ratio needed
-            adjustment_ratio = None  # Just for debugging or additional logging if needed
-        else:
-            # If there is an overlap, take the first common date as the splice point
-            splice_point = overlapping_indices[0]
+        Returns:
+        pd.DataFrame: The spliced DataFrame.
+        """
+        return DFUtil.splice_chain(original_df, [backfill_df], column_name)
+
+    @staticmethod
+    def splice_chain(original_df, backfill_dfs, column_name="adj_close"):
+        """
+        Extends a DataFrame back in time with an ordered chain of backfill DataFrames,
+        e.g. a fund, then its index, then a longer research series. Each backfill only
+        contributes the dates before the history spliced so far.
+
+        At the first date a backfill shares with the history spliced so far, the ratio
+        of their column_name values rescales every price column of the backfill, so the
+        series are continuous. Without a shared date the backfill is used unscaled.
+        Only the contributed slices are copied, and all pieces are concatenated once.
+
+        Parameters:
+        original_df: The DataFrame to extend.
+        backfill_dfs: The backfill DataFrames, in order of preference.
+        column_name: The column used to compute the adjustment ratios.
+
+        Returns:
+        pd.DataFrame: The spliced DataFrame.
+        """
+        # Pieces in chronological order with the ratio their values are scaled by
+        pieces = [(original_df, None)]
+
+        for backfill_df in backfill_dfs:
+            start = pieces[0][0].index.min()
+            head = backfill_df[backfill_df.index < start]
+            if head.empty:
+                continue
 
-            # Calculate the adjustment ratio
-            adjustment_ratio = (
-                original_df.loc[splice_point, column_name]
-                / backfill_df.loc[splice_point, column_name]
+            # The splice point is the first date shared with the history spliced so far
+            ratio = None
+            for piece, piece_ratio in pieces:
+                overlap = piece.index.intersection(backfill_df.index)
+                if not overlap.empty:
+                    splice_point = overlap[0]
+                    anchor = piece.loc[splice_point, column_name]
+                    if piece_ratio is not None:
+                        anchor *= piece_ratio
+                    ratio = anchor / backfill_df.loc[splice_point, column_name]
+                    break
+
+            pieces.insert(0, (head, ratio))
+
+        frames = []
+        for piece, ratio in pieces:
+            if ratio is not None:
+                columns = [column for column in DFUtil.PRICE_COLUMNS if column in piece.columns]
+                if column_name not in columns:
+                    columns.append(column_name)
+                piece = piece.assign(**{column: piece[column] * ratio for column in columns})
+            frames.append(piece)
+
+        # A shallow copy keeps the result independent of the caller's frame
+        return pd.concat(frames) if len(frames) > 1 else original_df.copy(deep=False)
+
+    @staticmethod
+    def splice_panel(values: np.ndarray, backfill_values: np.ndarray, fields: list, column_name="adj_close") -> np.ndarray:
+        """
+        Splices every ticker of a dense panel with its backfill in one vectorized pass.
+
+        Both panels are shaped (date, field, ticker) on the same calendar, with the
+        backfill of each ticker in the same position as the ticker. Tickers without a
+        backfill have an all-NaN backfill column and are left unchanged.
+
+        Parameters:
+        values: The panel to extend.
+        backfill_values: The backfill panel.
+        fields: The field names of the second axis.
+        column_name: The field used to compute the adjustment ratios.
+
+        Returns:
+        np.ndarray: The spliced panel.
+        """
+        column = fields.index(column_name)
+        valid = ~np.isnan(values[:, column, :])
+        shared = valid & ~np.isnan(backfill_values[:, column, :])
+        dates = np.arange(values.shape[0])
+
+        # First date of each ticker's own history, or past the end if it has none
+        first_valid = np.where(valid.any(axis=0), valid.argmax(axis=0), len(dates))
+
+        # Ratio at the first shared date, or no scaling without one
+        splice_point = shared.argmax(axis=0)
+        tickers = np.arange(values.shape[2])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(
+                shared.any(axis=0),
+                values[splice_point, column, tickers] / backfill_values[splice_point, column, tickers],
+                1.0,
             )
 
-            # Adjust the backfill dataframe 'adj_close' values
-            backfill_df[column_name] *= adjustment_ratio
+        price_fields = np.array([field in DFUtil.PRICE_COLUMNS or field == column_name for field in fields])
+        scale = np.where(price_fields[:, None], ratio[None, :], 1.0)
+
+        head = (dates[:, None] < first_valid[None, :])[:, None, :]
+        return np.where(head, backfill_values * scale[None, :, :], values)
 
-        # Drop the 'pct_change' column as it's no longer needed
-        original_df.drop("pct_change", axis=1, inplace=True)
-        backfill_df.drop("pct_change", axis=1, inplace=True)
+    @staticmethod
+    def align_panel(
+        frames: dict, fields: list, how: str = "union", ffill: bool = False, dtype="float64"
+    ) -> tuple:
+        """
+        Aligns several DataFrames on a shared calendar in a single dense array.
+
+        The calendar is computed once from all of the indexes and the array is allocated
+        once, so no intermediate frames are built and re-aligned.
+
+        Parameters:
+        frames: The DataFrames to align, keyed by ticker.
+        fields: The columns to take from each DataFrame.
+        how: 'union' keeps every date of any frame, 'intersection' only the dates of all frames.
+        ffill: Whether to forward fill missing values of each ticker and field.
+        dtype: The float dtype of the array.
 
-        # Combine the two datasets
-        # We keep the original data where it exists, and append the backfill data up to the splice point
-        spliced_df = pd.concat(
-            [backfill_df[backfill_df.index < original_df.index.min()], original_df]
-        )
+        Returns:
+        tuple: (values, index) where values is a float ndarray shaped (date, field, ticker)
+        and index is the shared DatetimeIndex.
+        """
+        if how not in ("union", "intersection"):
+            raise ValueError(f"Unsupported alignment: {how}. Supported values are 'union', 'intersection'.")
+
+        tickers = list(frames)
+        indexes = [pd.DatetimeIndex(frames[ticker].index) for ticker in tickers]
+
+        if indexes:
+            all_dates = np.concatenate([index.asi8 for index in indexes])
+            dates, counts = np.unique(all_dates, return_counts=True)
+            if how == "intersection":
+                dates = dates[counts == len(indexes)]
+        else:
+            dates = np.array([], dtype="int64")
+        index = pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="date")
 
-        return spliced_df
+        values = np.full((len(index), len(fields), len(tickers)), np.nan, dtype=dtype)
+        for position, (ticker, frame_index) in enumerate(zip(tickers, indexes)):
+            rows = index.get_indexer(frame_index)
+            found = rows >= 0
+            frame_values = frames[ticker][fields].to_numpy(dtype=dtype, na_value=np.nan)
+            values[rows[found], :, position] = frame_values[found]
+
+        if ffill:
+            values = DFUtil.ffill_panel(values)
+
+        return values, index
+
+    @staticmethod
+    def ffill_panel(values: np.ndarray) -> np.ndarray:
+        """
+        Forward fills the missing values of a (date, field, ticker) panel along the dates.
+
+        Parameters:
+        values: The panel.
+
+        Returns:
+        np.ndarray: The filled panel.
+        """
+        if not len(values):
+            return values
+
+        # Carry the position of the last valid row forward and gather from it
+        valid = ~np.isnan(values)
+        last_valid = np.where(valid, np.arange(len(values))[:, None, None], 0)
+        np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+        return np.take_along_axis(values, last_valid, axis=0)
+
+    @staticmethod
+    def intersect_panel(values: np.ndarray, index: pd.DatetimeIndex) -> tuple:
+        """
+        Keeps the dates of a (date, field, ticker) panel on which every ticker has data.
+
+        Parameters:
+        values: The panel.
+        index: The dates of the panel.
+
+        Returns:
+        tuple: (values, index) of the remaining dates.
+        """
+        complete = (~np.isnan(values)).any(axis=1).all(axis=1)
+        return values[complete], index[complete]
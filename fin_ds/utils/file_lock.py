@@ -0,0 +1,94 @@
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Advisory lock on a lock file, shared between processes using the same cache directory.
+
+    A shared lock may be held by several processes at once, while an exclusive lock
+    excludes everybody else. Windows only supports exclusive locks, so shared locks
+    are exclusive there. The lock file itself is left in place after release because
+    deleting it would race with processes that are waiting on it.
+    """
+
+    def __init__(self, lock_path: Path, shared: bool = False):
+        self.lock_path = Path(lock_path)
+        self.shared = shared
+        self._file = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquires the lock.
+
+        Parameters:
+        - blocking: Whether to wait for the lock. If False, returns immediately.
+
+        Returns:
+        - True if the lock was acquired, False if it is held elsewhere and blocking is False.
+        """
+        try:
+            lock_file = open(self.lock_path, "a+b")
+        except FileNotFoundError:
+            # Only the first lock in a new directory pays for creating it
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_file = open(self.lock_path, "a+b")
+        try:
+            if os.name == "nt":
+                mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+                while True:
+                    try:
+                        lock_file.seek(0)
+                        msvcrt.locking(lock_file.fileno(), mode, 1)
+                        break
+                    except OSError:
+                        # LK_LOCK gives up after 10 attempts, so keep trying while blocking
+                        if not blocking:
+                            raise
+            else:
+                operation = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+                if not blocking:
+                    operation |= fcntl.LOCK_NB
+                fcntl.flock(lock_file.fileno(), operation)
+        except OSError:
+            lock_file.close()
+            if blocking:
+                raise
+            return False
+
+        self._file = lock_file
+        logger.debug(f"Acquired {'shared' if self.shared else 'exclusive'} lock: {self.lock_path}")
+        return True
+
+    def release(self) -> None:
+        """
+        Releases the lock.
+        """
+        if self._file is None:
+            return
+
+        try:
+            if os.name == "nt":
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+        logger.debug(f"Released lock: {self.lock_path}")
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import random
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class HttpUtil:
+    """
+    Utility class for the HTTP requests made directly by the data sources,
+    as opposed to the requests made by the vendor client libraries.
+
+    Synchronous requests share one process-wide requests.Session, so keep-alive
+    connections are reused across data source instances. Every request gets a
+    timeout, and responses with a status in RETRY_STATUSES are retried with
+    jittered exponential backoff, honouring the Retry-After header.
+    """
+
+    DEFAULT_TIMEOUT = 30
+
+    # Connections kept alive per host. Should cover the number of worker threads.
+    POOL_SIZE = 16
+
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 0.5
+    BACKOFF_JITTER = 0.5
+    BACKOFF_MAX = 60
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Class variable for the process-wide session
+    _session = None
+    _session_lock = threading.Lock()
+
+    # Class variable for the transport that records or replays the requests instead of
+    # only sending them, e.g. a fin_ds.utils.replay.ResponseArchive
+    _transport = None
+
+    @classmethod
+    def configure(
+        cls,
+        pool_size: int = None,
+        max_retries: int = None,
+        backoff_factor: float = None,
+        timeout: float = None,
+    ) -> None:
+        """
+        Changes the connection pool and retry settings. The shared session is kept and
+        its adapters are replaced, so clients holding the session, e.g. the Tiingo
+        client, use the new settings too.
+
+        Parameters:
+        - pool_size: The number of connections kept alive per host.
+        - max_retries: The number of retries of a failed request.
+        - backoff_factor: The base delay in seconds, doubled with every retry.
+        - timeout: The default timeout of a request in seconds.
+        """
+        with cls._session_lock:
+            if pool_size is not None:
+                cls.POOL_SIZE = pool_size
+            if max_retries is not None:
+                cls.MAX_RETRIES = max_retries
+            if backoff_factor is not None:
+                cls.BACKOFF_FACTOR = backoff_factor
+            if timeout is not None:
+                cls.DEFAULT_TIMEOUT = timeout
+
+            if cls._session is not None:
+                old_adapter = cls._session.network_adapter
+                cls._session.network_adapter = cls._create_adapter()
+                cls._mount(cls._session)
+                # Requests in flight keep their connections until they complete
+                old_adapter.close()
+
+    @classmethod
+    def session(cls):
+        """
+        Returns the process-wide requests.Session, creating it on first use. The same
+        session is returned for the lifetime of the process, so it may be handed to
+        client libraries.
+
+        Returns:
+        - A requests.Session with a pooled, retrying adapter and a default timeout.
+        """
+        with cls._session_lock:
+            if cls._session is None:
+                cls._session = cls._create_session()
+            return cls._session
+
+    @classmethod
+    def _create_session(cls):
+        # Lazy load the library to avoid importing it if not needed
+        import requests
+
+        class TimeoutSession(requests.Session):
+            def request(self, method, url, **kwargs):
+                kwargs.setdefault("timeout", HttpUtil.DEFAULT_TIMEOUT)
+                return super().request(method, url, **kwargs)
+
+        session = TimeoutSession()
+        session.network_adapter = cls._create_adapter()
+        cls._mount(session)
+        return session
+
+    @classmethod
+    def _create_adapter(cls):
+        # Lazy load the libraries to avoid importing them if not needed
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=cls.MAX_RETRIES,
+            backoff_factor=cls.BACKOFF_FACTOR,
+            backoff_jitter=cls.BACKOFF_JITTER,
+            backoff_max=cls.BACKOFF_MAX,
+            status_forcelist=cls.RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            # Hand the last response back so raise_for_status reports its status
+            raise_on_status=False,
+        )
+        return HTTPAdapter(pool_connections=cls.POOL_SIZE, pool_maxsize=cls.POOL_SIZE, max_retries=retry)
+
+    @classmethod
+    def _mount(cls, session) -> None:
+        adapter = session.network_adapter
+        if cls._transport is not None:
+            adapter = cls._transport.adapter(adapter)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    @classmethod
+    def use_transport(cls, transport) -> None:
+        """
+        Routes the requests of the data sources through a transport that records or
+        replays them, or back to the network only.
+
+        Parameters:
+        - transport: A transport such as fin_ds.utils.replay.ResponseArchive, or None.
+        """
+        with cls._session_lock:
+            cls._transport = transport
+            # Sessions already handed out, e.g. to the Tiingo client, are switched too
+            if cls._session is not None:
+                cls._mount(cls._session)
+
+    @classmethod
+    def call_client(cls, client: str, request: str, fetch):
+        """
+        Calls a vendor client library that makes its own HTTP requests, through the
+        transport if one is in use, which records or replays the returned value.
+
+        Parameters:
+        - client: The name of the client library, e.g. 'yfinance'.
+        - request: A description of the call that identifies its result, e.g. 'download AAPL'.
+        - fetch: A function without arguments that makes the call.
+
+        Returns:
+        - The value returned by fetch, or its recording.
+        """
+        transport = cls._transport
+        if transport is None:
+            return fetch()
+        return transport.call(f"{client} {request}", fetch)
+
+    @classmethod
+    def backoff_delay(cls, attempt: int, retry_after: str = None) -> float:
+        """
+        Computes the delay before retrying a request.
+
+        Parameters:
+        - attempt: The number of the failed attempt, starting at 0.
+        - retry_after: Optional Retry-After header of the failed response, in seconds.
+
+        Returns:
+        - The delay in seconds.
+        """
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), cls.BACKOFF_MAX)
+            except ValueError:
+                pass
+
+        delay = cls.BACKOFF_FACTOR * 2**attempt + random.uniform(0, cls.BACKOFF_JITTER)
+        return min(delay, cls.BACKOFF_MAX)
+
+    @classmethod
+    def get_json(cls, url: str, params: dict = None, headers: dict = None):
+        """
+        Performs a GET request over the shared session and decodes the JSON response.
+
+        Parameters:
+        - url: The URL to request.
+        - params: Optional query string parameters.
+        - headers: Optional request headers.
+
+        Returns:
+        - The decoded JSON response.
+
+        Raises:
+        - requests.HTTPError: If the response status is an error after all retries.
+        """
+        logger.debug(f"GET {url}")
+        response = cls.session().get(url, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    @classmethod
+    def client_session(cls):
+        """
+        Creates an aiohttp.ClientSession with the pool size and default timeout.
+        It must be created, used and closed within one event loop.
+
+        Returns:
+        - A new aiohttp.ClientSession.
+        """
+        # Lazy load the library to avoid importing it if not needed
+        import aiohttp
+
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=cls.POOL_SIZE),
+            timeout=aiohttp.ClientTimeout(total=cls.DEFAULT_TIMEOUT),
+        )
+
+    @classmethod
+    async def aget_json(cls, session, url: str, params: dict = None, headers: dict = None):
+        """
+        Performs an asynchronous GET request and decodes the JSON response,
+        retrying with the same policy as the synchronous requests.
+
+        Parameters:
+        - session: The aiohttp.ClientSession to send the request with.
+        - url: The URL to request.
+        - params: Optional query string parameters.
+        - headers: Optional request headers.
+
+        Returns:
+        - The decoded JSON response.
+
+        Raises:
+        - aiohttp.ClientResponseError: If the response status is an error after all retries.
+        """
+        transport = cls._transport
+        if transport is not None:
+            return await transport.aget_json(
+                url, params, lambda: cls._aget_json(session, url, params=params, headers=headers)
+            )
+        return await cls._aget_json(session, url, params=params, headers=headers)
+
+    @classmethod
+    async def _aget_json(cls, session, url: str, params: dict = None, headers: dict = None):
+        for attempt in range(cls.MAX_RETRIES + 1):
+            logger.debug(f"GET {url}")
+            async with session.get(url, params=params, headers=headers) as response:
+                if response.status not in cls.RETRY_STATUSES or attempt == cls.MAX_RETRIES:
+                    response.raise_for_status()
+                    # Some vendors send JSON with a text/plain content type
+                    return await response.json(content_type=None)
+
+                delay = cls.backoff_delay(attempt, response.headers.get("Retry-After"))
+
+            logger.debug(f"GET {url} returned {response.status}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
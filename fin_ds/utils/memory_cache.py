@@ -0,0 +1,137 @@
+import logging
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryCache:
+    """
+    In-process LRU cache of parsed DataFrames that sits above the disk cache.
+
+    Entries are bounded by their total memory_usage(deep=True) in bytes and carry
+    the version of the disk entry they were loaded from, so an entry is ignored once
+    the file on disk has been rewritten. Callers always receive their own copy, which
+    is a cheap shallow copy when pandas copy-on-write is enabled.
+    """
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    # Class variable for the process-wide instance
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, max_bytes: int = None) -> "MemoryCache":
+        """
+        Returns the process-wide memory cache, creating it on first use.
+
+        Parameters:
+        - max_bytes: Optional new byte budget for the shared cache.
+
+        Returns:
+        - The MemoryCache shared by every data source in the process.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(max_bytes or cls.DEFAULT_MAX_BYTES)
+            elif max_bytes is not None:
+                cls._shared.resize(max_bytes)
+            return cls._shared
+
+    @staticmethod
+    def _detach(df: pd.DataFrame) -> pd.DataFrame:
+        # With copy-on-write a shallow copy is enough to isolate the caller
+        return df.copy(deep=pd.options.mode.copy_on_write is not True)
+
+    def get(self, key, version):
+        """
+        Returns a copy of the cached DataFrame for a key.
+
+        Parameters:
+        - key: The cache key, e.g. (data_source, ticker).
+        - version: The current version of the disk entry.
+
+        Returns:
+        - The DataFrame, or None if it is not cached or was cached from another version.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            entry_version, df, _ = entry
+            if entry_version != version:
+                logger.debug(f"Memory cache entry for {key} is out of date.")
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            logger.debug(f"Memory cache hit for: {key}")
+            return self._detach(df)
+
+    def put(self, key, version, df: pd.DataFrame) -> None:
+        """
+        Caches a copy of a DataFrame, evicting the least recently used entries
+        until the byte budget is met.
+
+        Parameters:
+        - key: The cache key, e.g. (data_source, ticker).
+        - version: The version of the disk entry the DataFrame matches.
+        - df: The DataFrame to cache.
+        """
+        nbytes = int(df.memory_usage(deep=True).sum())
+        with self._lock:
+            self._remove(key)
+            if nbytes > self.max_bytes:
+                logger.debug(f"{key} is larger than the memory cache budget and is not cached.")
+                return
+
+            self._entries[key] = (version, self._detach(df), nbytes)
+            self.current_bytes += nbytes
+            self._evict()
+
+    def invalidate(self, key) -> None:
+        """
+        Removes the entry for a key, if any.
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def resize(self, max_bytes: int) -> None:
+        """
+        Changes the byte budget, evicting entries if needed.
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[2]
+
+    def _evict(self) -> None:
+        while self.current_bytes > self.max_bytes and self._entries:
+            key, (_, _, nbytes) = self._entries.popitem(last=False)
+            self.current_bytes -= nbytes
+            logger.debug(f"Evicted {key} from the memory cache.")
@@ -0,0 +1,215 @@
+import bisect
+import contextlib
+import math
+import threading
+import time
+
+
+class Histogram:
+    """
+    Distribution of observed values over fixed bucket bounds, e.g. request latencies.
+    """
+
+    def __init__(self, buckets: tuple):
+        self.buckets = tuple(sorted(buckets))
+        # The last count is for values above the largest bound
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list:
+        """
+        Returns the number of observations at or below each bound, plus the total.
+        """
+        counts, total = [], 0
+        for count in self.counts:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class MetricsRegistry:
+    """
+    Process-wide counters and latency histograms for the stages of the fetch and
+    cache pipeline, labelled by data source.
+
+    Metric values are keyed by the metric name and its labels. The registry can be
+    exported as a dict or in the Prometheus text exposition format.
+    """
+
+    # Latency bounds in seconds
+    DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+    # Class variable for the process-wide instance
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.enabled = True
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "MetricsRegistry":
+        """
+        Returns the process-wide metrics registry, creating it on first use.
+
+        Returns:
+        - The MetricsRegistry shared by every data source in the process.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """
+        Adds to a counter.
+
+        Parameters:
+        - name: The metric name, e.g. 'fin_ds_cache_requests_total'.
+        - value: The amount to add.
+        - labels: The metric labels, e.g. source='YFinance'.
+        """
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """
+        Records a value in a histogram.
+
+        Parameters:
+        - name: The metric name, e.g. 'fin_ds_stage_seconds'.
+        - value: The observed value.
+        - labels: The metric labels, e.g. source='YFinance', stage='fetch'.
+        """
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(self.buckets)
+                self._histograms[key] = histogram
+            histogram.observe(value)
+
+    @contextlib.contextmanager
+    def timer(self, name: str, **labels):
+        """
+        Records the duration of a block in a histogram, in seconds. Blocks that raise
+        are also counted in the '{name}_errors_total' counter.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.inc(f"{name.removesuffix('_seconds')}_errors_total", **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_value(self, name: str, **labels) -> float:
+        """
+        Returns the value of a counter, or 0 if it has not been incremented.
+        """
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0)
+
+    def histogram(self, name: str, **labels) -> Histogram:
+        """
+        Returns a histogram, or None if nothing has been observed.
+        """
+        with self._lock:
+            return self._histograms.get(self._key(name, labels))
+
+    def reset(self) -> None:
+        """
+        Removes all metric values.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_dict(self) -> dict:
+        """
+        Exports the metrics.
+
+        Returns:
+        - A dict with 'counters' and 'histograms', each mapping a metric name to a list
+          of its labelled values. Histogram buckets hold cumulative counts per bound.
+        """
+        with self._lock:
+            counters = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                counters.setdefault(name, []).append({"labels": dict(labels), "value": value})
+
+            histograms = {}
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                bounds = [*histogram.buckets, math.inf]
+                histograms.setdefault(name, []).append(
+                    {
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "buckets": dict(zip(bounds, histogram.cumulative_counts())),
+                    }
+                )
+
+        return {"counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """
+        Exports the metrics in the Prometheus text exposition format.
+        """
+        metrics = self.to_dict()
+        lines = []
+        for name, values in metrics["counters"].items():
+            lines.append(f"# TYPE {name} counter")
+            for value in values:
+                lines.append(f"{name}{self._format_labels(value['labels'])} {self._format_value(value['value'])}")
+
+        for name, values in metrics["histograms"].items():
+            lines.append(f"# TYPE {name} histogram")
+            for value in values:
+                for bound, count in value["buckets"].items():
+                    labels = self._format_labels({**value["labels"], "le": self._format_value(bound)})
+                    lines.append(f"{name}_bucket{labels} {count}")
+                labels = self._format_labels(value["labels"])
+                lines.append(f"{name}_sum{labels} {self._format_value(value['sum'])}")
+                lines.append(f"{name}_count{labels} {value['count']}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    @staticmethod
+    def _format_labels(labels: dict) -> str:
+        if not labels:
+            return ""
+        escaped = (
+            (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+            for name, value in labels.items()
+        )
+        return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        if value == math.inf:
+            return "+Inf"
+        return repr(float(value)) if isinstance(value, float) else str(value)
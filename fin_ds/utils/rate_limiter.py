@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    A token bucket that allows `capacity` requests per `period` seconds.
+    Tokens are reserved in advance, so the balance can go negative. The deficit
+    is how long the caller has to wait before its request may be sent.
+    """
+
+    def __init__(self, capacity: int, period: float, now: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Reserves one token.
+
+        Parameters:
+        - now: The current time in seconds.
+
+        Returns:
+        - The number of seconds to wait before the token can be used.
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+
+class RateLimiter:
+    """
+    Schedules requests to an API so that every quota is respected. Requests are
+    spaced out at the maximum allowed rate instead of bursting and backing off.
+
+    Quotas are given as a dict of period name to number of requests, e.g.
+    {"minute": 5, "day": 25}.
+    """
+
+    PERIODS = {
+        "second": 1,
+        "minute": 60,
+        "hour": 60 * 60,
+        "day": 24 * 60 * 60,
+    }
+
+    # Class variable for the limiters shared per data source and API key
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, limits: dict, clock=time.monotonic):
+        unknown_periods = set(limits) - set(self.PERIODS)
+        if unknown_periods:
+            raise ValueError(
+                f"Unsupported rate limit period: {', '.join(sorted(unknown_periods))}. "
+                f"Supported periods are {', '.join(self.PERIODS)}."
+            )
+
+        self.limits = dict(limits)
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._buckets = [
+            TokenBucket(capacity, self.PERIODS[period], now) for period, capacity in limits.items()
+        ]
+
+    @classmethod
+    def shared(cls, data_source: str, api_key, limits: dict) -> "RateLimiter":
+        """
+        Returns the process-wide rate limiter for a data source and API key,
+        creating it on first use.
+
+        Parameters:
+        - data_source: The name of the data source.
+        - api_key: The API key the quotas belong to. May be None.
+        - limits: The quotas, used when the limiter is created.
+
+        Returns:
+        - The RateLimiter shared by every instance using the same source and key.
+        """
+        # Only a digest of the API key is kept as the lookup key
+        key_digest = hashlib.sha256(str(api_key).encode()).hexdigest()
+        with cls._shared_lock:
+            limiter = cls._shared.get((data_source, key_digest))
+            if limiter is None:
+                limiter = cls(limits)
+                cls._shared[(data_source, key_digest)] = limiter
+            return limiter
+
+    def reserve(self) -> float:
+        """
+        Reserves a slot for one request against every quota.
+
+        Returns:
+        - The number of seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = self._clock()
+            return max(bucket.reserve(now) for bucket in self._buckets)
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f"Rate limit reached. Waiting {wait:.2f} seconds.")
+            time.sleep(wait)
+
+    async def aacquire(self) -> None:
+        """
+        Waits without blocking the event loop until a request may be sent.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f"Rate limit reached. Waiting {wait:.2f} seconds.")
+            await asyncio.sleep(wait)
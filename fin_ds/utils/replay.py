@@ -0,0 +1,274 @@
+import asyncio
+import contextlib
+import datetime
+import json
+import logging
+import pickle
+import threading
+import time
+import zipfile
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from fin_ds.utils.http_util import HttpUtil
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseArchive:
+    """
+    Records the upstream responses of the data sources into a zip archive, and replays
+    them without a network, so that the whole get_eod_data path, including the parsing
+    of real payloads, can be reproduced and benchmarked offline.
+
+    The requests made through HttpUtil (Tiingo, EODHD and AlphaVantage, synchronous and
+    asynchronous) are recorded as raw response bodies. Vendor client libraries with their
+    own HTTP stack (yfinance and NasdaqDataLink) are recorded as the DataFrames they
+    return, which are pickled, so only replay archives from a trusted source.
+
+    Requests are matched by method and URL. API keys and the end date of the requested
+    range are left out, so an archive replays on later days and never contains a key.
+    A request that was recorded several times is replayed in the same order, repeating
+    the last response.
+    """
+
+    VERSION = 1
+
+    INDEX = "index.json"
+
+    # Query parameters that are never written to an archive
+    SECRET_PARAMS = ("api_token", "apikey", "api_key", "token")
+
+    # Query parameters that change from day to day without changing the request
+    IGNORED_PARAMS = ("endDate", "to")
+
+    def __init__(self, path, mode: str = "replay", latency: float = 0.0):
+        """
+        Parameters:
+        - path: The archive file.
+        - mode: 'record' to create the archive, or 'replay' to serve its responses.
+        - latency: The fraction of the recorded latency to wait before each replayed
+          response, e.g. 1.0 to replay at the recorded speed. Defaults to no waiting.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown mode '{mode}'. Use 'record' or 'replay'.")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self._lock = threading.Lock()
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._zip = zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED)
+            self._entries = {}
+        else:
+            self._zip = zipfile.ZipFile(self.path)
+            self._entries = json.loads(self._zip.read(self.INDEX))["entries"]
+            # The next recording of each key to replay
+            self._positions = {}
+
+    @classmethod
+    @contextlib.contextmanager
+    def record(cls, path):
+        """
+        Records the upstream responses of every data source within the with block.
+
+        Parameters:
+        - path: The archive file to create, e.g. 'recordings/tiingo.zip'.
+
+        Returns:
+        - A context manager yielding the ResponseArchive.
+        """
+        archive = cls(path, mode="record")
+        HttpUtil.use_transport(archive)
+        try:
+            yield archive
+        finally:
+            HttpUtil.use_transport(None)
+            archive.close()
+
+    @classmethod
+    @contextlib.contextmanager
+    def replay(cls, path, latency: float = 0.0):
+        """
+        Serves the upstream requests of every data source from an archive within the
+        with block. Requests that are not in the archive raise a LookupError.
+
+        Parameters:
+        - path: The archive file.
+        - latency: The fraction of the recorded latency to wait before each response.
+
+        Returns:
+        - A context manager yielding the ResponseArchive.
+        """
+        archive = cls(path, mode="replay", latency=latency)
+        HttpUtil.use_transport(archive)
+        try:
+            yield archive
+        finally:
+            HttpUtil.use_transport(None)
+            archive.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._zip is None:
+                return
+            if self.mode == "record":
+                index = {
+                    "version": self.VERSION,
+                    "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "entries": self._entries,
+                }
+                self._zip.writestr(self.INDEX, json.dumps(index, indent=1))
+                logger.info(f"Recorded {sum(map(len, self._entries.values()))} responses to {self.path}")
+            self._zip.close()
+            self._zip = None
+
+    def keys(self) -> list:
+        """
+        Returns the keys of the recorded requests, e.g. 'GET https://...' or 'yfinance download AAPL'.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    @classmethod
+    def request_key(cls, method: str, url: str, params: dict = None) -> str:
+        """
+        Returns the key a request is recorded under: the method and the URL with its
+        query parameters sorted, without API keys and ignored parameters.
+        """
+        scheme, netloc, path, query, _ = urlsplit(requests.Request(method, url, params=params).prepare().url)
+        skipped = {*cls.SECRET_PARAMS, *cls.IGNORED_PARAMS}
+        query = urlencode(sorted((name, value) for name, value in parse_qsl(query) if name not in skipped))
+        return f"{method.upper()} {urlunsplit((scheme, netloc, path, query, ''))}"
+
+    def adapter(self, network_adapter) -> BaseAdapter:
+        """
+        Returns the requests adapter that records the responses of network_adapter, or
+        replays them.
+        """
+        return _ArchiveAdapter(self, network_adapter)
+
+    def call(self, key: str, fetch):
+        """
+        Records the value returned by a client library call, or replays it.
+        """
+        if self.mode == "record":
+            start = time.perf_counter()
+            value = fetch()
+            self._add(key, "calls", pickle.dumps(value), elapsed=time.perf_counter() - start)
+            return value
+
+        entry, data = self._next(key)
+        self._wait(entry)
+        return pickle.loads(data)
+
+    async def aget_json(self, url: str, params: dict, fetch):
+        """
+        Records the decoded JSON of an asynchronous request, or replays it. Recordings
+        of synchronous requests to the same URL are replayed too.
+        """
+        key = self.request_key("GET", url, params)
+        if self.mode == "record":
+            # Lazy load the library to avoid importing it if not needed
+            import aiohttp
+
+            start = time.perf_counter()
+            try:
+                data = await fetch()
+            except aiohttp.ClientResponseError as e:
+                self._add(key, "responses", b"", elapsed=time.perf_counter() - start, status=e.status)
+                raise
+            body = json.dumps(data).encode()
+            self._add(key, "responses", body, elapsed=time.perf_counter() - start, status=200)
+            return data
+
+        entry, body = self._next(key)
+        if self.latency and entry["elapsed"]:
+            await asyncio.sleep(entry["elapsed"] * self.latency)
+        if entry["status"] >= 400:
+            import aiohttp
+            from multidict import CIMultiDict, CIMultiDictProxy
+            from yarl import URL
+
+            request_info = aiohttp.RequestInfo(URL(url), "GET", CIMultiDictProxy(CIMultiDict()), URL(url))
+            raise aiohttp.ClientResponseError(
+                request_info, (), status=entry["status"], message=HTTPStatus(entry["status"]).phrase
+            )
+        return json.loads(body)
+
+    def send(self, request: requests.PreparedRequest, network_adapter, **kwargs) -> requests.Response:
+        """Sends a prepared request through network_adapter and records it, or replays it."""
+        key = self.request_key(request.method, request.url)
+        if self.mode == "record":
+            start = time.perf_counter()
+            response = network_adapter.send(request, **kwargs)
+            # Read the body so that the recorded latency includes it
+            body = response.content
+            self._add(
+                key,
+                "responses",
+                body,
+                elapsed=time.perf_counter() - start,
+                status=response.status_code,
+                content_type=response.headers.get("Content-Type"),
+            )
+            return response
+
+        entry, body = self._next(key)
+        self._wait(entry)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = HTTPStatus(entry["status"]).phrase
+        response.headers = CaseInsensitiveDict()
+        if entry.get("content_type"):
+            response.headers["Content-Type"] = entry["content_type"]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.elapsed = datetime.timedelta(seconds=entry["elapsed"])
+        return response
+
+    def _add(self, key: str, kind: str, data: bytes, **entry) -> None:
+        with self._lock:
+            if self._zip is None:
+                raise RuntimeError(f"The archive {self.path} is closed.")
+            member = f"{kind}/{sum(map(len, self._entries.values())):06d}"
+            self._zip.writestr(member, data)
+            self._entries.setdefault(key, []).append({"member": member, **entry})
+
+    def _next(self, key: str) -> tuple:
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise LookupError(f"No recorded response for {key} in {self.path}.")
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            entry = entries[min(position, len(entries) - 1)]
+            return entry, self._zip.read(entry["member"])
+
+    def _wait(self, entry: dict) -> None:
+        if self.latency and entry["elapsed"]:
+            time.sleep(entry["elapsed"] * self.latency)
+
+
+class _ArchiveAdapter(BaseAdapter):
+    def __init__(self, archive: ResponseArchive, network_adapter):
+        super().__init__()
+        self.archive = archive
+        self.network_adapter = network_adapter
+
+    def send(self, request, **kwargs):
+        return self.archive.send(request, self.network_adapter, **kwargs)
+
+    def close(self):
+        self.network_adapter.close()
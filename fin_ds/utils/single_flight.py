@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import weakref
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key so that only one of them does the work.
+
+    The first caller for a key runs the function. Callers that arrive while it is
+    running wait for it and receive its result, or its exception. Threads and asyncio
+    tasks are coalesced separately, each with their own method.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = weakref.WeakKeyDictionary()
+
+    def do(self, key, fn, share=None):
+        """
+        Runs fn once for all threads that request the same key at the same time.
+
+        Parameters:
+        - key: Identifies the work, e.g. (data_source, ticker).
+        - fn: The function doing the work.
+        - share: Optional function applied to the result handed to waiting callers,
+          e.g. to give each of them their own copy.
+
+        Returns:
+        - The result of fn.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return share(call.result) if share else call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+    async def ado(self, key, coro_fn, share=None):
+        """
+        Awaits coro_fn() once for all tasks in the running event loop that request
+        the same key at the same time.
+
+        Parameters:
+        - key: Identifies the work, e.g. (data_source, ticker).
+        - coro_fn: A function returning the coroutine doing the work.
+        - share: Optional function applied to the result handed to waiting tasks.
+
+        Returns:
+        - The result of the coroutine.
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+
+        future = calls.get(key)
+        if future is not None:
+            # Shield the shared future so a cancelled follower does not cancel the leader
+            result = await asyncio.shield(future)
+            return share(result) if share else result
+
+        future = loop.create_future()
+        calls[key] = future
+        try:
+            result = await coro_fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case no other task was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del calls[key]
@@ -0,0 +1,285 @@
+import contextlib
+import contextvars
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# The innermost span of the running thread or task, so that new spans find their parent
+_current_span = contextvars.ContextVar("fin_ds_current_span", default=None)
+
+# The sampler of the profiled request the running thread or task belongs to, if any
+_current_sampler = contextvars.ContextVar("fin_ds_current_sampler", default=None)
+
+# The names of the open spans of the running thread or task, outermost first
+_current_stages = contextvars.ContextVar("fin_ds_current_stages", default=())
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """
+    A timed operation with attributes and the spans nested in it.
+    """
+
+    def __init__(self, name: str, attributes: dict = None, parent: "Span" = None):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.children = []
+        self.start_time = time.perf_counter()
+        self.end_time = None
+        self.error = None
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration(self) -> float:
+        """The duration in seconds, up to now if the span has not ended."""
+        end_time = self.end_time if self.end_time is not None else time.perf_counter()
+        return end_time - self.start_time
+
+    def find(self, name: str) -> list:
+        """
+        Returns this span and the nested spans with the given name, depth first.
+        """
+        spans = [self] if self.name == name else []
+        for child in self.children:
+            spans.extend(child.find(name))
+        return spans
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "attributes": dict(self.attributes),
+            "duration": self.duration,
+            "error": self.error,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class Tracer:
+    """
+    Creates the spans emitted around the stages of a data source request.
+
+    This base class records nothing, so tracing costs next to nothing unless a data
+    source is given another tracer, e.g. a CollectingTracer or an OpenTelemetryTracer.
+    """
+
+    @contextlib.contextmanager
+    def start_span(self, name: str, attributes: dict = None):
+        """
+        Starts a span nested in the current span, for the duration of the with block.
+
+        Parameters:
+        - name: The span name, e.g. 'get_eod_data' or 'fetch'.
+        - attributes: Optional attributes, e.g. {'source': 'YFinance', 'ticker': 'AAPL'}.
+
+        Returns:
+        - A context manager yielding the span, which accepts more attributes.
+        """
+        yield NOOP_SPAN
+
+
+class CollectingTracer(Tracer):
+    """
+    Keeps the most recent finished root spans, with their nested spans, in memory.
+    Spans started in worker threads or tasks nest under the span that started them.
+    """
+
+    def __init__(self, max_spans: int = 1000):
+        self.spans = deque(maxlen=max_spans)
+
+    @contextlib.contextmanager
+    def start_span(self, name: str, attributes: dict = None):
+        parent = _current_span.get()
+        span = Span(name, attributes, parent)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = repr(e)
+            raise
+        finally:
+            span.end_time = time.perf_counter()
+            _current_span.reset(token)
+            if parent is None:
+                self.spans.append(span)
+            else:
+                parent.children.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Emits the spans through OpenTelemetry, so that they are exported by whatever
+    tracer provider the application has configured.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        Parameters:
+        - tracer: Optional opentelemetry.trace.Tracer. Defaults to the 'fin_ds' tracer
+          of the global tracer provider.
+        """
+        if tracer is None:
+            # Lazy load the library to avoid importing it if not needed
+            from opentelemetry import trace
+
+            tracer = trace.get_tracer("fin_ds")
+        self.tracer = tracer
+
+    @contextlib.contextmanager
+    def start_span(self, name: str, attributes: dict = None):
+        # OpenTelemetry only accepts primitive attribute values
+        attributes = {key: value for key, value in (attributes or {}).items() if value is not None}
+        with self.tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+
+class ProfilingTracer(Tracer):
+    """
+    Samples the call stack of every root span, e.g. a get_eod_data call, and writes
+    the profile of the requests that take longer than a threshold.
+
+    A background thread records the stack of the requesting thread every interval,
+    prefixed with the stages the request was in. The profile of a slow request is
+    written in the collapsed stack format read by flame graph tools, with one
+    'stage;...;file:function count' line per distinct stack. Spans are also passed on
+    to an inner tracer.
+
+    Only the thread that started the root span is sampled, so work handed to other
+    threads shows up as waiting. Concurrent asyncio requests share the event loop
+    thread, so only the first of them is profiled. The stages are kept per context,
+    like the current span, so the spans of interleaved tasks never end up in the
+    stages of the profiled request.
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer = None,
+        threshold: float = 1.0,
+        interval: float = 0.005,
+        output_dir="fin-ds-profiles",
+    ):
+        """
+        Parameters:
+        - tracer: Optional tracer to pass the spans on to.
+        - threshold: The duration in seconds above which a request's profile is written.
+        - interval: The sampling interval in seconds.
+        - output_dir: The directory the profiles are written to.
+        """
+        self.tracer = tracer or Tracer()
+        self.threshold = threshold
+        self.interval = interval
+        self.output_dir = Path(output_dir)
+        self._samplers = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def start_span(self, name: str, attributes: dict = None):
+        thread_id = threading.get_ident()
+        previous = _current_stages.get()
+        stages = (*previous, name)
+        stages_token = _current_stages.set(stages)
+
+        root_sampler = None
+        sampler = _current_sampler.get()
+        # Spans of a profiled request that run in worker threads are not roots
+        if sampler is None:
+            with self._lock:
+                if thread_id not in self._samplers:
+                    root_sampler = _StackSampler(self, thread_id, stages)
+                    self._samplers[thread_id] = root_sampler
+        elif sampler.thread_id == thread_id:
+            sampler.stages = stages
+
+        sampler_token = None
+        if root_sampler is not None:
+            sampler_token = _current_sampler.set(root_sampler)
+            root_sampler.start()
+        try:
+            with self.tracer.start_span(name, attributes) as span:
+                try:
+                    yield span
+                finally:
+                    if root_sampler is not None:
+                        root_sampler.stop()
+                        if root_sampler.duration >= self.threshold:
+                            path = self._write_profile(name, attributes or {}, root_sampler)
+                            span.set_attribute("profile", str(path))
+        finally:
+            if root_sampler is not None:
+                _current_sampler.reset(sampler_token)
+                with self._lock:
+                    del self._samplers[thread_id]
+            elif sampler is not None and sampler.thread_id == thread_id:
+                sampler.stages = previous
+            _current_stages.reset(stages_token)
+
+    def _write_profile(self, name: str, attributes: dict, sampler: "_StackSampler") -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        label = "-".join(
+            str(part) for part in (attributes.get("source"), attributes.get("ticker"), name) if part
+        )
+        label = re.sub(r"[^\w.-]", "_", label)
+        path = self.output_dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{label}-{os.getpid()}-{id(sampler)}.folded"
+        with open(path, "w") as profile:
+            for stack, count in sampler.samples.most_common():
+                profile.write(f"{stack} {count}\n")
+
+        logger.warning(
+            f"{label} took {sampler.duration:.2f}s, over the {self.threshold:.2f}s threshold. "
+            f"Profile written to {path}"
+        )
+        return path
+
+
+class _StackSampler(threading.Thread):
+    def __init__(self, profiler: ProfilingTracer, thread_id: int, stages: tuple):
+        super().__init__(name=f"fin-ds-profiler-{thread_id}", daemon=True)
+        self.profiler = profiler
+        self.thread_id = thread_id
+        # The stages of the profiled request on the sampled thread, set by its spans
+        self.stages = stages
+        self.samples = Counter()
+        self.duration = 0.0
+        self._stopped = threading.Event()
+        self._start_time = None
+
+    def start(self) -> None:
+        self._start_time = time.perf_counter()
+        super().start()
+
+    def stop(self) -> None:
+        self.duration = time.perf_counter() - self._start_time
+        self._stopped.set()
+        self.join()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.profiler.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{Path(code.co_filename).name}:{code.co_name}")
+                frame = frame.f_back
+            self.samples[";".join([*self.stages, *reversed(frames)])] += 1
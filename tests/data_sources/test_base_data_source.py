@@ -0,0 +1,555 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fin_ds.data_sources.base_data_source import BaseDataSource
+from fin_ds.utils.cache_util import CacheUtil
+from fin_ds.utils.df_util import DFUtil
+from fin_ds.utils.memory_cache import MemoryCache
+from fin_ds.utils.metrics import MetricsRegistry
+from fin_ds.utils.tracing import CollectingTracer
+
+
+class StubDataSource(BaseDataSource):
+    """In-memory data source that records the requests made to it."""
+
+    api_key_required = False
+    supports_start_date = True
+
+    COLUMN_MAPPINGS = {}
+
+    COLUMN_ORDER = ["ticker", "close", "adj_close", "dividend", "split"]
+
+    def __init__(self, name="Stub", api_key=None):
+        super().__init__(name)
+        self.history = {}
+        self.requests = []
+
+    def _fetch_data_from_source(self, ticker, start_date=None):
+        self.requests.append((ticker, start_date))
+        df = self.history[ticker]
+        if start_date is not None:
+            df = df[df.index >= start_date]
+        return df.copy()
+
+
+def make_history(dates, adj_close, dividend=None, split=None):
+    index = pd.DatetimeIndex(pd.to_datetime(dates), name="date")
+    return pd.DataFrame(
+        {
+            "close": adj_close,
+            "adj_close": adj_close,
+            "dividend": dividend or [0.0] * len(dates),
+            "split": split or [1.0] * len(dates),
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def data_source(tmp_path, monkeypatch):
+    # The cache lives relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    ds = StubDataSource()
+    ds.incremental = True
+    ds.history["AAPL"] = make_history(["2024-01-02", "2024-01-03"], [10.0, 11.0])
+    ds.get_eod_data("AAPL")
+    return ds
+
+
+def test_incremental_fetch_requests_only_new_bars(data_source):
+    data_source.history["AAPL"] = make_history(
+        ["2024-01-02", "2024-01-03", "2024-01-04"], [10.0, 11.0, 12.0]
+    )
+
+    df = data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+
+    assert data_source.requests[-1] == ("AAPL", "2024-01-03")
+    assert list(df["adj_close"]) == [10.0, 11.0, 12.0]
+
+    cached_df = CacheUtil.load_from_cache(CacheUtil.cache_path("Stub", "AAPL"))
+    assert len(cached_df) == 3
+
+
+def test_incremental_fetch_refetches_on_revised_adj_close(data_source):
+    # A dividend re-adjusts the whole history, including the overlapping bar
+    data_source.history["AAPL"] = make_history(
+        ["2024-01-02", "2024-01-03", "2024-01-04"], [9.0, 10.0, 12.0]
+    )
+
+    df = data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+
+    assert data_source.requests[-2:] == [("AAPL", "2024-01-03"), ("AAPL", None)]
+    assert list(df["adj_close"]) == [9.0, 10.0, 12.0]
+
+
+def test_incremental_fetch_refetches_on_split(data_source):
+    data_source.history["AAPL"] = make_history(
+        ["2024-01-02", "2024-01-03", "2024-01-04"], [10.0, 11.0, 6.0], split=[1.0, 1.0, 2.0]
+    )
+
+    data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+
+    assert data_source.requests[-1] == ("AAPL", None)
+
+
+def test_full_fetch_when_incremental_disabled(data_source):
+    data_source.incremental = False
+
+    data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+
+    assert data_source.requests[-1] == ("AAPL", None)
+
+
+def test_preprocess_data_builds_the_target_schema(data_source):
+    data_source.COLUMN_MAPPINGS = {"adjClose": "adj_close"}
+    index = pd.DatetimeIndex(["2024-01-03", "2024-01-02"], tz="America/New_York")
+    source_df = pd.DataFrame(
+        {"extra": [1, 2], "close": [11, 10], "adjClose": [11.0, 10.0], "dividend": [0, 0], "split": [1, 1]},
+        index=index,
+    )
+
+    df = data_source._preprocess_data("AAPL", source_df)
+
+    assert list(df.columns) == StubDataSource.COLUMN_ORDER
+    assert df.index.name == "date"
+    assert df.index.tz is None
+    assert list(df.index) == list(pd.to_datetime(["2024-01-02", "2024-01-03"]))
+    assert list(df["adj_close"]) == [10.0, 11.0]
+    assert (df.dtypes[["close", "adj_close", "dividend", "split"]] == "float64").all()
+    assert list(df["ticker"]) == ["AAPL", "AAPL"]
+    # The source frame is left untouched
+    assert list(source_df.columns) == ["extra", "close", "adjClose", "dividend", "split"]
+    assert source_df.index.name is None
+
+
+def test_get_eod_data_many_reports_errors_per_ticker(data_source):
+    data_source.history["MSFT"] = make_history(["2024-01-02", "2024-01-03"], [20.0, 21.0])
+
+    result = data_source.get_eod_data_many(["AAPL", "BOGUS", "MSFT"])
+
+    assert list(result) == ["AAPL", "MSFT"]
+    assert list(result.errors) == ["BOGUS"]
+    assert isinstance(result.errors["BOGUS"], KeyError)
+
+
+class BatchStubDataSource(StubDataSource):
+    supports_batch_fetch = True
+
+    def __init__(self, name="Stub", api_key=None):
+        super().__init__(name)
+        self.batches = []
+
+    def _fetch_many_from_source(self, tickers):
+        self.batches.append(list(tickers))
+        for ticker in tickers:
+            if ticker in self.history:
+                yield ticker, self.history[ticker].copy()
+
+
+def test_get_eod_data_many_fetches_missing_tickers_in_a_batch(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data_source = BatchStubDataSource()
+    data_source.history["AAPL"] = make_history(["2024-01-02", "2024-01-03"], [10.0, 11.0])
+    data_source.history["MSFT"] = make_history(["2024-01-02", "2024-01-03"], [20.0, 21.0])
+    data_source.get_eod_data("AAPL")
+
+    result = data_source.get_eod_data_many(["AAPL", "MSFT", "BOGUS"])
+
+    # Only the tickers missing from the cache are batched, and only BOGUS is fetched alone
+    assert data_source.batches == [["MSFT", "BOGUS"]]
+    assert data_source.requests == [("AAPL", None), ("BOGUS", None)]
+    assert list(result["MSFT"]["adj_close"]) == [20.0, 21.0]
+    assert list(result.errors) == ["BOGUS"]
+
+    data_source.get_eod_data_many(["AAPL", "MSFT"])
+    assert len(data_source.batches) == 1
+
+
+def test_get_eod_data_many_as_frame(data_source):
+    data_source.history["MSFT"] = make_history(["2024-01-02", "2024-01-03"], [20.0, 21.0])
+
+    df = data_source.get_eod_data_many(["AAPL", "MSFT"], as_frame=True)
+
+    assert df.index.names == ["ticker", "date"]
+    assert list(df.loc["MSFT", "adj_close"]) == [20.0, 21.0]
+    assert df.attrs["errors"] == {}
+
+
+def test_get_eod_data_many_aggregates_all_tickers_at_once(data_source, monkeypatch):
+    metrics = MetricsRegistry()
+    monkeypatch.setattr(data_source, "metrics", metrics)
+    data_source.history["MSFT"] = make_history(
+        ["2024-01-30", "2024-03-01", "2024-03-04"], [20.0, 21.0, 22.0], split=[1.0, 2.0, 1.0]
+    )
+
+    result = data_source.get_eod_data_many(["AAPL", "MSFT"], interval="monthly")
+
+    for ticker in ["AAPL", "MSFT"]:
+        pd.testing.assert_frame_equal(result[ticker], data_source.get_eod_data(ticker, interval="monthly"))
+    assert result["MSFT"].index.freq == "ME"
+    assert list(result["MSFT"]["split"].fillna(-1)) == [1.0, -1, 2.0]
+
+    histogram = metrics.histogram("fin_ds_stage_seconds", source="Stub", stage="aggregate")
+    # A no-op daily stage per ticker in the batch, one shared reduction, and the two calls above
+    assert histogram.count == 2 + 1 + 2
+
+
+def test_get_panel_aligns_tickers(data_source):
+    data_source.history["MSFT"] = make_history(["2024-01-03", "2024-01-04"], [21.0, 22.0])
+
+    panel = data_source.get_panel(["AAPL", "MSFT", "BOGUS"], fields=["close", "adj_close"])
+
+    assert list(panel.columns.names) == ["field", "ticker"]
+    assert list(panel["adj_close"].columns) == ["AAPL", "MSFT"]
+    assert list(panel[("adj_close", "AAPL")].fillna(-1)) == [10.0, 11.0, -1]
+    assert list(panel[("adj_close", "MSFT")].fillna(-1)) == [-1, 21.0, 22.0]
+    assert list(panel.attrs["errors"]) == ["BOGUS"]
+
+    values, index, fields, tickers = data_source.get_panel(
+        ["AAPL", "MSFT"], how="intersection", ffill=True, as_array=True
+    )
+    assert values.shape == (1, 1, 2)
+    assert list(index) == [pd.Timestamp("2024-01-03")]
+    assert fields == ["adj_close"] and tickers == ["AAPL", "MSFT"]
+
+
+def test_get_panel_aggregates_the_aligned_panel(data_source):
+    data_source.history["MSFT"] = make_history(["2024-01-31", "2024-02-01"], [21.0, 22.0])
+
+    panel = data_source.get_panel(["AAPL", "MSFT"], interval="monthly")
+
+    assert panel.index.freq == "ME"
+    assert list(panel[("adj_close", "AAPL")].fillna(-1)) == [11.0, -1]
+    assert list(panel[("adj_close", "MSFT")]) == [21.0, 22.0]
+
+
+def test_get_panel_splices_backfill_chains(data_source):
+    data_source.history["MSFT"] = make_history(["2024-01-03", "2024-01-04"], [22.0, 24.0])
+    data_source.history["OLD"] = make_history(["2024-01-01", "2024-01-02"], [4.0, 5.0])
+    data_source.history["OLDER"] = make_history(["2023-12-29", "2024-01-01"], [1.0, 2.0])
+
+    panel = data_source.get_panel(["AAPL", "MSFT"], backfill_ticker=["OLD", "OLDER"])
+
+    for ticker in ["AAPL", "MSFT"]:
+        expected = data_source.get_eod_data(ticker, backfill_ticker=["OLD", "OLDER"])["adj_close"]
+        np.testing.assert_allclose(panel[("adj_close", ticker)].dropna(), expected)
+
+    panel = data_source.get_panel(["AAPL", "MSFT"], backfill_ticker={"MSFT": "AAPL"})
+    assert list(panel[("adj_close", "MSFT")]) == [20.0, 22.0, 24.0]
+    assert list(panel[("adj_close", "AAPL")].fillna(-1)) == [10.0, 11.0, -1]
+
+
+def test_get_panel_rejects_unknown_fields(data_source):
+    with pytest.raises(ValueError):
+        data_source.get_panel(["AAPL"], fields=["volume"])
+
+def test_metrics_record_stages_and_cache_requests(data_source, monkeypatch):
+    metrics = MetricsRegistry()
+    monkeypatch.setattr(data_source, "metrics", metrics)
+    data_source.history["MSFT"] = make_history(["2024-01-02", "2024-01-03"], [20.0, 21.0])
+
+    data_source.get_eod_data("MSFT", interval="weekly")
+    data_source.get_eod_data("MSFT", interval="weekly")
+
+    def count(name, **labels):
+        return metrics.counter_value(name, source="Stub", **labels)
+
+    def stage_count(stage):
+        histogram = metrics.histogram("fin_ds_stage_seconds", source="Stub", stage=stage)
+        return histogram.count if histogram is not None else 0
+
+    assert count("fin_ds_cache_requests_total", result="miss") == 1
+    assert count("fin_ds_cache_requests_total", result="hit") == 1
+    assert count("fin_ds_rows_fetched_total") == 2
+    assert count("fin_ds_cache_written_bytes_total") > 0
+    assert count("fin_ds_cache_read_bytes_total") == count("fin_ds_cache_written_bytes_total")
+    assert stage_count("fetch") == 1
+    assert stage_count("preprocess") == 1
+    assert stage_count("cache_save") == 1
+    assert stage_count("cache_load") == 1
+    assert stage_count("aggregate") == 2
+
+
+def test_tracer_receives_nested_spans(data_source):
+    data_source.tracer = CollectingTracer()
+    data_source.history["MSFT"] = make_history(["2024-01-02", "2024-01-03"], [20.0, 21.0])
+
+    data_source.get_eod_data("MSFT", interval="weekly")
+    data_source.get_eod_data("MSFT")
+
+    miss, hit = data_source.tracer.spans
+    assert miss.name == "get_eod_data"
+    assert miss.attributes == {"source": "Stub", "ticker": "MSFT", "interval": "weekly", "rows": 1}
+    assert [span.attributes["cache"] for span in miss.find("cache_lookup")] == ["miss", "miss"]
+    assert miss.find("preprocess")[0].attributes["rows"] == 2
+    assert [span.name for span in miss.children] == [
+        "cache_lookup",
+        "cache_lookup",
+        "fetch",
+        "preprocess",
+        "cache_save",
+        "aggregate",
+    ]
+
+    assert hit.find("cache_lookup")[0].attributes["cache"] == "hit"
+    assert hit.find("fetch") == []
+
+
+def test_get_eod_data_many_respects_max_concurrency(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    class SlowDataSource(StubDataSource):
+        max_concurrency = 2
+
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _fetch_data_from_source(self, ticker, start_date=None):
+            with self.lock:
+                SlowDataSource.active += 1
+                SlowDataSource.peak = max(SlowDataSource.peak, SlowDataSource.active)
+            time.sleep(0.05)
+            with self.lock:
+                SlowDataSource.active -= 1
+            return make_history(["2024-01-02"], [1.0])
+
+    result = SlowDataSource().get_eod_data_many([f"T{i}" for i in range(8)], max_workers=8)
+
+    assert len(result) == 8
+    assert SlowDataSource.peak == 2
+
+
+def test_aget_eod_data_matches_get_eod_data(data_source):
+    df = asyncio.run(data_source.aget_eod_data("AAPL", interval="monthly"))
+
+    pd.testing.assert_frame_equal(df, data_source.get_eod_data("AAPL", interval="monthly"))
+
+
+def test_aget_eod_data_many_reports_errors_per_ticker(data_source):
+    data_source.history["MSFT"] = make_history(["2024-01-02", "2024-01-03"], [20.0, 21.0])
+
+    result = asyncio.run(data_source.aget_eod_data_many(["MSFT", "BOGUS"]))
+
+    assert list(result) == ["MSFT"]
+    assert list(result.errors) == ["BOGUS"]
+    assert ("MSFT", None) in data_source.requests
+
+
+def test_memory_cache_avoids_disk_loads(data_source, monkeypatch):
+    data_source.memory_cache = MemoryCache()
+    data_source.get_eod_data("AAPL")
+
+    load_from_cache = mock.Mock(wraps=CacheUtil.load_from_cache)
+    monkeypatch.setattr(CacheUtil, "load_from_cache", load_from_cache)
+    df = data_source.get_eod_data("AAPL")
+
+    load_from_cache.assert_not_called()
+    assert list(df["adj_close"]) == [10.0, 11.0]
+
+
+def test_memory_cache_is_updated_when_cache_is_rewritten(data_source):
+    data_source.memory_cache = MemoryCache()
+    data_source.get_eod_data("AAPL")
+    data_source.history["AAPL"] = make_history(["2024-01-02", "2024-01-03"], [20.0, 21.0])
+
+    data_source.incremental = False
+    data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+    df = data_source.get_eod_data("AAPL")
+
+    assert list(df["adj_close"]) == [20.0, 21.0]
+
+
+def test_concurrent_fetches_of_the_same_ticker_are_coalesced(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    class SlowDataSource(StubDataSource):
+        def _fetch_data_from_source(self, ticker, start_date=None):
+            time.sleep(0.1)
+            return super()._fetch_data_from_source(ticker, start_date)
+
+    data_source = SlowDataSource()
+    data_source.history["AAPL"] = make_history(["2024-01-02", "2024-01-03"], [10.0, 11.0])
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        frames = list(executor.map(lambda _: data_source.get_eod_data("AAPL"), range(5)))
+
+    assert data_source.requests == [("AAPL", None)]
+    assert all(list(df["adj_close"]) == [10.0, 11.0] for df in frames)
+    # Every caller gets its own copy
+    assert len({id(df) for df in frames}) == 5
+
+
+def test_concurrent_fetches_with_different_settings_are_not_coalesced(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    class SlowDataSource(StubDataSource):
+        def _fetch_data_from_source(self, ticker, start_date=None):
+            time.sleep(0.1)
+            return super()._fetch_data_from_source(ticker, start_date)
+
+    compact_source = SlowDataSource()
+    compact_source.compact = True
+    compact_source.cache_format = "parquet"
+    default_source = SlowDataSource()
+    for data_source in (compact_source, default_source):
+        data_source.history["AAPL"] = make_history(["2024-01-02", "2024-01-03"], [10.0, 11.0])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        compact_df, default_df = executor.map(lambda ds: ds.get_eod_data("AAPL"), (compact_source, default_source))
+
+    assert compact_df["adj_close"].dtype == "float32"
+    assert default_df["adj_close"].dtype == "float64"
+    assert CacheUtil.cache_path("Stub", "AAPL", cache_format="csv").exists()
+    assert CacheUtil.cache_path("Stub", "AAPL", cache_format="parquet").exists()
+
+
+def test_concurrent_async_fetches_of_the_same_ticker_are_coalesced(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    data_source = StubDataSource()
+    data_source.history["AAPL"] = make_history(["2024-01-02", "2024-01-03"], [10.0, 11.0])
+
+    async def fetch_concurrently():
+        return await asyncio.gather(*(data_source.aget_eod_data("AAPL") for _ in range(5)))
+
+    frames = asyncio.run(fetch_concurrently())
+
+    assert data_source.requests == [("AAPL", None)]
+    assert len(frames) == 5
+
+
+def test_manifest_replaces_file_checks(data_source, monkeypatch):
+    data_source.use_manifest = True
+    data_source.incremental = False
+    data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+
+    metrics = MetricsRegistry()
+    monkeypatch.setattr(data_source, "metrics", metrics)
+    monkeypatch.setattr(data_source, "memory_cache", None)
+    data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+
+    cache_path = CacheUtil.cache_path("Stub", "AAPL")
+    stat = type(cache_path).stat
+    stat_paths = []
+    monkeypatch.setattr(
+        type(cache_path), "stat", lambda path, **kwargs: stat_paths.append(path) or stat(path, **kwargs)
+    )
+    df = data_source.get_eod_data("AAPL")
+    monkeypatch.setattr(type(cache_path), "stat", stat)
+
+    assert cache_path not in stat_paths
+    assert data_source.requests == [("AAPL", None), ("AAPL", None), ("AAPL", None)]
+    assert list(df["adj_close"]) == [10.0, 11.0]
+    # The read bytes are the size recorded in the manifest
+    assert metrics.counter_value(
+        "fin_ds_cache_read_bytes_total", source="Stub"
+    ) == cache_path.stat().st_size
+
+
+def test_materialized_aggregate_is_reused_until_daily_data_changes(data_source, monkeypatch):
+    data_source.materialize_aggregates = True
+    expected = data_source.get_eod_data("AAPL", interval="monthly")
+
+    derived = list((CacheUtil.cache_path("Stub", "AAPL").parent / "derived").glob("*.csv"))
+    assert len(derived) == 1
+
+    with mock.patch.object(data_source, "_fetch_data", side_effect=AssertionError) as fetch:
+        df = data_source.get_eod_data("AAPL", interval="monthly")
+    assert not fetch.called
+    pd.testing.assert_frame_equal(df, expected)
+
+    data_source.history["AAPL"] = make_history(
+        ["2024-01-02", "2024-01-03", "2024-02-01"], [10.0, 11.0, 12.0]
+    )
+    df = data_source.get_eod_data("AAPL", interval="monthly", max_cache_age_in_hours=0)
+
+    assert list(df["adj_close"]) == [11.0, 12.0]
+    derived = list((CacheUtil.cache_path("Stub", "AAPL").parent / "derived").glob("*.csv"))
+    assert len(derived) == 1
+
+
+def test_materialized_aggregate_is_stored_under_the_versions_it_was_computed_from(data_source):
+    data_source.materialize_aggregates = True
+    fetch = data_source._fetch_data
+
+    def fetch_while_another_process_refreshes(ticker, max_cache_age_in_hours):
+        df = fetch(ticker, max_cache_age_in_hours)
+        data_source.history["AAPL"] = make_history(
+            ["2024-01-02", "2024-01-03", "2024-02-01"], [10.0, 11.0, 12.0]
+        )
+        time.sleep(0.01)
+        fetch(ticker, 0)
+        return df
+
+    with mock.patch.object(data_source, "_fetch_data", fetch_while_another_process_refreshes):
+        df = data_source.get_eod_data("AAPL", interval="monthly")
+    assert list(df["adj_close"]) == [11.0]
+
+    # The aggregate of the old data is not taken for the refreshed daily entry
+    df = data_source.get_eod_data("AAPL", interval="monthly")
+    assert list(df["adj_close"]) == [11.0, 12.0]
+
+
+@pytest.mark.parametrize("cache_format", ["csv", "parquet"])
+def test_compact_mode_is_preserved_end_to_end(data_source, cache_format):
+    data_source.compact = True
+    data_source.cache_format = cache_format
+    data_source.history["AAPL"] = make_history(
+        ["2024-01-31", "2024-02-01"], [10.123456789, 11.0], dividend=[0.0, 0.25]
+    )
+    data_source.history["OLD"] = make_history(["2024-01-30", "2024-01-31"], [5.0, 5.0])
+    expected_dtypes = {"ticker": "category", "close": "float32", "adj_close": "float32", "dividend": "float32", "split": "float32"}
+
+    df = data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+    assert df.dtypes.astype(str).to_dict() == expected_dtypes
+    assert df["adj_close"].iloc[0] == pytest.approx(10.123456789, rel=6e-8)
+    assert df["dividend"].iloc[1] == 0.25
+
+    # Loaded from the cache, incrementally merged, spliced and aggregated
+    for kwargs in [{}, {"max_cache_age_in_hours": 0}, {"backfill_ticker": "OLD"}, {"interval": "monthly"}]:
+        df = data_source.get_eod_data("AAPL", **kwargs)
+        assert df.dtypes.astype(str).to_dict() == expected_dtypes, kwargs
+
+    panel = data_source.get_panel(["AAPL"])
+    assert panel.dtypes.unique().tolist() == [np.dtype("float32")]
+
+
+def test_compact_mode_rounds_volumes_to_integers():
+    df = DFUtil.apply_schema(
+        pd.DataFrame({"volume": [1.0, 2.6], "adj_volume": [1.0, np.nan]}),
+        BaseDataSource.COMPACT_COLUMN_DTYPES,
+    )
+
+    assert str(df["volume"].dtype) == "int64"
+    assert df["volume"].tolist() == [1, 3]
+    # Only volumes with missing values fall back to the nullable integer dtype
+    assert str(df["adj_volume"].dtype) == "Int64"
+    assert df["adj_volume"].tolist() == [1, pd.NA]
+    assert DFUtil.apply_schema(df, BaseDataSource.COMPACT_COLUMN_DTYPES) is df
+
+
+def test_compact_mode_memory_per_column():
+    rows = 1000
+    df = pd.DataFrame(
+        {column: np.arange(rows, dtype="float64") for column in BaseDataSource.COLUMN_DTYPES},
+        index=pd.date_range("2000-01-03", periods=rows, name="date"),
+    ).assign(ticker="AAPL")
+    df = DFUtil.apply_schema(df, BaseDataSource.COLUMN_DTYPES)
+
+    memory = DFUtil.apply_schema(df, BaseDataSource.COMPACT_COLUMN_DTYPES).memory_usage(index=False)
+    default_memory = df.memory_usage(index=False)
+
+    for column in ["open", "close", "adj_close", "dividend", "split"]:
+        assert memory[column] == default_memory[column] / 2 == 4 * rows
+    # Volumes are never larger than the default float64 volumes
+    assert memory["volume"] == memory["adj_volume"] == default_memory["volume"] == 8 * rows
+    assert memory["ticker"] < 2 * rows
+    assert memory.sum() < 58 * rows
+    assert default_memory.sum() == 104 * rows
@@ -1,3 +1,6 @@
+import json
+from pathlib import Path
+
 import pytest
 import pandas as pd
 from fin_ds.data_source_factory import DataSourceFactory
@@ -82,3 +85,49 @@ class TestEODHDDataSource:
 
         # Check that the DataFrame is resampled to monthly frequency
         assert df.index.freq == "ME", "The DataFrame should be resampled to monthly frequency"
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "eodhd"
+
+
+def test_bulk_daily_update_from_recorded_snapshot(tmp_path, monkeypatch):
+    from fin_ds.data_sources.eodhd import EODHDDataSource
+    from fin_ds.utils.cache_util import CacheUtil
+    from fin_ds.utils.http_util import HttpUtil
+
+    monkeypatch.chdir(tmp_path)
+
+    def fake_get_json(url, params=None, headers=None):
+        assert url == "https://eodhd.com/api/eod-bulk-last-day/US"
+        suffix = f"-{params['type']}" if "type" in params else ""
+        return json.loads((FIXTURES / f"eod-bulk-last-day-US{suffix}.json").read_text())
+
+    def history(ticker, dates):
+        index = pd.DatetimeIndex(pd.to_datetime(dates), name="date")
+        values = {column: 1.0 for column in ["open", "high", "low", "close", "adjusted_close", "volume"]}
+        return pd.DataFrame({"symbol": ticker, **values}, index=index)
+
+    monkeypatch.setattr(HttpUtil, "get_json", fake_get_json)
+    data_source = EODHDDataSource("EODHD", "demo")
+    fetched = []
+
+    def fake_fetch_data_from_source(ticker, start_date=None):
+        fetched.append(ticker)
+        return history(ticker, ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"])
+
+    monkeypatch.setattr(data_source, "_fetch_data_from_source", fake_fetch_data_from_source)
+    for ticker, last_date in [("AAPL", "2024-01-04"), ("MSFT", "2024-01-05"), ("NVDA", "2024-01-04"), ("TSLA.US", "2024-01-02")]:
+        df = data_source._preprocess_data(ticker, history(ticker, pd.bdate_range("2024-01-02", last_date)))
+        CacheUtil.save_to_cache(CacheUtil.cache_path("EODHD", ticker), df)
+
+    result = data_source.bulk_daily_update(["AAPL", "MSFT", "NVDA", "TSLA.US", "BOGUS"])
+
+    # NVDA split and TSLA.US missed days, so only they are fetched individually
+    assert dict(result) == {"AAPL": "appended", "MSFT": "current", "NVDA": "refetched", "TSLA.US": "refetched"}
+    assert list(result.errors) == ["BOGUS"]
+    assert fetched == ["NVDA", "TSLA.US"]
+
+    df = CacheUtil.load_from_cache(CacheUtil.cache_path("EODHD", "AAPL"))
+    assert list(df.index.strftime("%Y-%m-%d")) == ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]
+    assert df.loc["2024-01-05", "adj_close"] == 180.4
+    assert df.loc["2024-01-05", "ticker"] == "AAPL"
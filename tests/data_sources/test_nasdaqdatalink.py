@@ -95,3 +95,105 @@ class TestNasdaqDataLinkDataSource:
 
         # Check that the DataFrame is resampled to monthly frequency
         assert df.index.freq == "ME", "The DataFrame should be resampled to monthly frequency"
+
+
+class FakePage:
+    def __init__(self, df, next_cursor_id):
+        self.df = df
+        self.meta = {"next_cursor_id": next_cursor_id}
+
+    def to_pandas(self):
+        return self.df
+
+
+def make_table_rows(ticker, dates, adj_close):
+    return pd.DataFrame(
+        {
+            "ticker": ticker,
+            "date": pd.to_datetime(dates),
+            **{column: adj_close for column in ["open", "high", "low", "close", "adj_open", "adj_high", "adj_low", "adj_close"]},
+            "volume": 100.0,
+            "adj_volume": 100.0,
+            "dividend": 0.0,
+            "split": 1.0,
+        }
+    )
+
+
+def test_fetch_bulk_streams_pages_into_cache_entries(tmp_path, monkeypatch):
+    import nasdaqdatalink
+
+    from fin_ds.data_sources.nasdaqdatalink import NasdaqDataLinkDataSource
+    from fin_ds.utils.cache_util import CacheUtil
+
+    monkeypatch.chdir(tmp_path)
+    # BRK-B spans both pages
+    pages = {
+        None: FakePage(
+            pd.concat([make_table_rows("AAPL", ["2024-01-02"], [10.0]), make_table_rows("BRK_B", ["2024-01-02"], [20.0])]),
+            "cursor-1",
+        ),
+        "cursor-1": FakePage(make_table_rows("BRK_B", ["2024-01-03"], [21.0]), None),
+    }
+    requests = []
+
+    class FakeDatatable:
+        def __init__(self, code):
+            assert code == "QUOTEMEDIA/PRICES"
+
+        def data(self, params):
+            requests.append(params)
+            return pages[params.get("qopts.cursor_id")]
+
+    monkeypatch.setattr(nasdaqdatalink, "Datatable", FakeDatatable)
+    data_source = NasdaqDataLinkDataSource("NasdaqDataLink", None)
+
+    cached = data_source.fetch_bulk(["AAPL", "BRK-B", "BOGUS"])
+
+    assert cached == ["AAPL", "BRK-B"]
+    assert [params["ticker"] for params in requests] == [["AAPL", "BRK_B", "BOGUS"]] * 2
+    df = CacheUtil.load_from_cache(CacheUtil.cache_path("NasdaqDataLink", "BRK-B"))
+    assert list(df["adj_close"]) == [20.0, 21.0]
+    assert list(df.columns) == data_source.COLUMN_ORDER
+
+
+def test_fetch_bulk_with_start_date_merges_into_cache(tmp_path, monkeypatch):
+    import nasdaqdatalink
+
+    from fin_ds.data_sources.nasdaqdatalink import NasdaqDataLinkDataSource
+    from fin_ds.utils.cache_util import CacheUtil
+
+    monkeypatch.chdir(tmp_path)
+    history = pd.concat(
+        [
+            make_table_rows("AAPL", ["2024-01-02", "2024-01-03"], [10.0, 11.0]),
+            make_table_rows("MSFT", ["2024-01-02", "2024-01-03"], [20.0, 21.0]),
+        ]
+    )
+    requests = []
+
+    class FakeDatatable:
+        def __init__(self, code):
+            pass
+
+        def data(self, params):
+            requests.append(params)
+            rows = history[history["ticker"].isin(params["ticker"])]
+            if "date" in params:
+                rows = rows[rows["date"] >= params["date"]["gte"]]
+            return FakePage(rows, None)
+
+    monkeypatch.setattr(nasdaqdatalink, "Datatable", FakeDatatable)
+    data_source = NasdaqDataLinkDataSource("NasdaqDataLink", None)
+    data_source.fetch_bulk(["AAPL"])
+    history = pd.concat([history, make_table_rows("AAPL", ["2024-01-04"], [12.0])])
+
+    cached = data_source.fetch_bulk(["AAPL", "MSFT"], start_date="2024-01-03")
+
+    # MSFT was not cached, so its full history is fetched after the update
+    assert sorted(cached) == ["AAPL", "MSFT"]
+    assert requests[-1] == {"ticker": ["MSFT"]}
+    df = CacheUtil.load_from_cache(CacheUtil.cache_path("NasdaqDataLink", "AAPL"))
+    assert list(df["adj_close"]) == [10.0, 11.0, 12.0]
+    df = CacheUtil.load_from_cache(CacheUtil.cache_path("NasdaqDataLink", "MSFT"))
+    assert list(df["adj_close"]) == [20.0, 21.0]
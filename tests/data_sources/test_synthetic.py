@@ -0,0 +1,139 @@
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fin_ds.data_source_factory import DataSourceFactory
+from fin_ds.data_sources.synthetic import SyntheticDataSource, trading_days
+
+
+@pytest.fixture
+def data_source(tmp_path, monkeypatch):
+    # The cache lives relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    ds = DataSourceFactory("Synthetic")
+    ds.end_date = "2024-12-31"
+    return ds
+
+
+def test_histories_are_deterministic_per_ticker_and_seed(data_source):
+    df = data_source._fetch_data_from_source("AAPL")
+
+    pd.testing.assert_frame_equal(df, data_source._fetch_data_from_source("AAPL"))
+    assert not df["close"].equals(data_source._fetch_data_from_source("MSFT")["close"])
+
+    data_source.seed = 1
+    assert not df["close"].equals(data_source._fetch_data_from_source("AAPL")["close"])
+
+
+def test_later_end_date_only_appends_bars(data_source):
+    df = data_source._fetch_data_from_source("AAPL")
+    data_source.end_date = "2023-06-30"
+    earlier_df = data_source._fetch_data_from_source("AAPL")
+
+    columns = ["open", "high", "low", "close", "volume", "dividend", "split"]
+    pd.testing.assert_frame_equal(earlier_df[columns], df.loc[: "2023-06-30", columns])
+
+
+def test_histories_follow_the_exchange_calendar(data_source):
+    df = data_source._fetch_data_from_source("AAPL", start_date="2024-01-01")
+
+    assert df.index.min() >= pd.Timestamp("2024-01-01")
+    assert df.index.max() <= pd.Timestamp("2024-12-31")
+    assert (df.index.dayofweek < 5).all()
+    # Martin Luther King Jr. Day, Good Friday, Juneteenth, Independence Day and Christmas
+    holidays = pd.to_datetime(["2024-01-15", "2024-03-29", "2024-06-19", "2024-07-04", "2024-12-25"])
+    assert not df.index.isin(holidays).any()
+    assert len(trading_days("2024-01-01", "2024-12-31")) == 252
+
+
+def test_adjusted_prices_account_for_splits_and_dividends(data_source):
+    frames = [data_source._fetch_data_from_source(ticker) for ticker in SyntheticDataSource.universe(50)]
+    df = next(df for df in frames if (df["split"] == 2).sum() > 1 and (df["dividend"] != 0).any())
+
+    assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+    assert (df["low"] <= df[["open", "close"]].min(axis=1)).all()
+    # Adjusted prices equal the raw prices after the last corporate action
+    assert df["adj_close"].iloc[-1] == pytest.approx(df["close"].iloc[-1])
+
+    # Across a split, the raw close halves but the adjusted close does not
+    split_day = df.index[(df["split"] == 2) & (df["dividend"] == 0)][0]
+    day_before = df.index[df.index.get_loc(split_day) - 1]
+    raw_change = df.loc[split_day, "close"] / df.loc[day_before, "close"]
+    adjusted_change = df.loc[split_day, "adj_close"] / df.loc[day_before, "adj_close"]
+    assert raw_change == pytest.approx(adjusted_change / 2)
+
+    # Listing dates differ, so the universe has histories of different lengths
+    assert len({len(df) for df in frames}) > 1
+
+
+def test_incremental_update_only_generates_new_bars(data_source, monkeypatch):
+    data_source.incremental = True
+    data_source.end_date = "2024-06-28"
+    data_source.get_eod_data("AAPL")
+
+    requests = []
+    fetch = data_source._fetch_data_from_source
+    monkeypatch.setattr(
+        data_source,
+        "_fetch_data_from_source",
+        lambda ticker, start_date=None: requests.append(start_date) or fetch(ticker, start_date),
+    )
+    data_source.end_date = "2024-07-03"
+    df = data_source.get_eod_data("AAPL", max_cache_age_in_hours=0)
+
+    assert requests[0] == "2024-06-28"
+    pd.testing.assert_frame_equal(
+        df[["close", "adj_close"]],
+        data_source._preprocess_data("AAPL", fetch("AAPL"))[["close", "adj_close"]],
+        check_freq=False,
+    )
+
+
+def test_latency_is_simulated_per_request(data_source):
+    data_source.latency = 0.05
+    data_source.latency_jitter = 0.2
+
+    start = time.perf_counter()
+    data_source._fetch_data_from_source("AAPL")
+    assert time.perf_counter() - start >= 0.04
+
+
+def test_errors_are_injected_and_reported_per_ticker(data_source):
+    data_source.error_rate = 1.0
+
+    result = data_source.get_eod_data_many(["AAPL", "MSFT"])
+
+    assert len(result) == 0
+    assert set(result.errors) == {"AAPL", "MSFT"}
+    assert all(isinstance(e, ConnectionError) for e in result.errors.values())
+
+
+def test_async_requests_wait_concurrently(data_source):
+    data_source.latency = 0.5
+    tickers = SyntheticDataSource.universe(data_source.max_concurrency)
+
+    start = time.perf_counter()
+    result = asyncio.run(data_source.aget_eod_data_many(tickers))
+
+    assert list(result) == tickers
+    # One after the other, the delays alone would take latency * len(tickers)
+    assert time.perf_counter() - start < 0.5 * len(tickers)
+
+
+def test_batch_fetch_and_bulk_daily_update(data_source):
+    tickers = SyntheticDataSource.universe(5)
+    data_source.end_date = "2024-12-30"
+    result = data_source.get_eod_data_many(tickers)
+    assert list(result) == tickers
+
+    data_source.end_date = "2024-12-31"
+    result = data_source.bulk_daily_update(tickers)
+
+    assert not result.errors
+    assert set(result.values()) <= {"appended", "refetched"}
+    df = data_source.get_eod_data(tickers[0])
+    assert df.index.max() == pd.Timestamp("2024-12-31")
+    assert np.isfinite(df["adj_close"]).all()
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import pandas as pd
 from fin_ds.data_source_factory import DataSourceFactory
@@ -95,3 +97,55 @@ class TestTiingoDataSource:
 
         # Check that the DataFrame is resampled to monthly frequency
         assert df.index.freq == "ME", "The DataFrame should be resampled to monthly frequency"
+
+
+class FakeResponse:
+    status = 200
+    headers = {}
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self, content_type=None):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.requests = []
+
+    def get(self, url, params=None, headers=None):
+        self.requests.append((url, params, headers))
+        return FakeResponse(self.payload)
+
+
+def test_afetch_data_from_source_parses_json():
+    pytest.importorskip("tiingo")
+    from fin_ds.data_sources.tiingo import TiingoDataSource
+
+    data_source = TiingoDataSource("Tiingo", "test-key")
+    session = FakeSession(
+        [
+            {"date": "2024-01-02T00:00:00.000Z", "close": 10.0, "adjClose": 9.5, "divCash": 0.0},
+            {"date": "2024-01-03T00:00:00.000Z", "close": 11.0, "adjClose": 10.5, "divCash": 0.0},
+        ]
+    )
+
+    df = asyncio.run(data_source._afetch_data_from_source("AAPL", session, start_date="2024-01-02"))
+
+    url, params, headers = session.requests[0]
+    assert url == "https://api.tiingo.com/tiingo/daily/AAPL/prices"
+    assert params["startDate"] == "2024-01-02"
+    assert headers["Authorization"] == "Token test-key"
+    assert list(df["adjClose"]) == [9.5, 10.5]
+    assert isinstance(df.index, pd.DatetimeIndex)
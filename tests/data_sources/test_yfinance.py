@@ -79,3 +79,38 @@ class TestYFinanceDataSource:
 
         # Check that the DataFrame is resampled to monthly frequency
         assert df.index.freq == "ME", "The DataFrame should be resampled to monthly frequency"
+
+
+def test_fetch_many_from_source_splits_batches_by_ticker(monkeypatch):
+    import yfinance
+
+    from fin_ds.data_sources.yfinance import YFinanceDataSource
+
+    index = pd.DatetimeIndex(pd.to_datetime(["2024-01-02", "2024-01-03"]), name="Date")
+    calls = []
+
+    def fake_download(tickers, **kwargs):
+        calls.append(list(tickers))
+        assert kwargs["group_by"] == "ticker"
+        nan = float("nan")
+        # MSFT lacks a date, and tickers without data come back as all-NaN columns
+        values = {"MSFT": [[nan] * 6, [3.0] * 6], "BOGUS": [[nan] * 6] * 2}
+        columns = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+        frames = {
+            ticker: pd.DataFrame(values.get(ticker, [[1.0] * 6, [2.0] * 6]), index=index, columns=columns)
+            for ticker in tickers
+        }
+        return pd.concat(frames, axis=1)
+
+    monkeypatch.setattr(yfinance, "download", fake_download)
+    data_source = YFinanceDataSource("YFinance", None)
+    data_source.BATCH_SIZE = 2
+
+    result = dict(data_source._fetch_many_from_source(["AAPL", "MSFT", "BOGUS"]))
+
+    assert calls == [["AAPL", "MSFT"], ["BOGUS"]]
+    assert list(result) == ["AAPL", "MSFT"]
+    assert list(result["AAPL"]["Close"]) == [1.0, 2.0]
+    # Dates a ticker lacks are dropped
+    assert list(result["MSFT"].index) == [pd.Timestamp("2024-01-03")]
+    assert list(data_source._preprocess_data("MSFT", result["MSFT"]).columns) == data_source.COLUMN_ORDER
@@ -1,9 +1,13 @@
+import subprocess
 import sys
 import tempfile
+from importlib import metadata
 from pathlib import Path
 from unittest import mock
 
-from fin_ds.data_source_factory import DataSourceFactory
+import pytest
+
+from fin_ds.data_source_factory import ENTRY_POINT_GROUP, DataSourceFactory
 from fin_ds.data_sources.base_data_source import BaseDataSource
 
 
@@ -89,3 +93,54 @@ def test_get_eod_data():
     df = ds.get_eod_data("AAPL")
     assert df is not None
     assert len(df) > 0  # Ensure data was returned
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+
+def test_import_is_lazy():
+    """Importing the factory and listing the data sources imports no data source or pandas."""
+    loaded = run_python(
+        "import sys; from fin_ds.data_source_factory import DataSourceFactory; "
+        "DataSourceFactory.get_data_source_names(); "
+        "print(*[m for m in ('pandas', 'decouple', 'fin_ds.data_sources.base_data_source', "
+        "'fin_ds.data_sources.tiingo', 'fin_ds.data_sources.yfinance') if m in sys.modules])"
+    )
+    assert loaded == []
+
+
+def test_only_the_requested_data_source_is_imported():
+    loaded = run_python(
+        "import sys; from fin_ds.data_source_factory import DATA_SOURCES, DataSourceFactory; "
+        "DataSourceFactory('YFinance'); "
+        "print(*[name for name, module in DATA_SOURCES.items() if module in sys.modules])"
+    )
+    assert loaded == ["YFinance"]
+
+
+def test_entry_point_data_source(monkeypatch):
+    entry_point = metadata.EntryPoint(
+        name="Plugin",
+        value="fin_ds.data_sources.yfinance:YFinanceDataSource",
+        group=ENTRY_POINT_GROUP,
+    )
+    monkeypatch.setattr(metadata, "entry_points", lambda group: [entry_point] if group == ENTRY_POINT_GROUP else [])
+    monkeypatch.setattr(DataSourceFactory, "_data_sources", dict(DataSourceFactory._data_sources))
+
+    assert "Plugin" in DataSourceFactory.get_data_source_names()
+
+    ds = DataSourceFactory("Plugin")
+    assert type(ds).__name__ == "YFinanceDataSource"
+    assert ds.name == "Plugin"
+
+
+def test_unknown_data_source():
+    with pytest.raises(ValueError, match="not registered"):
+        DataSourceFactory("Unknown")
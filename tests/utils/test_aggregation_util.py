@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fin_ds.utils.aggregation_util import AggregationUtil
+
+
+@pytest.fixture
+def daily_df():
+    index = pd.DatetimeIndex(
+        pd.to_datetime(["2024-01-29", "2024-01-30", "2024-01-31", "2024-02-01", "2024-02-02"]),
+        name="date",
+    )
+    return pd.DataFrame(
+        {
+            "ticker": ["AAPL"] * 5,
+            "open": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "high": [10.0, 12.0, 11.0, 14.0, 13.0],
+            "low": [0.5, 0.4, 0.6, 0.3, 0.7],
+            "close": [1.5, 2.5, 3.5, 4.5, 5.5],
+            "volume": [100, 200, 300, 400, 500],
+            "dividend": [0.0, 0.2, 0.0, 0.0, 0.0],
+            "split": [1.0, 1.0, 1.0, 2.0, 1.0],
+        },
+        index=index,
+    )
+
+
+def test_aggregate_uses_column_reducers(daily_df):
+    df = AggregationUtil.aggregate(daily_df, "monthly")
+
+    assert df.index.freq == "ME"
+    assert list(df.index) == list(pd.to_datetime(["2024-01-31", "2024-02-29"]))
+    assert list(df["open"]) == [1.0, 4.0]
+    assert list(df["high"]) == [12.0, 14.0]
+    assert list(df["low"]) == [0.4, 0.3]
+    assert list(df["close"]) == [3.5, 5.5]
+    assert list(df["volume"]) == [600, 900]
+    assert list(df["dividend"]) == [0.2, 0.0]
+    assert list(df["split"]) == [1.0, 2.0]
+    assert list(df["ticker"]) == ["AAPL", "AAPL"]
+
+
+def test_aggregate_matches_resample_for_last(daily_df):
+    expected = daily_df[["close"]].resample("W").last()
+
+    df = AggregationUtil.aggregate(daily_df[["close"]], "weekly")
+
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_aggregate_custom_anchor(daily_df):
+    df = AggregationUtil.aggregate(daily_df, "W-WED")
+
+    assert list(df.index) == list(pd.to_datetime(["2024-01-31", "2024-02-07"]))
+    assert list(df["volume"]) == [600, 900]
+
+
+def test_aggregate_daily_is_unchanged(daily_df):
+    assert AggregationUtil.aggregate(daily_df, "daily") is daily_df
+
+
+def test_unsupported_interval(daily_df):
+    with pytest.raises(ValueError):
+        AggregationUtil.aggregate(daily_df, "fortnightly")
+
+
+def test_aggregate_many_matches_aggregate(daily_df):
+    frames = {
+        "AAPL": daily_df,
+        "MSFT": daily_df.iloc[[0, 4]].assign(ticker="MSFT"),
+        "NVDA": daily_df.iloc[3:].assign(ticker="NVDA").iloc[::-1],
+        "EMPTY": daily_df.iloc[:0],
+    }
+
+    for interval in ["weekly", "monthly", "W-WED", "3D"]:
+        aggregated = AggregationUtil.aggregate_many(frames, interval)
+
+        assert list(aggregated) == list(frames)
+        for ticker, df in frames.items():
+            pd.testing.assert_frame_equal(aggregated[ticker], AggregationUtil.aggregate(df, interval))
+
+
+def test_period_bins_are_cached(daily_df):
+    bins = AggregationUtil.period_bins(daily_df.index, "ME")
+
+    assert AggregationUtil.period_bins(daily_df.index.copy(), "ME") is bins
+    assert list(bins[0]) == [0, 0, 0, 1, 1]
+
+
+def test_aggregate_panel_matches_aggregate(daily_df):
+    fields = ["open", "high", "volume"]
+    other_df = daily_df.assign(open=daily_df["open"] * 2)
+    values = np.stack([daily_df[fields].to_numpy(float), other_df[fields].to_numpy(float)], axis=2)
+
+    aggregated, index = AggregationUtil.aggregate_panel(values, daily_df.index, fields, "monthly")
+
+    assert aggregated.shape == (2, 3, 2)
+    for position, df in enumerate([daily_df, other_df]):
+        expected = AggregationUtil.aggregate(df[fields], "monthly")
+        np.testing.assert_array_equal(aggregated[:, :, position], expected.to_numpy(float))
+    assert list(index) == list(pd.to_datetime(["2024-01-31", "2024-02-29"]))
@@ -0,0 +1,102 @@
+import sqlite3
+import time
+
+import pandas as pd
+import pytest
+
+from fin_ds.utils.cache_manifest import CacheManifest, main
+from fin_ds.utils.cache_util import CacheUtil
+
+
+def make_df():
+    return pd.DataFrame(
+        {"ticker": ["AAPL", "AAPL"], "adj_close": [1.5, 2.5]},
+        index=pd.DatetimeIndex(pd.to_datetime(["2024-01-02", "2024-01-03"]), name="date"),
+    )
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    manifest = CacheManifest(tmp_path)
+    yield manifest
+    manifest.close()
+
+
+def test_record_and_get(manifest, tmp_path):
+    manifest.record("YFinance", "AAPL", "csv", tmp_path / "YFinance-AAPL.csv", make_df(), size=123)
+
+    entry = manifest.get("YFinance", "AAPL", "csv")
+
+    assert entry["size"] == 123
+    assert entry["row_count"] == 2
+    assert entry["first_date"] == "2024-01-02"
+    assert entry["last_date"] == "2024-01-03"
+    assert entry["schema"] == {"ticker": "object", "adj_close": "float64"}
+    assert manifest.get("YFinance", "AAPL", "parquet") is None
+
+
+def test_stale_queries(manifest, tmp_path):
+    now = time.time()
+    manifest.record("YFinance", "AAPL", "csv", tmp_path / "a.csv", make_df(), now - 13 * 3600)
+    manifest.record("YFinance", "MSFT", "csv", tmp_path / "b.csv", make_df(), now)
+
+    assert [entry["ticker"] for entry in manifest.stale_entries(12)] == ["AAPL"]
+    assert manifest.stale_tickers("YFinance", ["AAPL", "MSFT", "NVDA"], 12) == ["AAPL", "NVDA"]
+
+
+def test_rebuild_from_existing_cache_files(manifest, tmp_path):
+    CacheUtil.save_to_cache(tmp_path / "YFinance-AAPL.csv", make_df())
+    CacheUtil.save_to_cache(tmp_path / "Tiingo-BRK-A.csv", make_df())
+
+    assert manifest.rebuild() == 2
+    assert manifest.get("Tiingo", "BRK-A", "csv")["row_count"] == 2
+    assert manifest.get("Tiingo", "BRK-A", "csv")["size"] == (tmp_path / "Tiingo-BRK-A.csv").stat().st_size
+    assert not CacheManifest.is_stale(manifest.get("YFinance", "AAPL", "csv"), 12)
+
+
+def test_manifests_without_sizes_are_migrated(tmp_path):
+    connection = sqlite3.connect(tmp_path / CacheManifest.MANIFEST_FILE_NAME)
+    connection.execute(
+        "CREATE TABLE entries (data_source TEXT NOT NULL, ticker TEXT NOT NULL, "
+        "cache_format TEXT NOT NULL, path TEXT NOT NULL, row_count INTEGER NOT NULL, "
+        "first_date TEXT, last_date TEXT, schema TEXT NOT NULL, fetched_at REAL NOT NULL, "
+        "PRIMARY KEY (data_source, ticker, cache_format))"
+    )
+    connection.execute("INSERT INTO entries VALUES ('YFinance', 'AAPL', 'csv', 'a.csv', 2, NULL, NULL, '{}', 0)")
+    connection.commit()
+    connection.close()
+
+    manifest = CacheManifest(tmp_path)
+    assert manifest.get("YFinance", "AAPL", "csv")["size"] is None
+    manifest.record("YFinance", "MSFT", "csv", tmp_path / "b.csv", make_df(), size=10)
+    assert manifest.get("YFinance", "MSFT", "csv")["size"] == 10
+    manifest.close()
+
+
+def test_rebuild_command(tmp_path, capsys):
+    CacheUtil.save_to_cache(tmp_path / "YFinance-AAPL.csv", make_df())
+
+    main(["--cache-dir", str(tmp_path), "rebuild"])
+
+    assert "Recorded 1 cache entries" in capsys.readouterr().out
+
+
+def test_rebuild_keeps_entries_visible_to_readers(manifest, tmp_path, monkeypatch):
+    CacheUtil.save_to_cache(tmp_path / "YFinance-AAPL.csv", make_df())
+    CacheUtil.save_to_cache(tmp_path / "YFinance-MSFT.csv", make_df())
+    manifest.rebuild()
+
+    # Another process reads the manifest while the cache files are being loaded
+    reader = CacheManifest(tmp_path)
+    seen = []
+    load_from_cache = CacheUtil.load_from_cache
+    monkeypatch.setattr(
+        CacheUtil,
+        "load_from_cache",
+        lambda *args, **kwargs: seen.append(len(reader.entries())) or load_from_cache(*args, **kwargs),
+    )
+
+    assert manifest.rebuild() == 2
+    assert seen == [2, 2]
+    assert reader._connection.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    reader.close()
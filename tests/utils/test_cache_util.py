@@ -44,37 +44,79 @@ def test_is_stale_true():
 
 
 @mock.patch("pandas.read_csv")
-def test_load_from_cache(mock_read_csv):
-    mock_path = mock.Mock(spec=Path)
+def test_load_from_cache(mock_read_csv, tmp_path):
+    cache_path = tmp_path / "YFinance-AAPL.csv"
     mock_df = pd.DataFrame({"A": [1, 2], "B": [3.0, 4.0]})
     mock_read_csv.return_value = mock_df
 
-    result = CacheUtil.load_from_cache(mock_path)
+    result = CacheUtil.load_from_cache(cache_path)
     pd.testing.assert_frame_equal(result, mock_df)
-    mock_read_csv.assert_called_once_with(mock_path, index_col=0, parse_dates=True)
+    mock_read_csv.assert_called_once_with(cache_path, index_col=0, parse_dates=True)
 
 
-@mock.patch("pandas.DataFrame.to_csv")
-def test_save_to_cache(mock_to_csv):
-    mock_path = mock.Mock(spec=Path)
-    mock_df = pd.DataFrame({"A": [1, 2], "B": [3.0, 4.0]})
+def test_save_to_cache(tmp_path):
+    cache_path = tmp_path / "fin-ds-cache" / "YFinance-AAPL.csv"
+    df = pd.DataFrame({"A": [1, 2], "B": [3.0, 4.0]})
 
-    CacheUtil.save_to_cache(mock_path, mock_df)
-    mock_path.parent.mkdir.assert_called_once_with(parents=True, exist_ok=True)
-    mock_to_csv.assert_called_once_with(mock_path)
+    CacheUtil.save_to_cache(cache_path, df)
+
+    pd.testing.assert_frame_equal(pd.read_csv(cache_path, index_col=0), df)
+    # The temporary file has been renamed over the cache file
+    assert not list(cache_path.parent.glob("*.tmp"))
 
 
 @mock.patch("pandas.read_csv", side_effect=Exception("Failed to read"))
-def test_load_from_cache_error(mock_read_csv):
-    mock_path = mock.Mock(spec=Path)
+def test_load_from_cache_error(mock_read_csv, tmp_path):
+    cache_path = tmp_path / "YFinance-AAPL.csv"
     with pytest.raises(Exception, match="Failed to read"):
-        CacheUtil.load_from_cache(mock_path)
+        CacheUtil.load_from_cache(cache_path)
 
 
 @mock.patch("pandas.DataFrame.to_csv", side_effect=Exception("Failed to write"))
-def test_save_to_cache_error(mock_to_csv):
-    mock_path = mock.Mock(spec=Path)
+def test_save_to_cache_error(mock_to_csv, tmp_path):
+    cache_path = tmp_path / "YFinance-AAPL.csv"
     mock_df = pd.DataFrame({"A": [1, 2], "B": [3.0, 4.0]})
 
     with pytest.raises(Exception, match="Failed to write"):
-        CacheUtil.save_to_cache(mock_path, mock_df)
+        CacheUtil.save_to_cache(cache_path, mock_df)
+    assert not cache_path.exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_save_to_cache_failure_keeps_previous_file(tmp_path):
+    cache_path = tmp_path / "YFinance-AAPL.csv"
+    index = pd.DatetimeIndex(pd.to_datetime(["2024-01-02", "2024-01-03"]), name="date")
+    df = pd.DataFrame({"A": [1, 2]}, index=index)
+    CacheUtil.save_to_cache(cache_path, df)
+
+    with mock.patch("pandas.DataFrame.to_csv", side_effect=Exception("Disk full")):
+        with pytest.raises(Exception, match="Disk full"):
+            CacheUtil.save_to_cache(cache_path, pd.DataFrame({"A": [3, 4]}, index=index))
+
+    pd.testing.assert_frame_equal(CacheUtil.load_from_cache(cache_path), df)
+
+
+def test_cache_path_uses_backend_extension():
+    path = CacheUtil.cache_path("YFinance", "AAPL", cache_format="parquet")
+    assert path.name == "YFinance-AAPL.parquet"
+
+
+def test_get_backend_unsupported_format():
+    with pytest.raises(ValueError, match="Unsupported cache format"):
+        CacheUtil.get_backend("xlsx")
+
+
+@pytest.mark.parametrize("cache_format", ["parquet", "feather"])
+def test_binary_backend_round_trip(tmp_path, cache_format):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {"ticker": ["AAPL", "AAPL"], "adj_close": [1.5, 2.5], "volume": [100, 200]},
+        index=pd.DatetimeIndex(pd.to_datetime(["2024-01-02", "2024-01-03"]), name="date"),
+    )
+    cache_path = tmp_path / f"YFinance-AAPL.{cache_format}"
+
+    CacheUtil.save_to_cache(cache_path, df, cache_format)
+    result = CacheUtil.load_from_cache(cache_path, cache_format)
+
+    # Binary formats keep the dtypes and the DatetimeIndex without any re-parsing
+    pd.testing.assert_frame_equal(result, df)
@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 from fin_ds.utils.df_util import DFUtil
+import pytest
 
 
 def test_merge_basic():
@@ -112,3 +114,92 @@ def test_splice_no_overlap():
 
     result = DFUtil.splice(original_df, backfill_df, column_name="adj_close")
     pd.testing.assert_frame_equal(result, expected)
+
+
+def test_splice_does_not_modify_inputs():
+    original_df = pd.DataFrame(
+        {"close": [200.0, 210.0], "adj_close": [200.0, 210.0]},
+        index=pd.to_datetime(["2024-01-01", "2024-01-02"]),
+    )
+    backfill_df = pd.DataFrame(
+        {"close": [90.0, 100.0], "adj_close": [90.0, 100.0]},
+        index=pd.to_datetime(["2023-12-31", "2024-01-01"]),
+    )
+    original_copy, backfill_copy = original_df.copy(), backfill_df.copy()
+
+    result = DFUtil.splice(original_df, backfill_df)
+
+    pd.testing.assert_frame_equal(original_df, original_copy)
+    pd.testing.assert_frame_equal(backfill_df, backfill_copy)
+    # Every price column is scaled by the same ratio
+    assert list(result["close"]) == [180.0, 200.0, 210.0]
+    assert list(result["adj_close"]) == [180.0, 200.0, 210.0]
+
+
+def test_splice_chain():
+    original_df = pd.DataFrame(
+        {"adj_close": [200.0, 210.0]}, index=pd.to_datetime(["2024-01-03", "2024-01-04"])
+    )
+    first_df = pd.DataFrame(
+        {"adj_close": [50.0, 100.0]}, index=pd.to_datetime(["2024-01-02", "2024-01-03"])
+    )
+    second_df = pd.DataFrame(
+        {"adj_close": [1.0, 2.0, 3.0]}, index=pd.to_datetime(["2023-12-31", "2024-01-01", "2024-01-02"])
+    )
+
+    result = DFUtil.splice_chain(original_df, [first_df, second_df])
+
+    expected = DFUtil.splice(DFUtil.splice(original_df, first_df), second_df)
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(result["adj_close"]) == [100.0 / 3, 200.0 / 3, 100.0, 200.0, 210.0]
+
+
+def test_splice_panel_matches_splice():
+    index = pd.to_datetime(["2023-12-31", "2024-01-01", "2024-01-02"])
+    fields = ["close", "adj_close", "volume"]
+    original_df = pd.DataFrame({"close": [200.0, 210.0], "adj_close": [200.0, 210.0], "volume": [5.0, 6.0]}, index=index[1:])
+    backfill_df = pd.DataFrame({"close": [90.0, 100.0], "adj_close": [90.0, 100.0], "volume": [7.0, 8.0]}, index=index[:2])
+
+    aligned, _ = DFUtil.align_panel({"A": original_df, "B": original_df, "A backfill": backfill_df}, fields)
+    values = aligned[:, :, :2]
+    # B has no backfill
+    backfill_values = np.stack([aligned[:, :, 2], np.full_like(aligned[:, :, 2], np.nan)], axis=2)
+
+    spliced = DFUtil.splice_panel(values, backfill_values, fields)
+
+    expected = DFUtil.splice(original_df, backfill_df)
+    np.testing.assert_array_equal(spliced[:, :, 0], expected[fields].to_numpy())
+    np.testing.assert_array_equal(spliced[:, :, 1], values[:, :, 1])
+
+
+def test_align_panel_union_and_intersection():
+    frames = {
+        "A": pd.DataFrame({"adj_close": [1.0, 2.0, 3.0]}, index=pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"])),
+        "B": pd.DataFrame({"adj_close": [10.0, 30.0]}, index=pd.to_datetime(["2024-01-01", "2024-01-03"])),
+    }
+
+    values, index = DFUtil.align_panel(frames, ["adj_close"])
+    assert values.shape == (3, 1, 2)
+    assert list(index) == list(pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]))
+    np.testing.assert_array_equal(values[:, 0, 0], [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(values[:, 0, 1], [10.0, np.nan, 30.0])
+
+    values, index = DFUtil.align_panel(frames, ["adj_close"], how="intersection")
+    assert list(index) == list(pd.to_datetime(["2024-01-01", "2024-01-03"]))
+    np.testing.assert_array_equal(values[:, 0, :], [[1.0, 10.0], [3.0, 30.0]])
+
+
+def test_align_panel_ffill():
+    frames = {
+        "A": pd.DataFrame({"adj_close": [1.0, 3.0]}, index=pd.to_datetime(["2024-01-02", "2024-01-04"])),
+        "B": pd.DataFrame({"adj_close": [5.0, 6.0, 7.0]}, index=pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"])),
+    }
+
+    values, _ = DFUtil.align_panel(frames, ["adj_close"], ffill=True)
+    np.testing.assert_array_equal(values[:, 0, 0], [np.nan, 1.0, 1.0, 3.0])
+    np.testing.assert_array_equal(values[:, 0, 1], [5.0, 6.0, 7.0, 7.0])
+
+
+def test_align_panel_unsupported_how():
+    with pytest.raises(ValueError):
+        DFUtil.align_panel({}, ["adj_close"], how="outer")
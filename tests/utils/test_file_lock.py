@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from fin_ds.utils.file_lock import FileLock
+
+
+def test_exclusive_lock_excludes_other_holders(tmp_path):
+    lock_path = tmp_path / "locks" / "YFinance-AAPL.csv.fetch.lock"
+
+    with FileLock(lock_path):
+        assert FileLock(lock_path).acquire(blocking=False) is False
+
+    other = FileLock(lock_path)
+    assert other.acquire(blocking=False) is True
+    other.release()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows only supports exclusive locks")
+def test_shared_locks_can_be_held_together(tmp_path):
+    lock_path = tmp_path / "YFinance-AAPL.csv.lock"
+    first = FileLock(lock_path, shared=True)
+    second = FileLock(lock_path, shared=True)
+
+    assert first.acquire(blocking=False) is True
+    assert second.acquire(blocking=False) is True
+    assert FileLock(lock_path).acquire(blocking=False) is False
+
+    first.release()
+    second.release()
+
+
+def test_lock_directory_is_only_created_when_missing(tmp_path, monkeypatch):
+    lock_path = tmp_path / "locks" / "YFinance-AAPL.csv.fetch.lock"
+    with FileLock(lock_path):
+        pass
+
+    mkdir_calls = []
+    monkeypatch.setattr(type(lock_path), "mkdir", lambda *args, **kwargs: mkdir_calls.append(args))
+    with FileLock(lock_path):
+        pass
+
+    assert mkdir_calls == []
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fin_ds.utils.http_util import HttpUtil
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(HttpUtil, "BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(HttpUtil, "BACKOFF_JITTER", 0)
+    HttpUtil.configure()
+    yield
+    HttpUtil.configure()
+
+
+@pytest.fixture
+def flaky_server():
+    """Serves a 503 for the first two requests of every path and JSON afterwards."""
+    requests_by_path = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            count = requests_by_path.get(self.path, 0) + 1
+            requests_by_path[self.path] = count
+            status, body = (503, b"") if count <= 2 else (200, json.dumps({"count": count}).encode())
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests_by_path
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_is_shared():
+    assert HttpUtil.session() is HttpUtil.session()
+
+
+def test_configure_applies_new_settings_to_the_shared_session():
+    session = HttpUtil.session()
+    try:
+        HttpUtil.configure(pool_size=4, max_retries=1)
+        adapter = session.get_adapter("https://example.com")
+
+        assert HttpUtil.session() is session
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 1
+        assert 429 in adapter.max_retries.status_forcelist
+    finally:
+        HttpUtil.configure(pool_size=16, max_retries=3)
+
+
+def test_transport_applies_to_sessions_handed_out_before_configure():
+    class Transport:
+        def adapter(self, network_adapter):
+            return ("transport", network_adapter)
+
+    # e.g. the session of a Tiingo client created before the settings changed
+    session = HttpUtil.session()
+    HttpUtil.configure(max_retries=1)
+    HttpUtil.use_transport(Transport())
+    try:
+        _, network_adapter = session.get_adapter("https://example.com")
+        assert network_adapter.max_retries.total == 1
+
+        HttpUtil.configure(max_retries=3)
+        _, network_adapter = session.get_adapter("https://example.com")
+        assert network_adapter.max_retries.total == 3
+    finally:
+        HttpUtil.use_transport(None)
+    assert session.get_adapter("https://example.com") is session.network_adapter
+
+
+def test_backoff_delay_grows_and_honours_retry_after(monkeypatch):
+    monkeypatch.setattr(HttpUtil, "BACKOFF_JITTER", 0)
+
+    assert HttpUtil.backoff_delay(0) == HttpUtil.BACKOFF_FACTOR
+    assert HttpUtil.backoff_delay(2) == HttpUtil.BACKOFF_FACTOR * 4
+    assert HttpUtil.backoff_delay(0, retry_after="7") == 7
+    assert HttpUtil.backoff_delay(10) == HttpUtil.BACKOFF_MAX
+
+
+def test_get_json_retries_server_errors(fast_retries, flaky_server):
+    url, requests_by_path = flaky_server
+
+    assert HttpUtil.get_json(f"{url}/prices") == {"count": 3}
+    assert requests_by_path["/prices"] == 3
+
+
+def test_get_json_raises_when_retries_are_exhausted(fast_retries, flaky_server, monkeypatch):
+    import requests
+
+    url, requests_by_path = flaky_server
+    monkeypatch.setattr(HttpUtil, "MAX_RETRIES", 1)
+    HttpUtil.configure()
+
+    with pytest.raises(requests.HTTPError):
+        HttpUtil.get_json(f"{url}/prices")
+    assert requests_by_path["/prices"] == 2
+
+
+def test_aget_json_retries_server_errors(fast_retries, flaky_server):
+    pytest.importorskip("aiohttp")
+    url, requests_by_path = flaky_server
+
+    async def fetch():
+        async with HttpUtil.client_session() as session:
+            return await HttpUtil.aget_json(session, f"{url}/prices")
+
+    assert asyncio.run(fetch()) == {"count": 3}
+    assert requests_by_path["/prices"] == 3
@@ -0,0 +1,48 @@
+import pandas as pd
+
+from fin_ds.utils.memory_cache import MemoryCache
+
+
+def make_df(rows):
+    return pd.DataFrame({"adj_close": [1.0] * rows})
+
+
+def test_get_returns_a_copy():
+    cache = MemoryCache()
+    cache.put(("YFinance", "AAPL"), 1, make_df(3))
+
+    df = cache.get(("YFinance", "AAPL"), 1)
+    df.loc[0, "adj_close"] = 100.0
+
+    assert cache.get(("YFinance", "AAPL"), 1).loc[0, "adj_close"] == 1.0
+
+
+def test_get_ignores_other_versions():
+    cache = MemoryCache()
+    cache.put(("YFinance", "AAPL"), 1, make_df(3))
+
+    assert cache.get(("YFinance", "AAPL"), 2) is None
+    assert len(cache) == 0
+
+
+def test_put_evicts_least_recently_used():
+    entry_bytes = int(make_df(100).memory_usage(deep=True).sum())
+    cache = MemoryCache(max_bytes=entry_bytes * 2)
+    cache.put("A", 1, make_df(100))
+    cache.put("B", 1, make_df(100))
+    cache.get("A", 1)
+
+    cache.put("C", 1, make_df(100))
+
+    assert cache.get("B", 1) is None
+    assert cache.get("A", 1) is not None
+    assert cache.get("C", 1) is not None
+    assert cache.current_bytes == entry_bytes * 2
+
+
+def test_put_skips_frames_larger_than_budget():
+    cache = MemoryCache(max_bytes=10)
+    cache.put("A", 1, make_df(100))
+
+    assert len(cache) == 0
+    assert cache.current_bytes == 0
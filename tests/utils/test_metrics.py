@@ -0,0 +1,64 @@
+import math
+
+import pytest
+
+from fin_ds.utils.metrics import MetricsRegistry
+
+
+def test_counters_are_keyed_by_labels():
+    metrics = MetricsRegistry()
+    metrics.inc("fin_ds_cache_requests_total", source="YFinance", result="hit")
+    metrics.inc("fin_ds_cache_requests_total", source="YFinance", result="hit")
+    metrics.inc("fin_ds_cache_requests_total", result="miss", source="YFinance")
+
+    assert metrics.counter_value("fin_ds_cache_requests_total", source="YFinance", result="hit") == 2
+    assert metrics.counter_value("fin_ds_cache_requests_total", result="miss", source="YFinance") == 1
+    assert metrics.counter_value("fin_ds_cache_requests_total", source="Tiingo", result="hit") == 0
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = MetricsRegistry(buckets=(0.1, 1))
+    for value in (0.05, 0.5, 0.7, 5):
+        metrics.observe("fin_ds_stage_seconds", value, stage="fetch")
+
+    (histogram,) = metrics.to_dict()["histograms"]["fin_ds_stage_seconds"]
+    assert histogram["labels"] == {"stage": "fetch"}
+    assert histogram["count"] == 4
+    assert histogram["sum"] == pytest.approx(6.25)
+    assert histogram["buckets"] == {0.1: 1, 1: 3, math.inf: 4}
+
+
+def test_timer_counts_errors():
+    metrics = MetricsRegistry()
+    with pytest.raises(ValueError):
+        with metrics.timer("fin_ds_stage_seconds", stage="fetch"):
+            raise ValueError("boom")
+
+    assert metrics.histogram("fin_ds_stage_seconds", stage="fetch").count == 1
+    assert metrics.counter_value("fin_ds_stage_errors_total", stage="fetch") == 1
+
+
+def test_disabled_registry_records_nothing():
+    metrics = MetricsRegistry()
+    metrics.enabled = False
+    metrics.inc("fin_ds_cache_requests_total")
+    with metrics.timer("fin_ds_stage_seconds"):
+        pass
+
+    assert metrics.to_dict() == {"counters": {}, "histograms": {}}
+
+
+def test_prometheus_export():
+    metrics = MetricsRegistry(buckets=(0.5,))
+    metrics.inc("fin_ds_cache_read_bytes_total", 2048, source='Odd "name"')
+    metrics.observe("fin_ds_stage_seconds", 0.25, source="YFinance", stage="fetch")
+
+    assert metrics.to_prometheus().splitlines() == [
+        "# TYPE fin_ds_cache_read_bytes_total counter",
+        'fin_ds_cache_read_bytes_total{source="Odd \\"name\\""} 2048',
+        "# TYPE fin_ds_stage_seconds histogram",
+        'fin_ds_stage_seconds_bucket{source="YFinance",stage="fetch",le="0.5"} 1',
+        'fin_ds_stage_seconds_bucket{source="YFinance",stage="fetch",le="+Inf"} 1',
+        'fin_ds_stage_seconds_sum{source="YFinance",stage="fetch"} 0.25',
+        'fin_ds_stage_seconds_count{source="YFinance",stage="fetch"} 1',
+    ]
@@ -0,0 +1,54 @@
+import pytest
+
+from fin_ds.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_reserve_allows_burst_up_to_capacity():
+    clock = FakeClock()
+    limiter = RateLimiter({"minute": 3}, clock=clock)
+
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_reserve_spaces_requests_at_the_allowed_rate():
+    clock = FakeClock()
+    limiter = RateLimiter({"minute": 2}, clock=clock)
+    limiter.reserve()
+    limiter.reserve()
+
+    # One token is refilled every 30 seconds, and each reservation queues behind the last
+    assert limiter.reserve() == pytest.approx(30.0)
+    assert limiter.reserve() == pytest.approx(60.0)
+
+    clock.now = 60.0
+    assert limiter.reserve() == pytest.approx(30.0)
+
+
+def test_reserve_respects_the_strictest_quota():
+    clock = FakeClock()
+    limiter = RateLimiter({"second": 10, "day": 2}, clock=clock)
+    limiter.reserve()
+    limiter.reserve()
+
+    assert limiter.reserve() == pytest.approx(12 * 60 * 60)
+
+
+def test_unsupported_period():
+    with pytest.raises(ValueError, match="Unsupported rate limit period"):
+        RateLimiter({"fortnight": 1})
+
+
+def test_shared_per_data_source_and_api_key():
+    limiter = RateLimiter.shared("Tiingo", "key-1", {"hour": 50})
+
+    assert RateLimiter.shared("Tiingo", "key-1", {"hour": 50}) is limiter
+    assert RateLimiter.shared("Tiingo", "key-2", {"hour": 50}) is not limiter
+    assert RateLimiter.shared("EODHD", "key-1", {"hour": 50}) is not limiter
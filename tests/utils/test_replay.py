@@ -0,0 +1,180 @@
+import asyncio
+import json
+import shutil
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from fin_ds.data_sources.eodhd import EODHDDataSource
+from fin_ds.utils.http_util import HttpUtil
+from fin_ds.utils.replay import ResponseArchive
+
+BARS = [
+    {"date": "2024-01-02", "open": 10.0, "high": 11.0, "low": 9.5, "close": 10.5, "adjusted_close": 10.5, "volume": 1},
+    {"date": "2024-01-03", "open": 10.5, "high": 12.0, "low": 10.0, "close": 11.5, "adjusted_close": 11.5, "volume": 2},
+]
+
+
+@pytest.fixture
+def server():
+    """Serves BARS as JSON for /api/eod/ paths and a 404 otherwise, counting the requests."""
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            requests_seen.append(self.path)
+            status, body = (200, json.dumps(BARS).encode()) if self.path.startswith("/api/eod/") else (404, b"")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    http_server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{http_server.server_port}", requests_seen
+    http_server.shutdown()
+    http_server.server_close()
+
+
+@pytest.fixture
+def data_source(server, tmp_path, monkeypatch):
+    # The cache lives relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    url, _ = server
+    monkeypatch.setattr(EODHDDataSource, "EOD_URL", f"{url}/api/eod/{{ticker}}")
+    return EODHDDataSource("EODHD", "secret-key")
+
+
+def test_replay_serves_recorded_responses_without_the_network(server, data_source, tmp_path):
+    _, requests_seen = server
+    archive_path = tmp_path / "eodhd.zip"
+
+    with ResponseArchive.record(archive_path):
+        recorded_df = data_source.get_eod_data("AAPL")
+    assert len(requests_seen) == 1
+
+    shutil.rmtree(tmp_path / "fin-ds-cache")
+
+    # A later end date does not change the request key
+    data_source.end_date = "2999-12-31"
+    with ResponseArchive.replay(archive_path):
+        replayed_df = data_source.get_eod_data("AAPL")
+
+    assert len(requests_seen) == 1
+    pd.testing.assert_frame_equal(replayed_df, recorded_df)
+
+    # The API key is never written to the archive
+    with zipfile.ZipFile(archive_path) as archive:
+        assert not any(b"secret-key" in archive.read(name) for name in archive.namelist())
+
+
+def test_replay_reaches_clients_created_before_configure(server, tmp_path):
+    pytest.importorskip("tiingo")
+    from fin_ds.data_sources.tiingo import TiingoDataSource
+
+    url, requests_seen = server
+    client = TiingoDataSource("Tiingo", "secret-key").api_client
+    client._base_url = url
+    archive_path = tmp_path / "tiingo.zip"
+
+    HttpUtil.configure(pool_size=4)
+    try:
+        with ResponseArchive.record(archive_path):
+            client._request("GET", "api/eod/AAPL")
+        HttpUtil.configure(pool_size=8)
+        with ResponseArchive.replay(archive_path):
+            assert client._request("GET", "api/eod/AAPL").json() == BARS
+    finally:
+        HttpUtil.configure(pool_size=16)
+
+    assert len(requests_seen) == 1
+
+
+def test_async_replay_serves_sync_recordings(server, data_source, tmp_path):
+    pytest.importorskip("aiohttp")
+    archive_path = tmp_path / "eodhd.zip"
+    with ResponseArchive.record(archive_path):
+        data_source._fetch_data_from_source("AAPL")
+
+    async def fetch():
+        async with HttpUtil.client_session() as session:
+            return await data_source._afetch_data_from_source("AAPL", session)
+
+    with ResponseArchive.replay(archive_path):
+        df = asyncio.run(fetch())
+
+    assert list(df["close"]) == [10.5, 11.5]
+
+
+def test_async_recordings_replay_errors(server, tmp_path):
+    aiohttp = pytest.importorskip("aiohttp")
+    url, _ = server
+    archive_path = tmp_path / "errors.zip"
+
+    async def fetch():
+        async with HttpUtil.client_session() as session:
+            return await HttpUtil.aget_json(session, f"{url}/missing")
+
+    with ResponseArchive.record(archive_path):
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(fetch())
+
+    with ResponseArchive.replay(archive_path):
+        with pytest.raises(aiohttp.ClientResponseError) as error:
+            asyncio.run(fetch())
+    assert error.value.status == 404
+
+
+def test_replay_raises_for_requests_that_were_not_recorded(server, tmp_path):
+    url, _ = server
+    archive_path = tmp_path / "empty.zip"
+    with ResponseArchive.record(archive_path):
+        pass
+
+    with ResponseArchive.replay(archive_path):
+        with pytest.raises(LookupError):
+            HttpUtil.get_json(f"{url}/api/eod/AAPL")
+
+    # Requests go to the network again afterwards
+    assert HttpUtil.get_json(f"{url}/api/eod/AAPL") == BARS
+
+
+def test_client_calls_are_replayed_with_recorded_latency(tmp_path):
+    archive_path = tmp_path / "client.zip"
+    df = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.to_datetime(["2024-01-02", "2024-01-03"]))
+
+    def download():
+        time.sleep(0.1)
+        return df
+
+    with ResponseArchive.record(archive_path) as archive:
+        HttpUtil.call_client("yfinance", "download AAPL", download)
+        HttpUtil.call_client("yfinance", "download AAPL", lambda: df.iloc[:1])
+    assert archive.keys() == ["yfinance download AAPL"]
+
+    def replay_call():
+        return HttpUtil.call_client("yfinance", "download AAPL", pytest.fail)
+
+    with ResponseArchive.replay(archive_path):
+        start = time.perf_counter()
+        pd.testing.assert_frame_equal(replay_call(), df)
+        assert time.perf_counter() - start < 0.1
+        # Repeated requests are replayed in the recorded order, repeating the last one
+        assert len(replay_call()) == 1
+        assert len(replay_call()) == 1
+
+    with ResponseArchive.replay(archive_path, latency=1.0):
+        start = time.perf_counter()
+        replay_call()
+        assert time.perf_counter() - start >= 0.09
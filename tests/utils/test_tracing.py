@@ -0,0 +1,132 @@
+import asyncio
+import contextlib
+import time
+
+import pytest
+
+from fin_ds.utils.tracing import CollectingTracer, OpenTelemetryTracer, ProfilingTracer, Tracer
+
+
+def test_collecting_tracer_nests_spans():
+    tracer = CollectingTracer()
+    with tracer.start_span("get_eod_data", {"ticker": "AAPL"}) as root:
+        with tracer.start_span("cache_lookup") as lookup:
+            lookup.set_attribute("cache", "miss")
+        with tracer.start_span("fetch"):
+            pass
+
+    assert list(tracer.spans) == [root]
+    assert [child.name for child in root.children] == ["cache_lookup", "fetch"]
+    assert root.find("cache_lookup")[0].attributes == {"cache": "miss"}
+    assert root.to_dict()["attributes"] == {"ticker": "AAPL"}
+
+
+def test_collecting_tracer_nests_spans_of_worker_threads():
+    tracer = CollectingTracer()
+
+    def load():
+        with tracer.start_span("cache_load"):
+            pass
+
+    async def request():
+        with tracer.start_span("aget_eod_data"):
+            await asyncio.to_thread(load)
+
+    asyncio.run(request())
+
+    (root,) = tracer.spans
+    assert [child.name for child in root.children] == ["cache_load"]
+
+
+def test_collecting_tracer_records_errors():
+    tracer = CollectingTracer()
+    with pytest.raises(ValueError):
+        with tracer.start_span("fetch"):
+            raise ValueError("boom")
+
+    assert tracer.spans[0].error == "ValueError('boom')"
+    assert tracer.spans[0].end_time is not None
+
+
+def test_opentelemetry_tracer_forwards_spans():
+    class FakeSpan:
+        def __init__(self):
+            self.attributes = {}
+
+        def set_attribute(self, key, value):
+            self.attributes[key] = value
+
+    class FakeOpenTelemetryTracer:
+        def __init__(self):
+            self.spans = []
+
+        @contextlib.contextmanager
+        def start_as_current_span(self, name, attributes=None):
+            span = FakeSpan()
+            span.attributes.update(attributes)
+            self.spans.append((name, span))
+            yield span
+
+    otel_tracer = FakeOpenTelemetryTracer()
+    tracer = OpenTelemetryTracer(otel_tracer)
+    with tracer.start_span("fetch", {"ticker": "AAPL", "start_date": None}) as span:
+        span.set_attribute("rows", 3)
+
+    assert otel_tracer.spans[0][0] == "fetch"
+    assert otel_tracer.spans[0][1].attributes == {"ticker": "AAPL", "rows": 3}
+
+
+def test_profiling_tracer_writes_profiles_of_slow_requests(tmp_path):
+    inner = CollectingTracer()
+    tracer = ProfilingTracer(inner, threshold=0.05, interval=0.001, output_dir=tmp_path)
+
+    with tracer.start_span("get_eod_data", {"source": "Stub", "ticker": "AAPL"}):
+        with tracer.start_span("fetch"):
+            time.sleep(0.1)
+    with tracer.start_span("get_eod_data", {"source": "Stub", "ticker": "MSFT"}):
+        pass
+
+    (profile,) = tmp_path.glob("*.folded")
+    assert "Stub-AAPL-get_eod_data" in profile.name
+    assert inner.spans[0].attributes["profile"] == str(profile)
+    assert "profile" not in inner.spans[1].attributes
+
+    lines = profile.read_text().splitlines()
+    assert lines
+    # The sleep is attributed to the fetch stage of the request
+    assert any(
+        line.startswith("get_eod_data;fetch;")
+        and "test_tracing.py:test_profiling_tracer_writes_profiles_of_slow_requests" in line
+        for line in lines
+    )
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_profiling_tracer_keeps_the_stages_of_interleaved_tasks_apart(tmp_path):
+    tracer = ProfilingTracer(threshold=0, interval=0.001, output_dir=tmp_path)
+
+    async def request(ticker, stage):
+        with tracer.start_span("aget_eod_data", {"source": "Stub", "ticker": ticker}):
+            with tracer.start_span(stage):
+                await asyncio.sleep(0.02)
+                # Block the event loop so that samples are taken within the stage
+                time.sleep(0.02)
+            await asyncio.sleep(0.02)
+
+    async def fetch_concurrently():
+        await asyncio.gather(request("AAPL", "fetch"), request("MSFT", "cache_load"))
+
+    asyncio.run(fetch_concurrently())
+
+    # Only the first request is profiled, without the stages of the other one
+    (profile,) = tmp_path.glob("*.folded")
+    assert "Stub-AAPL-aget_eod_data" in profile.name
+    stacks = [line.rsplit(" ", 1)[0] for line in profile.read_text().splitlines()]
+    assert any(stack.startswith("aget_eod_data;fetch;") for stack in stacks)
+    assert all(stack.startswith("aget_eod_data;") for stack in stacks)
+    assert not any("cache_load" in stack for stack in stacks)
+
+
+def test_base_tracer_records_nothing():
+    with Tracer().start_span("fetch") as span:
+        span.set_attribute("rows", 1)